@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""Benchmark the asset pipeline stages on synthetic images.
+
+Every stage runs in its own fresh interpreter and reports the median wall
+time over --repeat runs, the peak resident memory the timed runs add on top
+of the interpreter and the stage's inputs (plus that of any workers they
+start), and pixels processed per second. Inputs are generated
+here: black-background sprites at several sizes and subject-to-background
+ratios plus full-size backgrounds, so nothing depends on the committed art.
+Generation uses the offline stub with no artificial delay, so the run never
+touches the network.
+
+Results are written as JSON to bench_output.txt and compared with the
+local baseline (scripts/bench_baseline.json); the run fails if a stage got
+slower or hungrier than the baseline by more than --tolerance. Baselines are
+machine specific and not committed: the first run on a machine records one,
+and --update-baseline refreshes it.
+"""
+import argparse
+import contextlib
+import fnmatch
+import gc
+import io
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from PIL import Image
+
+# Measure the pipeline, not the stub's simulated request latency
+os.environ.setdefault("STUB_GENERATE_DELAY", "0")
+# Keep glibc from raising its mmap threshold as the inputs are freed, which would let a stage's
+# big arrays reuse heap pages setup already made resident and hide them from the peak RSS
+os.environ.setdefault("MALLOC_MMAP_THRESHOLD_", str(128 * 1024))
+
+ROOT_DIR = os.path.join(os.path.dirname(__file__), "..")
+OUTPUT_PATH = os.path.join(ROOT_DIR, "bench_output.txt")
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "bench_baseline.json")
+
+REPEAT = 5
+TOLERANCE = 0.25  # allowed slowdown / memory growth over the baseline, as a fraction
+RSS_NOISE_MB = 4.0  # memory growth below this is allocator noise, never a regression
+BATCH = 16  # sprites per batch stage (remove_backgrounds pass, atlas, generation)
+
+# name -> (width, height, fraction of the canvas covered by the subject)
+CASES = {
+    "sprite512_r10": (512, 512, 0.1),
+    "sprite512_r40": (512, 512, 0.4),
+    "sprite512_r80": (512, 512, 0.8),
+    "sprite1024_r40": (1024, 1024, 0.4),
+    "background2048x1536": (2048, 1536, 1.0),
+}
+
+
+# --- Synthetic inputs -------------------------------------------------------
+
+def synthetic_sprite(width: int, height: int, ratio: float, seed: int = 0) -> Image.Image:
+    """A generated-looking sprite: textured subject on a noisy near-black background.
+
+    The subject is an ellipse covering `ratio` of the canvas, with a dark
+    enclosed "eye" that the flood fill must leave alone. ratio >= 1 gives a
+    full-bleed background-style image with no black border at all.
+    """
+    rng = np.random.default_rng(seed)
+    arr = rng.integers(0, 30, (height, width, 3), dtype=np.uint8)  # compression noise in the black
+    # Open grids broadcast to full size only where combined, so inputs stay small next to the stage
+    yy, xx = np.ogrid[0:height, 0:width]
+
+    if ratio >= 1:
+        gradient = (yy * (120 / height) + xx * (60 / width)).astype(np.uint8)
+        arr = rng.integers(0, 90, (height, width, 3), dtype=np.uint8)
+        np.minimum(arr, 255 - gradient[..., None], out=arr)  # clip the sum to 255 without a wider array
+        arr += gradient[..., None]
+        return Image.fromarray(arr, "RGB")
+
+    # Ellipse with the canvas aspect ratio whose area is ratio * width * height
+    scale = np.sqrt(ratio / np.pi)
+    rx, ry = width * scale, height * scale
+    inside = ((xx - width / 2) / rx) ** 2 + ((yy - height / 2) / ry) ** 2 <= 1
+    base = rng.integers(60, 256, 3).astype(np.int16)
+    texture = rng.integers(-40, 40, (int(inside.sum()), 3), dtype=np.int16)
+    arr[inside] = np.clip(base + texture, 40, 255).astype(np.uint8)
+
+    eye = ((xx - width / 2) / (rx / 4)) ** 2 + ((yy - height / 2) / (ry / 4)) ** 2 <= 1
+    arr[eye] = 10
+    return Image.fromarray(arr, "RGB")
+
+
+def write_sprites(dirpath: str, count: int, width: int = 512, height: int = 512) -> list[str]:
+    """Write `count` synthetic sprites with varied subject ratios; returns their paths."""
+    os.makedirs(dirpath, exist_ok=True)
+    paths = []
+    for i in range(count):
+        path = os.path.join(dirpath, f"sprite_{i:02d}.png")
+        synthetic_sprite(width, height, 0.1 + 0.7 * i / max(1, count - 1), seed=i).save(path)
+        paths.append(path)
+    return paths
+
+
+# --- Stages -----------------------------------------------------------------
+# Each stage factory prepares its inputs in workdir and returns
+# (run, pixels, reset): run() is timed, reset() (if any) restores the inputs
+# untimed before every run, and pixels is how many pixels one run processes.
+
+Stage = tuple[Callable[[], object], int, Callable[[], None] | None]
+
+
+def flood_fill_stage(case: str, engine: str) -> Callable[[str], Stage]:
+    def setup(workdir: str) -> Stage:
+        from remove_backgrounds import flood_fill_transparency
+        width, height, ratio = CASES[case]
+        img = synthetic_sprite(width, height, ratio)
+        return (lambda: flood_fill_transparency(img, engine)), width * height, None
+    return setup
+
+
+def process_file_stage(workdir: str) -> Stage:
+    from remove_backgrounds import process_file
+    width, height, ratio = CASES["sprite512_r40"]
+    source = os.path.join(workdir, "source.png")
+    target = os.path.join(workdir, "sprite.png")
+    synthetic_sprite(width, height, ratio).save(source)
+    return (lambda: process_file(target)), width * height, lambda: shutil.copyfile(source, target)
+
+
+def remove_backgrounds_stage(jobs: int) -> Callable[[str], Stage]:
+    def setup(workdir: str) -> Stage:
+        from remove_backgrounds import process_files
+        sources = write_sprites(os.path.join(workdir, "source"), BATCH)
+        targets = [os.path.join(workdir, os.path.basename(p)) for p in sources]
+
+        def reset() -> None:
+            for src, dst in zip(sources, targets):
+                shutil.copyfile(src, dst)
+
+        def run() -> None:
+            with contextlib.redirect_stdout(io.StringIO()):
+                process_files(targets, "numpy", jobs)
+        return run, BATCH * 512 * 512, reset
+    return setup
+
+
+def generate_stage(workdir: str) -> Stage:
+    from generation_scheduler import load_generate_image, run_generation
+    generate = load_generate_image(stub=True)
+    out_dir = os.path.join(workdir, "generated")
+    assets = [{"prompt": {"subject": f"sprite {i}"}, "path": os.path.join(out_dir, f"sprite_{i:02d}.png"),
+               "w": 512, "h": 512, "seed": i} for i in range(BATCH)]
+
+    def run() -> None:
+        with contextlib.redirect_stdout(io.StringIO()):
+            run_generation(assets, generate, concurrency=4)
+    return run, BATCH * 512 * 512, lambda: shutil.rmtree(out_dir, ignore_errors=True)
+
+
+def processed_sprites(workdir: str) -> dict[str, str]:
+    """A batch of synthetic sprites with their backgrounds already removed."""
+    from remove_backgrounds import flood_fill_transparency
+    paths = write_sprites(os.path.join(workdir, "sprites"), BATCH)
+    for path in paths:
+        flood_fill_transparency(Image.open(path)).save(path)
+    return {os.path.basename(p)[:-4]: p for p in paths}
+
+
+def trim_stage(workdir: str) -> Stage:
+    from trim_sprites import trim
+    images = {name: Image.open(path).convert("RGBA") for name, path in processed_sprites(workdir).items()}
+    return (lambda: trim(images)), BATCH * 512 * 512, None
+
+
+def pack_atlas_stage(workdir: str) -> Stage:
+    from pack_atlas import build_atlas
+    sprites = processed_sprites(workdir)
+    return (lambda: build_atlas(sprites)), BATCH * 512 * 512, None
+
+
+def downscale_stage(workdir: str) -> Stage:
+    from downscale_sprites import downscale, target_size
+    images = [Image.open(p).convert("RGBA") for p in processed_sprites(workdir).values()]
+    return (lambda: [downscale(img, target_size(img.size, 0.1)) for img in images]), BATCH * 512 * 512, None
+
+
+def optimize_png_stage(workdir: str) -> Stage:
+    from optimize_pngs import optimize_file
+    source = next(iter(processed_sprites(workdir).values()))
+    target = os.path.join(workdir, "optimize.png")
+    return (lambda: optimize_file(target)), 512 * 512, lambda: shutil.copyfile(source, target)
+
+
+def all_stages(jobs: int, reference: bool) -> dict[str, Callable[[str], Stage]]:
+    stages = {"generate_stub": generate_stage}
+    for case in CASES:
+        stages[f"flood_fill/{case}"] = flood_fill_stage(case, "numpy")
+    stages["flood_fill_banded/background2048x1536"] = flood_fill_stage("background2048x1536", "banded")
+    if reference:
+        # The BFS takes seconds per sprite, so only the typical case
+        stages["flood_fill_reference/sprite512_r40"] = flood_fill_stage("sprite512_r40", "reference")
+    stages["process_file/sprite512_r40"] = process_file_stage
+    stages[f"remove_backgrounds/{BATCH}x512"] = remove_backgrounds_stage(jobs)
+    stages[f"trim/{BATCH}x512"] = trim_stage
+    stages[f"pack_atlas/{BATCH}x512"] = pack_atlas_stage
+    stages[f"downscale/{BATCH}x512"] = downscale_stage
+    stages["optimize_png/sprite512"] = optimize_png_stage
+    return stages
+
+
+# --- Harness ----------------------------------------------------------------
+
+def _kb_to_mb(kb: int) -> float:
+    return kb / (1024 * 1024) if sys.platform == "darwin" else kb / 1024  # ru_maxrss is bytes on macOS
+
+
+def rss_mb() -> float:
+    """Current RSS of this process in MB, or its peak where /proc isn't available."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except OSError:
+        return _kb_to_mb(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+
+def reset_peak_rss() -> None:
+    """Restart this process's peak RSS from its current RSS (Linux); elsewhere the peak so far stays."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def measure(name: str, jobs: int, reference: bool, repeat: int) -> dict:
+    """Run one stage `repeat` times; executed in a fresh process so peak RSS is per stage.
+
+    The stage's memory is how far the timed runs push this process's RSS
+    above where it stood once the inputs were built, plus the peak of any
+    worker processes the runs waited for.
+    """
+    setup = all_stages(jobs, reference)[name]
+    with tempfile.TemporaryDirectory() as workdir:
+        run, pixels, reset = setup(workdir)
+        gc.collect()
+        base_rss = rss_mb()
+        reset_peak_rss()
+        times = []
+        for _ in range(repeat):
+            if reset:
+                reset()
+            start = time.perf_counter()
+            run()
+            times.append(time.perf_counter() - start)
+        peak = _kb_to_mb(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+        workers = _kb_to_mb(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    seconds = statistics.median(times)
+    return {
+        "seconds": round(seconds, 4),
+        "min_seconds": round(min(times), 4),
+        "base_rss_mb": round(base_rss, 1),
+        "peak_rss_mb": round(max(0.0, peak - base_rss) + workers, 1),
+        "pixels": pixels,
+        "pixels_per_sec": round(pixels / seconds),
+        "repeat": repeat,
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Print each stage against the baseline; returns descriptions of the regressions."""
+    regressions = []
+    print(f"\nAgainst baseline (tolerance {tolerance:.0%}):")
+    for name, current in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"  {name}: new stage, no baseline")
+            continue
+        time_ratio = current["seconds"] / base["seconds"]
+        rss_growth = current["peak_rss_mb"] - base["peak_rss_mb"]
+        flags = []
+        if time_ratio > 1 + tolerance:
+            flags.append("SLOWER")
+            regressions.append(f"{name} took {time_ratio:.2f}x the baseline time")
+        if rss_growth > max(RSS_NOISE_MB, tolerance * base["peak_rss_mb"]):
+            flags.append("MORE MEMORY")
+            regressions.append(f"{name} used {rss_growth:.1f} MB more than the baseline peak RSS")
+        print(f"  {name}: time {time_ratio:.2f}x, peak RSS {rss_growth:+.1f} MB {' '.join(flags)}".rstrip())
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stage", action="append",
+                        help="only run stages matching this glob (repeatable), e.g. 'flood_fill/*'")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help=f"timed runs per stage (default: {REPEAT})")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="worker processes for the remove_backgrounds pass (default: 1)")
+    parser.add_argument("--reference", action="store_true", help="also time the pure-Python reference flood fill")
+    parser.add_argument("--output", default=OUTPUT_PATH, help="where to write the JSON results (default: bench_output.txt)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE,
+                        help=f"allowed regression as a fraction of the baseline (default: {TOLERANCE})")
+    parser.add_argument("--update-baseline", action="store_true", help="store these results as the new baseline (the first run on a machine always does)")
+    args = parser.parse_args()
+
+    names = [n for n in all_stages(args.jobs, args.reference)
+             if not args.stage or any(fnmatch.fnmatch(n, p) for p in args.stage)]
+    if not names:
+        parser.error("no stage matches --stage")
+
+    print(f"Benchmarking {len(names)} stage(s), {args.repeat} run(s) each...")
+    results = {}
+    # spawn, not fork: each stage starts from a clean interpreter so its peak RSS is its own
+    context = multiprocessing.get_context("spawn")
+    for i, name in enumerate(names, 1):
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            result = pool.submit(measure, name, args.jobs, args.reference, args.repeat).result()
+        results[name] = result
+        print(f"  [{i}/{len(names)}] {name}: {result['seconds'] * 1000:.1f} ms, "
+              f"{result['peak_rss_mb']:.0f} MB peak over inputs, {result['pixels_per_sec'] / 1e6:.1f} Mpx/s")
+
+    report = {
+        "machine": {"python": platform.python_version(), "platform": platform.platform(), "cpus": os.cpu_count()},
+        "stages": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
+    print(f"\nWrote {os.path.relpath(args.output)}.")
+
+    if args.update_baseline or not os.path.exists(args.baseline):
+        baseline = {}
+        if os.path.exists(args.baseline) and args.stage:
+            # Partial run: keep the baseline entries of the stages that didn't run
+            with open(args.baseline) as f:
+                baseline = json.load(f)["stages"]
+        report["stages"] = {**baseline, **results}
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+        verb = "Updated" if args.update_baseline else "No baseline yet; recorded"
+        print(f"{verb} baseline {os.path.relpath(args.baseline)}. Later runs compare against it.")
+        sys.exit(0)
+
+    with open(args.baseline) as f:
+        regressions = compare(results, json.load(f)["stages"], args.tolerance)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s):", file=sys.stderr)
+        for regression in regressions:
+            print(f"  {regression}", file=sys.stderr)
+        sys.exit(1)
+    print("\nDone! No stage regressed.")
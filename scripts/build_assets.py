@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""Regenerate only the assets whose spec or reference images changed, like make.
+
+asset_specs.ASSETS is turned into a dependency graph in which an asset depends
+on every other asset named in its input_images. Each asset built is recorded
+in public/assets/.build_assets.json with a hash of its spec and the
+post-processing stages it went through, plus a hash of the pixels of every
+reference image it was drawn from. An asset is rebuilt when:
+
+- its output file is missing or it has no record yet,
+- its spec changed (prompt, size, seed, references or stages),
+- one of its reference images was edited since it was built, or
+- an asset it depends on is rebuilt in the same run,
+
+so editing the chameleon's prompt regenerates animal_chameleon.png and the
+frames drawn from it, and nothing else. Reference images are compared by
+pixels, so a lossless recompression by optimize_pngs.py doesn't count as a
+change. Everything goes through the generation cache and the post-processing
+pipeline like the other generation scripts.
+
+TARGETS (file names or globs, e.g. 'helper_*') limit the run to those assets
+and the assets they depend on, plus the assets drawn from any of them that
+get rebuilt, so no frame is left stale behind its base sprite. --dry-run prints what would be rebuilt and
+why, --force rebuilds the targets even if they are up to date, and --touch
+records the files on disk as up to date without generating anything.
+"""
+import argparse
+import fnmatch
+import hashlib
+import json
+import os
+import sys
+
+from PIL import Image
+
+from asset_specs import ASSETS
+from generation_cache import add_cache_arguments, cache_from_args
+from generation_scheduler import build_dependencies, check_acyclic, load_generate_image, print_summary, run_generation
+from pipeline import STAGES, add_pipeline_arguments, pipeline_from_args
+from tracing import add_tracing_arguments, finish_tracing, tracing_from_args
+
+ASSETS_DIR = os.path.join(os.path.dirname(__file__), "..", "public", "assets")
+STATE_PATH = os.path.join(ASSETS_DIR, ".build_assets.json")
+
+# Bump to rebuild everything, e.g. when the generator model changes
+STATE_VERSION = 1
+
+
+def image_digest(path: str) -> str | None:
+    """Hash of an image's size and RGBA pixels, or None if it doesn't exist."""
+    try:
+        with Image.open(path) as img:
+            rgba = img.convert("RGBA")
+    except FileNotFoundError:
+        return None
+    h = hashlib.sha256(f"{rgba.width}x{rgba.height}".encode())
+    h.update(rgba.tobytes())
+    return h.hexdigest()
+
+
+def spec_digest(spec: dict, stages: list[str]) -> str:
+    payload = json.dumps({
+        "prompt": spec["prompt"],
+        "w": spec["w"],
+        "h": spec["h"],
+        "seed": spec.get("seed"),
+        "input_images": [os.path.normpath(p) for p in spec.get("input_images") or []],
+        "stages": stages,
+    }, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def load_state() -> dict:
+    try:
+        with open(STATE_PATH) as f:
+            state = json.load(f)
+    except FileNotFoundError:
+        return {"version": STATE_VERSION, "assets": {}}
+    if state.get("version") != STATE_VERSION:
+        return {"version": STATE_VERSION, "assets": {}}
+    return state
+
+
+def save_state(state: dict) -> None:
+    with open(STATE_PATH, "w") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+class AssetGraph:
+    def __init__(self, assets: list[dict]):
+        self.specs = {os.path.normpath(a["path"]): a for a in assets}
+        self.deps = build_dependencies(assets)
+        check_acyclic(self.deps)
+
+    def topological(self) -> list[str]:
+        """Every asset after the assets it depends on, otherwise in spec order."""
+        order: list[str] = []
+        seen: set[str] = set()
+
+        def visit(path: str) -> None:
+            if path in seen:
+                return
+            seen.add(path)
+            for dep in sorted(self.deps[path]):
+                visit(dep)
+            order.append(path)
+
+        for path in self.specs:
+            visit(path)
+        return order
+
+    def upstream(self, paths: set[str]) -> set[str]:
+        """paths plus every asset they depend on, directly or not."""
+        closure = set()
+        stack = list(paths)
+        while stack:
+            path = stack.pop()
+            if path not in closure:
+                closure.add(path)
+                stack.extend(self.deps[path])
+        return closure
+
+    def match(self, patterns: list[str]) -> set[str]:
+        """Assets whose path or file name matches any of the patterns."""
+        matched = set()
+        for pattern in patterns:
+            pattern = os.path.normpath(pattern)
+            hits = {p for p in self.specs
+                    if fnmatch.fnmatch(p, pattern) or fnmatch.fnmatch(os.path.basename(p), pattern)}
+            if not hits:
+                raise KeyError(f"No asset matches {pattern}")
+            matched |= hits
+        return matched
+
+    def stages_for(self, path: str, stages: list[str]) -> list[str]:
+        return [s for s in stages if STAGES[s][1](path)]
+
+    def record(self, path: str, stages: list[str]) -> dict:
+        """The state entry for path as it is on disk now."""
+        spec = self.specs[path]
+        return {
+            "spec": spec_digest(spec, self.stages_for(path, stages)),
+            "inputs": {os.path.normpath(p): image_digest(p) for p in spec.get("input_images") or []},
+        }
+
+    def plan(self, state: dict, stages: list[str], targets: set[str], force: bool = False) -> dict[str, str]:
+        """Map each asset that needs rebuilding to the reason, in build order.
+
+        Looks at the targets, the assets they depend on, and any asset that
+        depends on one being rebuilt.
+        """
+        selected = self.upstream(targets)
+        reasons: dict[str, str] = {}
+        for path in self.topological():
+            rebuilt_deps = sorted(d for d in self.deps[path] if d in reasons)
+            if path not in selected and not rebuilt_deps:
+                continue
+            entry = state["assets"].get(path)
+            if force and path in targets:
+                reasons[path] = "forced"
+            elif not os.path.exists(path):
+                reasons[path] = "output missing"
+            elif entry is None:
+                reasons[path] = "never built"
+            elif rebuilt_deps:
+                reasons[path] = f"{os.path.basename(rebuilt_deps[0])} is being rebuilt"
+            else:
+                current = self.record(path, stages)
+                if current["spec"] != entry["spec"]:
+                    reasons[path] = "spec changed"
+                else:
+                    changed = [p for p, digest in current["inputs"].items() if entry["inputs"].get(p) != digest]
+                    if changed:
+                        reasons[path] = f"{os.path.basename(changed[0])} changed"
+        return reasons
+
+
+def main(description: str = __doc__, targets: list[str] | None = None, force: bool = False) -> None:
+    """Command-line entry point, shared with the scripts that regenerate a fixed set of assets.
+
+    targets and force are the defaults for the TARGETS argument and --force.
+    """
+    parser = argparse.ArgumentParser(description=description, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("targets", nargs="*", metavar="TARGET", default=targets or [],
+                        help="asset file names, paths or globs to bring up to date (default: all)")
+    parser.add_argument("-n", "--dry-run", action="store_true",
+                        help="print what would be rebuilt and why, without generating")
+    parser.add_argument("-B", "--force", action="store_true", default=force,
+                        help="rebuild the targets even if they are up to date")
+    parser.add_argument("--touch", action="store_true",
+                        help="record the targets' current files as up to date instead of generating")
+    parser.add_argument("-c", "--concurrency", type=int, default=4,
+                        help="maximum generation requests in flight (default: 4)")
+    parser.add_argument("--retries", type=int, default=3,
+                        help="retries per asset for failed requests (default: 3)")
+    parser.add_argument("--backoff", type=float, default=2.0,
+                        help="initial retry delay in seconds, doubled per attempt (default: 2.0)")
+    parser.add_argument("--stub", action="store_true",
+                        help="use the offline placeholder generator instead of the real API")
+    add_cache_arguments(parser)
+    add_pipeline_arguments(parser)
+    add_tracing_arguments(parser)
+    args = parser.parse_args()
+
+    graph = AssetGraph(ASSETS)
+    try:
+        wanted = graph.match(args.targets) if args.targets else set(graph.specs)
+    except KeyError as e:
+        parser.error(e.args[0])
+    state = load_state()
+    # Forget assets that were removed from the spec
+    state["assets"] = {p: entry for p, entry in state["assets"].items() if p in graph.specs}
+
+    if args.touch:
+        for path in graph.topological():
+            if path in wanted and os.path.exists(path):
+                state["assets"][path] = graph.record(path, args.stages)
+        save_state(state)
+        print(f"Recorded {sum(p in state['assets'] for p in wanted)} of {len(wanted)} assets as up to date.")
+        return
+
+    reasons = graph.plan(state, args.stages, wanted, args.force)
+    if not reasons:
+        print(f"All {len(graph.upstream(wanted))} assets are up to date.")
+        return
+    print(f"{len(reasons)} asset(s) to rebuild:")
+    width = max(len(os.path.basename(p)) for p in reasons)
+    for path, reason in reasons.items():
+        print(f"  {os.path.basename(path):<{width}}  {reason}")
+    if args.dry_run:
+        return
+    print()
+
+    tracing_from_args(args)
+    generate_image = load_generate_image(stub=args.stub)
+    cache = cache_from_args(args)
+    if cache:
+        generate_image = cache.wrap(generate_image)
+    pipeline = pipeline_from_args(args)
+    generate_image = pipeline.wrap(generate_image)
+
+    results = run_generation(
+        [graph.specs[p] for p in reasons],
+        generate_image,
+        concurrency=args.concurrency,
+        retries=args.retries,
+        backoff=args.backoff,
+    )
+    for path, error in results.items():
+        if error is None:
+            state["assets"][path] = graph.record(path, args.stages)
+    save_state(state)
+    pipeline.save_manifest()
+    print_summary(results)
+    if cache:
+        print(cache.stats_line())
+    finish_tracing(args)
+    if not pipeline.removes_backgrounds():
+        print("\nNow run scripts/remove_backgrounds.py to fix transparency.")
+    if any(error is not None for error in results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Build resolution variants of the terrarium backgrounds and their manifest.
+
+For every public/assets/backgrounds/terrarium_<style>.png this writes a
+game-resolution image, a HiDPI image and an Options-panel thumbnail to
+build/assets/backgrounds/variants/, and lists them in variants.json there.
+fingerprint_assets.py turns that list into the URLs the game uses, so it can
+load just the selected style up front and fetch the others on demand.
+"""
+import json
+import os
+
+from PIL import Image
+
+from downscale_sprites import DENSITY, downscale
+
+ROOT_DIR = os.path.join(os.path.dirname(__file__), "..")
+BG_DIR = os.path.join(ROOT_DIR, "public", "assets", "backgrounds")
+VARIANT_DIR = os.path.join(ROOT_DIR, "build", "assets", "backgrounds", "variants")
+VARIANTS_JSON = os.path.join(VARIANT_DIR, "variants.json")
+
+GAME_SIZE = (1024, 768)  # GAME_WIDTH x GAME_HEIGHT in GameConfig.ts
+THUMB_SIZE = (192, 144)  # thumbW x thumbH in OptionsPanel.ts
+
+PREFIX = "terrarium_"
+
+
+VARIANTS = ("full", "hidpi", "thumb")
+
+
+def rel_path(path: str) -> str:
+    """Path relative to the repo root, as variants.json records it."""
+    return os.path.relpath(path, ROOT_DIR).replace(os.sep, "/")
+
+
+def scaled(size: tuple[int, int], density: float) -> tuple[int, int]:
+    return round(size[0] * density), round(size[1] * density)
+
+
+def build_variants(src: str) -> dict[str, str]:
+    """Write the variants for one background; returns variant name -> path."""
+    name = os.path.basename(src)[:-4]
+    img = Image.open(src).convert("RGB")
+    targets = {
+        "full": (GAME_SIZE, f"{name}.png"),
+        "hidpi": (scaled(GAME_SIZE, DENSITY), f"{name}@{DENSITY:g}x.png"),
+        "thumb": (THUMB_SIZE, f"{name}_thumb.png"),
+    }
+
+    paths = {}
+    for variant, (size, fname) in targets.items():
+        if size == img.size:
+            # Already the right size: point at the source instead of shipping a copy
+            paths[variant] = src
+            continue
+        if size[0] > img.width or size[1] > img.height:
+            print(f"    {variant}: source is smaller than {size[0]}x{size[1]}, using it as is")
+            paths[variant] = src
+            continue
+        dst = os.path.join(VARIANT_DIR, fname)
+        os.makedirs(VARIANT_DIR, exist_ok=True)
+        downscale(img, size).save(dst, optimize=True)
+        paths[variant] = dst
+    return paths
+
+
+def write_variants(variants: dict[str, dict[str, str]]) -> None:
+    """Record style -> variant -> path for fingerprint_assets.py."""
+    listing = {style: {v: rel_path(paths[v]) for v in VARIANTS} for style, paths in variants.items()}
+    with open(VARIANTS_JSON, "w") as f:
+        json.dump(listing, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+if __name__ == "__main__":
+    sources = sorted(
+        os.path.join(BG_DIR, f) for f in os.listdir(BG_DIR)
+        if f.startswith(PREFIX) and f.endswith(".png")
+    )
+    os.makedirs(VARIANT_DIR, exist_ok=True)
+
+    print(f"Building variants for {len(sources)} backgrounds...")
+    variants = {}
+    total_before = 0
+    total_thumbs = 0
+    for i, src in enumerate(sources, 1):
+        style = os.path.basename(src)[len(PREFIX):-4]
+        print(f"  [{i}/{len(sources)}] {style}")
+        paths = build_variants(src)
+        for variant, path in paths.items():
+            print(f"    {variant}: {rel_path(path)} ({os.path.getsize(path) / 1024:.0f} KB)")
+        variants[style] = paths
+        total_before += os.path.getsize(src)
+        total_thumbs += os.path.getsize(paths["thumb"])
+
+    write_variants(variants)
+
+    # At startup the game now loads one full background plus every thumbnail
+    mb = 1024 * 1024
+    startup = {
+        variant: total_thumbs + max(os.path.getsize(p[variant]) for p in variants.values())
+        for variant in ("full", "hidpi")
+    }
+    print(f"\nStartup background bytes: {total_before / mb:.2f} MB -> at most "
+          f"{startup['full'] / mb:.2f} MB ({startup['hidpi'] / mb:.2f} MB on HiDPI screens)")
+    print(f"Done! Wrote {os.path.relpath(VARIANTS_JSON, ROOT_DIR)}; "
+          f"run scripts/encode_webp.py and scripts/fingerprint_assets.py to publish the variants to the game.")
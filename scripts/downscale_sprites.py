@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""Downscale sprites to the size they are drawn at in-game.
+
+Sprites are generated on 512px canvases but displayed at a few dozen pixels.
+DISPLAY_SCALES records the largest setScale() each asset is drawn at, so the
+target size is source size x display scale x --density (2 for HiDPI screens).
+Frames of one animation (a base sprite and its _walk or _flip frame) share
+the largest scale in their group, so the cycle never changes pixel size.
+
+pack_atlas.py downscales in memory with these functions and records the
+factor each frame was shrunk by, which FrameScale.ts divides the game's
+canvas-relative scales by. Run this script on its own to write the variants
+and scales.json to build/assets/scaled/ for inspection.
+"""
+import argparse
+import fnmatch
+import json
+import math
+import os
+
+from PIL import Image
+
+from trim_sprites import ANIMATION_SUFFIXES, animation_group
+
+ASSETS_DIR = os.path.join(os.path.dirname(__file__), "..", "public", "assets")
+SOURCE_DIRS = ["sprites", "ui"]
+OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "..", "build", "assets", "scaled")
+
+DENSITY = 2.0  # pixels per displayed pixel; 2x keeps sprites sharp on HiDPI screens
+
+# Largest in-game scale per asset (first matching pattern wins)
+DISPLAY_SCALES = [
+    ("animal_dragon*", 0.15),       # AnimalData spriteScale
+    ("animal_chameleon*", 0.12),
+    ("animal_salamander*", 0.12),
+    ("animal_*", 0.1),
+    ("baby_dragon*", 0.09),         # AnimalData babySpriteScale
+    ("baby_chameleon*", 0.07),
+    ("baby_salamander*", 0.07),
+    ("baby_*", 0.06),
+    ("coin*", 0.08),                # Coin collect tween peaks at 0.08
+    ("food_*", 0.07),               # ShopItem icon (in-game Food is 0.04)
+    ("egg_piece*", 0.07),           # ShopItem icon and HUD pulse tween
+    ("helper_*", 0.2),              # ShopScene pet choice (HelperPet is 0.08)
+    ("poacher_hand", 0.15),         # Poacher
+    ("thought_bubble", 0.072),      # ThoughtBubble 0.06 x 1.2 pulse
+    ("shop_button", 0.13),          # ShopItem background
+]
+
+FILTERS = {
+    # Area averaging: every source pixel contributes equally, so hard pixel-art
+    # edges stay crisp without the halos Lanczos rings around them
+    "box": Image.Resampling.BOX,
+    "lanczos": Image.Resampling.LANCZOS,
+    "nearest": Image.Resampling.NEAREST,
+}
+
+
+def pattern_scale(name: str) -> float | None:
+    for pattern, scale in DISPLAY_SCALES:
+        if fnmatch.fnmatch(name, pattern):
+            return scale
+    return None
+
+
+def display_scale(name: str) -> float | None:
+    """Largest scale of any frame in name's animation group, or None if none has one."""
+    group = animation_group(name)
+    scales = [pattern_scale(frame) for frame in (group, *(group + suffix for suffix in ANIMATION_SUFFIXES))]
+    return max((s for s in scales if s is not None), default=None)
+
+
+def target_size(size: tuple[int, int], scale: float, density: float = DENSITY) -> tuple[int, int]:
+    """Scaled size, never larger than the source and never below 1px."""
+    w, h = size
+    factor = min(1.0, scale * density)
+    return max(1, math.ceil(w * factor)), max(1, math.ceil(h * factor))
+
+
+def downscale(img: Image.Image, size: tuple[int, int], resample: Image.Resampling = Image.Resampling.BOX) -> Image.Image:
+    # Pillow resizes RGBA in premultiplied space, so transparent edges don't darken
+    if img.size == size:
+        return img.copy()
+    return img.resize(size, resample)
+
+
+def to_display_size(
+    name: str,
+    img: Image.Image,
+    density: float = DENSITY,
+    resample: Image.Resampling = Image.Resampling.BOX,
+) -> tuple[Image.Image, float]:
+    """img shrunk to its display size and the factor it shrank by; sprites without a display scale stay as is."""
+    scale = display_scale(name)
+    if scale is None:
+        return img, 1.0
+    size = target_size(img.size, scale, density)
+    return downscale(img, size, resample), size[0] / img.width
+
+
+def load_display_sprites(
+    sprites: dict[str, str],
+    density: float = DENSITY,
+) -> tuple[dict[str, Image.Image], dict[str, float]]:
+    """Decode sprites (name -> path) as RGBA at display size; returns (images, shrink factor per name)."""
+    images, factors = {}, {}
+    for name, path in sprites.items():
+        images[name], factors[name] = to_display_size(name, Image.open(path).convert("RGBA"), density)
+    return images, factors
+
+
+def collect_sprites() -> list[str]:
+    files = []
+    for subdir in SOURCE_DIRS:
+        dirpath = os.path.join(ASSETS_DIR, subdir)
+        if not os.path.isdir(dirpath):
+            continue
+        for fname in sorted(os.listdir(dirpath)):
+            if fname.endswith(".png"):
+                files.append(os.path.join(subdir, fname))
+    return files
+
+
+def texture_bytes(size: tuple[int, int]) -> int:
+    """GPU memory for an uncompressed RGBA8 texture."""
+    return size[0] * size[1] * 4
+
+
+def format_mb(n: int) -> str:
+    return f"{n / (1024 * 1024):.2f} MB"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--density", type=float, default=DENSITY,
+                        help=f"output pixels per displayed pixel (default: {DENSITY})")
+    parser.add_argument("--filter", choices=FILTERS, default="box",
+                        help="resampling filter (default: box)")
+    args = parser.parse_args()
+
+    files = collect_sprites()
+    print(f"Downscaling {len(files)} sprites at {args.density}x display size ({args.filter} filter)...")
+
+    scales = {}
+    totals = {"file_before": 0, "file_after": 0, "tex_before": 0, "tex_after": 0}
+    for i, relpath in enumerate(files, 1):
+        name = os.path.basename(relpath)[:-4]
+        src = os.path.join(ASSETS_DIR, relpath)
+        dst = os.path.join(OUTPUT_DIR, relpath)
+
+        img = Image.open(src)
+        scale = display_scale(name)
+        if scale is None:
+            print(f"  [{i}/{len(files)}] {name}: no display scale, copied at full size")
+            size = img.size
+        else:
+            size = target_size(img.size, scale, args.density)
+            print(f"  [{i}/{len(files)}] {name}: {img.width}x{img.height} -> {size[0]}x{size[1]}")
+
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        downscale(img, size, FILTERS[args.filter]).save(dst)
+        scales[relpath.replace(os.sep, "/")] = {
+            "source": list(img.size),
+            "size": list(size),
+            "factor": round(size[0] / img.width, 6),
+        }
+
+        totals["file_before"] += os.path.getsize(src)
+        totals["file_after"] += os.path.getsize(dst)
+        totals["tex_before"] += texture_bytes(img.size)
+        totals["tex_after"] += texture_bytes(size)
+
+    with open(os.path.join(OUTPUT_DIR, "scales.json"), "w") as f:
+        json.dump({"density": args.density, "filter": args.filter, "assets": scales}, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+    print("\nDownscale report:")
+    print(f"  File size:      {format_mb(totals['file_before'])} -> {format_mb(totals['file_after'])}")
+    print(f"  Texture memory: {format_mb(totals['tex_before'])} -> {format_mb(totals['tex_after'])} "
+          f"({totals['tex_before'] / max(1, totals['tex_after']):.0f}x less)")
+    print(f"\nDone! Wrote variants to {os.path.relpath(OUTPUT_DIR)}.")
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""Write a WebP next to every PNG the game loads, and report bytes per format.
+
+Run after pack_atlas.py and build_backgrounds.py (and optimize_pngs.py, so
+the PNG sizes compared against are final). For each atlas page and
+background variant this tries high-quality lossy WebP (--quality) and
+lossless WebP. The lossy one is only accepted if it holds up against the
+PNG where lossy codecs go wrong with sprites, along the alpha edges:
+
+- alpha on the edge band (pixels whose alpha differs from a neighbour's)
+  may change by at most MAX_EDGE_ALPHA_ERROR,
+- colour there, composited over mid-grey, may be off by at most
+  MAX_EDGE_DELTA_E on average (CIE76, see optimize_pngs.delta_e), and
+- the image as a whole by at most MAX_MEAN_DELTA_E.
+
+Lossless WebP must decode to the PNG's visible pixels exactly. The smaller
+accepted encoding is written as <name>.webp beside the PNG, or for a source
+image under public/ at the same place under build/, so only the copies
+fingerprint_assets.py publishes end up in public/.
+
+build/assets/webp.json records, per PNG, its WebP, the encoding used, both
+sizes, the errors measured and the PNG's hash. fingerprint_assets.py
+publishes each WebP whose PNG is unchanged alongside it, and the game picks
+the smaller of the two formats it can decode.
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+import sys
+import time
+
+import numpy as np
+from PIL import Image
+
+from build_backgrounds import VARIANTS, VARIANTS_JSON
+from optimize_pngs import delta_e, display_path
+from pack_atlas import ATLAS_DIR, ATLAS_NAME
+
+ROOT_DIR = os.path.join(os.path.dirname(__file__), "..")
+PUBLIC_DIR = os.path.join(ROOT_DIR, "public")
+BUILD_DIR = os.path.join(ROOT_DIR, "build")
+WEBP_JSON = os.path.join(BUILD_DIR, "assets", "webp.json")
+
+QUALITY = 90
+MAX_EDGE_ALPHA_ERROR = 2
+MAX_EDGE_DELTA_E = 3.0  # mean colour error a player won't notice on an outline
+MAX_MEAN_DELTA_E = 3.0
+DELTA_E_ROWS = 256  # rows compared at a time, so 2x backgrounds don't need ~1 GB of Lab arrays
+
+
+def rel_path(path: str) -> str:
+    return os.path.relpath(path, ROOT_DIR).replace(os.sep, "/")
+
+
+def webp_path_for(png_path: str) -> str:
+    """Where png_path's WebP goes: beside it, or mirrored into build/ if it's under public/."""
+    stem = os.path.splitext(os.path.normpath(png_path))[0]
+    in_public = os.path.relpath(stem, PUBLIC_DIR)
+    if not in_public.startswith(".."):
+        stem = os.path.join(BUILD_DIR, in_public)
+    return stem + ".webp"
+
+
+def runtime_pngs() -> list[str]:
+    """The PNGs fingerprint_assets.py publishes: atlas pages and background variants."""
+    with open(os.path.join(ATLAS_DIR, f"{ATLAS_NAME}.json")) as f:
+        atlas = json.load(f)
+    paths = [os.path.join(ATLAS_DIR, texture["image"]) for texture in atlas["textures"]]
+    with open(VARIANTS_JSON) as f:
+        listing = json.load(f)
+    for style in sorted(listing):
+        for variant in VARIANTS:
+            path = os.path.join(ROOT_DIR, listing[style][variant])
+            if path not in paths:
+                paths.append(path)
+    return [os.path.normpath(p) for p in paths]
+
+
+def edge_band(alpha: np.ndarray) -> np.ndarray:
+    """Pixels whose alpha differs from one of their 4 neighbours'."""
+    a = alpha.astype(np.int16)
+    band = np.zeros(alpha.shape, dtype=bool)
+    vertical = a[1:] != a[:-1]
+    horizontal = a[:, 1:] != a[:, :-1]
+    band[1:] |= vertical
+    band[:-1] |= vertical
+    band[:, 1:] |= horizontal
+    band[:, :-1] |= horizontal
+    return band
+
+
+def mean_delta_e(original: np.ndarray, candidate: np.ndarray, rows: int = DELTA_E_ROWS) -> float:
+    """delta_e's mean over the whole image, a band of rows at a time."""
+    total, count = 0.0, 0
+    for y in range(0, original.shape[0], rows):
+        a, b = original[y:y + rows], candidate[y:y + rows]
+        n = int(((a[..., 3] > 0) | (b[..., 3] > 0)).sum())
+        if n:
+            total += delta_e(a, b)[0] * n
+            count += n
+    return total / count if count else 0.0
+
+
+def fidelity(original: np.ndarray, candidate: np.ndarray) -> dict:
+    """Alpha and colour error of candidate on original's edge band, plus its overall colour error."""
+    band = edge_band(original[..., 3])
+    edge_alpha = np.abs(original[..., 3].astype(np.int16) - candidate[..., 3])[band]
+    edge_mean, _ = delta_e(original[band], candidate[band]) if band.any() else (0.0, 0.0)
+    mean = mean_delta_e(original, candidate)
+    return {
+        "edge_alpha_error": int(edge_alpha.max()) if band.any() else 0,
+        "edge_delta_e": round(edge_mean, 2),
+        "delta_e": round(mean, 2),
+    }
+
+
+def acceptable(errors: dict) -> bool:
+    return (errors["edge_alpha_error"] <= MAX_EDGE_ALPHA_ERROR
+            and errors["edge_delta_e"] <= MAX_EDGE_DELTA_E
+            and errors["delta_e"] <= MAX_MEAN_DELTA_E)
+
+
+def decode(data: bytes) -> np.ndarray:
+    return np.array(Image.open(io.BytesIO(data)).convert("RGBA"))
+
+
+def encode_file(filepath: str, quality: int = QUALITY) -> dict:
+    """Write filepath's WebP beside it; returns its webp.json entry (raises on unreadable files)."""
+    start = time.perf_counter()
+    with open(filepath, "rb") as f:
+        png = f.read()
+    img = Image.open(io.BytesIO(png))
+    img.load()
+    has_alpha = img.mode in ("RGBA", "LA") or "transparency" in img.info
+    img = img.convert("RGBA" if has_alpha else "RGB")
+    rgba = np.array(img.convert("RGBA"))
+
+    buf = io.BytesIO()
+    img.save(buf, format="WEBP", lossless=True)
+    data, encoding = buf.getvalue(), "lossless"
+    decoded = decode(data)
+    visible = rgba[..., 3] > 0
+    if not (np.array_equal(decoded[..., 3], rgba[..., 3]) and np.array_equal(decoded[visible], rgba[visible])):
+        raise ValueError(f"lossless WebP of {filepath} changed visible pixels")
+    errors = {"edge_alpha_error": 0, "edge_delta_e": 0.0, "delta_e": 0.0}
+    note = ""
+
+    buf = io.BytesIO()
+    img.save(buf, format="WEBP", quality=quality)
+    lossy_errors = fidelity(rgba, decode(buf.getvalue()))
+    if not acceptable(lossy_errors):
+        note = (f"lossy rejected (edge alpha {lossy_errors['edge_alpha_error']}, "
+                f"edge dE {lossy_errors['edge_delta_e']:.2f}, dE {lossy_errors['delta_e']:.2f})")
+    elif len(buf.getvalue()) < len(data):
+        data, encoding, errors = buf.getvalue(), f"lossy q{quality}", lossy_errors
+
+    webp_path = webp_path_for(filepath)
+    os.makedirs(os.path.dirname(webp_path), exist_ok=True)
+    with open(webp_path, "wb") as f:
+        f.write(data)
+    return {
+        "webp": rel_path(webp_path),
+        "encoding": encoding,
+        "png_bytes": len(png),
+        "webp_bytes": len(data),
+        "png_sha256": hashlib.sha256(png).hexdigest(),
+        **errors,
+        "seconds": round(time.perf_counter() - start, 3),
+        "note": note,
+    }
+
+
+def load_webp_manifest() -> dict[str, dict]:
+    try:
+        with open(WEBP_JSON) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def current_webp(png_path: str, manifest: dict[str, dict]) -> str | None:
+    """Path of png_path's WebP, or None if there is none or the PNG changed since it was encoded."""
+    entry = manifest.get(rel_path(png_path))
+    if entry is None:
+        return None
+    with open(png_path, "rb") as f:
+        if hashlib.sha256(f.read()).hexdigest() != entry["png_sha256"]:
+            return None
+    path = os.path.join(ROOT_DIR, entry["webp"])
+    return path if os.path.exists(path) else None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="*", help="PNG files to encode (default: every PNG the game loads)")
+    parser.add_argument("--quality", type=int, default=QUALITY,
+                        help=f"lossy WebP quality, 0-100 (default: {QUALITY})")
+    args = parser.parse_args()
+
+    files = [os.path.normpath(p) for p in args.paths] or runtime_pngs()
+    manifest = load_webp_manifest()
+    print(f"Encoding {len(files)} PNGs as WebP...")
+    failed = 0
+    for i, path in enumerate(files, 1):
+        try:
+            entry = encode_file(path, args.quality)
+        except Exception as e:
+            failed += 1
+            print(f"  [{i}/{len(files)}] {display_path(path)} -> FAILED: {type(e).__name__}: {e}", file=sys.stderr)
+            continue
+        manifest[rel_path(path)] = {k: v for k, v in entry.items() if k != "seconds"}
+        print(f"  [{i}/{len(files)}] {display_path(path)}: {entry['png_bytes'] / 1024:.0f} KB PNG -> "
+              f"{entry['webp_bytes'] / 1024:.0f} KB {entry['encoding']} WebP in {entry['seconds']:.2f}s "
+              f"{entry['note']}".rstrip())
+
+    # Forget WebPs of PNGs the game no longer loads
+    shipped = {rel_path(p) for p in runtime_pngs()} | {rel_path(p) for p in files}
+    manifest = {png: entry for png, entry in manifest.items() if png in shipped}
+    with open(WEBP_JSON, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+    # Bytes a browser downloads for all of these: PNG only, WebP only, or the smaller of each
+    png_total = sum(e["png_bytes"] for e in manifest.values())
+    webp_total = sum(e["webp_bytes"] for e in manifest.values())
+    best_total = sum(min(e["png_bytes"], e["webp_bytes"]) for e in manifest.values())
+    mb = 1024 * 1024
+    print(f"\nBytes shipped for {len(manifest)} images:")
+    print(f"  PNG:              {png_total / mb:6.2f} MB")
+    print(f"  WebP:             {webp_total / mb:6.2f} MB ({1 - webp_total / max(1, png_total):.1%} smaller)")
+    print(f"  Smaller of each:  {best_total / mb:6.2f} MB (what a WebP-capable browser downloads)")
+    print("\nDone! Run scripts/fingerprint_assets.py to publish them to the game.")
+    if failed:
+        sys.exit(1)
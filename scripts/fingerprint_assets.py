@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""Publish the game's final assets under content-hashed file names.
+
+Run after pack_atlas.py, build_backgrounds.py, encode_webp.py and
+render_sfx.py. Every file the game loads (the sprite atlas pages and JSON
+and the frames' hit shapes, the background variants listed in
+variants.json, and the sound effect sprite and its slice map) is copied to
+public/assets/hashed/ as <name>.<hash>.<ext>, where hash is the start of
+the file's SHA-256. Atlas JSON is rewritten to name the hashed pages before
+it is hashed itself.
+
+Atlas pages and backgrounds are published as PNG and, where encode_webp.py
+wrote one for the current PNG, as WebP too; the atlas gets a second JSON
+naming its WebP pages if every page has one. The game picks the smaller
+format the browser can decode.
+
+A file's URL changes whenever its bytes do, so everything under
+assets/hashed/ can be served with `Cache-Control: max-age=31536000,
+immutable` and returning players only download what changed. The unhashed
+originals are build intermediates kept under build/assets/ (or source art,
+which the production build leaves out of dist), so each file ships once.
+
+Writes build/assets/asset-manifest.json (source file -> hashed URL, size
+and hash) and src/game/config/AssetManifest.ts, which PreloadScene loops
+over: the atlases to load, the factor each frame was shrunk by (for
+FrameScale.ts), the hit shapes, the background variant URLs and sizes per
+format, the sound effect sprite, and the animations implied by the atlas
+frame names.
+Hashed files that are no longer referenced are deleted.
+"""
+import hashlib
+import json
+import os
+from collections.abc import Iterable
+
+from build_backgrounds import VARIANTS, VARIANTS_JSON
+from downscale_sprites import DENSITY
+from encode_webp import current_webp, load_webp_manifest
+from hit_shapes import HIT_SHAPES_JSON
+from pack_atlas import ATLAS_DIR, ATLAS_NAME
+from render_sfx import SPRITE_JSON, SPRITE_MP3
+
+ROOT_DIR = os.path.join(os.path.dirname(__file__), "..")
+PUBLIC_DIR = os.path.join(ROOT_DIR, "public")
+HASHED_DIR = os.path.join(PUBLIC_DIR, "assets", "hashed")
+MANIFEST_JSON = os.path.join(ROOT_DIR, "build", "assets", "asset-manifest.json")
+MANIFEST_TS = os.path.join(ROOT_DIR, "src", "game", "config", "AssetManifest.ts")
+
+HASH_LENGTH = 10
+
+# Frame X plus frame X<suffix> make these animations: (key suffix, frames, frame rate)
+ANIMATIONS = {
+    "_walk": [("_walk", ["", "_walk"], 4), ("_idle", [""], 1)],
+    "_flip": [("_spin", ["", "_flip"], 4)],
+}
+
+
+def url_for(path: str) -> str:
+    """URL the game loads a file under public/ from."""
+    return os.path.relpath(path, PUBLIC_DIR).replace(os.sep, "/")
+
+
+def rel_path(path: str) -> str:
+    """Source file's path relative to the repo root, as asset-manifest.json keys it."""
+    return os.path.relpath(path, ROOT_DIR).replace(os.sep, "/")
+
+
+def publish(data: bytes, name: str, manifest: dict, source: str) -> str:
+    """Write data as hashed/<stem>.<hash><ext> (unless it's already there); returns its URL."""
+    digest = hashlib.sha256(data).hexdigest()
+    stem, ext = os.path.splitext(name)
+    path = os.path.join(HASHED_DIR, f"{stem}.{digest[:HASH_LENGTH]}{ext}")
+    if not os.path.exists(path):
+        with open(path, "wb") as f:
+            f.write(data)
+    url = url_for(path)
+    manifest[source] = {"url": url, "bytes": len(data), "sha256": digest}
+    return url
+
+
+def publish_file(path: str, manifest: dict) -> str:
+    with open(path, "rb") as f:
+        return publish(f.read(), os.path.basename(path), manifest, rel_path(path))
+
+
+def publish_image(path: str, manifest: dict, webp: dict) -> dict[str, dict]:
+    """Publish a PNG and its up-to-date WebP, if any; returns format -> {"url", "bytes"}."""
+    formats = {}
+    for fmt, source in (("png", path), ("webp", current_webp(path, webp))):
+        if source is not None:
+            formats[fmt] = {"url": publish_file(source, manifest), "bytes": manifest[rel_path(source)]["bytes"]}
+    return formats
+
+
+def publish_atlas(manifest: dict, webp: dict) -> tuple[dict, dict[str, float]]:
+    """Publish the atlas pages and, per format, a JSON naming their hashed files.
+
+    Returns (atlas entry, frame name -> factor pack_atlas.py shrank it by);
+    a format's bytes are its pages' total.
+    """
+    json_path = os.path.join(ATLAS_DIR, f"{ATLAS_NAME}.json")
+    with open(json_path) as f:
+        atlas = json.load(f)
+    frames = {frame["filename"]: frame.get("scale", 1) for texture in atlas["textures"] for frame in texture["frames"]}
+    pages = [publish_image(os.path.join(ATLAS_DIR, texture["image"]), manifest, webp) for texture in atlas["textures"]]
+
+    formats = {}
+    for fmt in ("png", "webp"):
+        if not all(fmt in page for page in pages):
+            continue
+        for texture, page in zip(atlas["textures"], pages):
+            texture["image"] = os.path.basename(page[fmt]["url"])
+        data = (json.dumps(atlas, indent=2) + "\n").encode()
+        name = os.path.basename(json_path) if fmt == "png" else f"{ATLAS_NAME}.{fmt}.json"
+        formats[fmt] = {
+            "url": publish(data, name, manifest, rel_path(os.path.join(ATLAS_DIR, name))),
+            "bytes": sum(page[fmt]["bytes"] for page in pages),
+        }
+    return {"key": ATLAS_NAME, "path": url_for(HASHED_DIR), "formats": formats}, frames
+
+
+def animations(atlas_key: str, frames: Iterable[str]) -> list[dict]:
+    names = set(frames)
+    anims = []
+    for base in sorted(names):
+        for suffix, variants in ANIMATIONS.items():
+            if base + suffix in names:
+                for key_suffix, frame_suffixes, frame_rate in variants:
+                    anims.append({
+                        "key": base + key_suffix,
+                        "atlas": atlas_key,
+                        "frames": [base + s for s in frame_suffixes],
+                        "frameRate": frame_rate,
+                    })
+    return anims
+
+
+def write_module(atlases: list[dict], frame_scales: dict[str, float], hit_shapes: str,
+                 backgrounds: dict[str, dict[str, dict]], sfx: dict[str, str], anims: list[dict]) -> None:
+    def quote(s: str) -> str:
+        return f"'{s}'"
+
+    def formats_ts(name: str, formats: dict[str, dict], indent: str) -> list[str]:
+        return ([f"{indent}{name}: {{"]
+                + [f"{indent}    {fmt}: {{ url: {quote(f['url'])}, bytes: {f['bytes']} }}," for fmt, f in formats.items()]
+                + [f"{indent}}},"])
+
+    lines = [
+        "// Generated by scripts/fingerprint_assets.py - do not edit by hand.",
+        "",
+        "export interface ImageFile {",
+        "    url: string;",
+        "    bytes: number;",
+        "}",
+        "",
+        "// An image in each format it's published in; pickImageUrl (GameConfig.ts) chooses one",
+        "export interface ImageFormats {",
+        "    png: ImageFile;",
+        "    webp?: ImageFile;",
+        "}",
+        "",
+        "export interface AtlasAsset {",
+        "    key: string;           // texture key",
+        "    path: string;          // directory holding its pages",
+        "    formats: ImageFormats; // multiatlas JSON per page format, with the pages' total size",
+        "}",
+        "",
+        "export interface BackgroundVariants {",
+        "    full: ImageFormats;  // GAME_WIDTH x GAME_HEIGHT",
+        f"    hidpi: ImageFormats; // {DENSITY:g}x game resolution, for high-DPI screens",
+        "    thumb: ImageFormats; // Options panel picker thumbnail",
+        "}",
+        "",
+        "export interface SfxAsset {",
+        "    audio: string; // MP3 with every sound effect",
+        "    map: string;   // JSON: effect name -> slices of audio to pick from",
+        "}",
+        "",
+        "export interface AnimationAsset {",
+        "    key: string;",
+        "    atlas: string;",
+        "    frames: string[];",
+        "    frameRate: number;",
+        "}",
+        "",
+        "export const ATLASES: AtlasAsset[] = [",
+    ]
+    for atlas in atlases:
+        lines += [
+            "    {",
+            f"        key: {quote(atlas['key'])},",
+            f"        path: {quote(atlas['path'])},",
+            *formats_ts("formats", atlas["formats"], " " * 8),
+            "    },",
+        ]
+    lines += [
+        "];",
+        "",
+        "// Factor each atlas frame was shrunk by from its source canvas; frames left out are full size",
+        "export const FRAME_SCALES: Record<string, number> = {",
+        *(f"    {name}: {scale:g}," for name, scale in sorted(frame_scales.items()) if scale != 1),
+        "};",
+        "",
+        "// JSON: frame name -> collision box and hull, from scripts/hit_shapes.py",
+        f"export const HIT_SHAPES = {quote(hit_shapes)};",
+        "",
+        "export const BACKGROUND_MANIFEST: Record<string, BackgroundVariants> = {",
+    ]
+    for style, variants in backgrounds.items():
+        lines.append(f"    {style}: {{")
+        for variant in VARIANTS:
+            lines += formats_ts(variant, variants[variant], " " * 8)
+        lines.append("    },")
+    lines += [
+        "};",
+        "",
+        f"export const SFX: SfxAsset = {{ audio: {quote(sfx['audio'])}, map: {quote(sfx['map'])} }};",
+        "",
+        "export const ANIMATIONS: AnimationAsset[] = [",
+    ]
+    for anim in anims:
+        frames = ", ".join(quote(f) for f in anim["frames"])
+        lines.append(f"    {{ key: {quote(anim['key'])}, atlas: {quote(anim['atlas'])}, "
+                     f"frames: [{frames}], frameRate: {anim['frameRate']} }},")
+    lines.append("];")
+    with open(MANIFEST_TS, "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def fingerprint() -> dict:
+    """Publish every runtime asset and write both manifests; returns the JSON manifest."""
+    os.makedirs(HASHED_DIR, exist_ok=True)
+    manifest: dict[str, dict] = {}
+
+    webp = load_webp_manifest()
+    atlas, frames = publish_atlas(manifest, webp)
+    hit_shapes = publish_file(HIT_SHAPES_JSON, manifest)
+    with open(VARIANTS_JSON) as f:
+        listing = json.load(f)
+    backgrounds = {
+        style: {v: publish_image(os.path.join(ROOT_DIR, paths[v]), manifest, webp) for v in VARIANTS}
+        for style, paths in sorted(listing.items())
+    }
+    sfx = {"audio": publish_file(SPRITE_MP3, manifest), "map": publish_file(SPRITE_JSON, manifest)}
+    write_module([atlas], frames, hit_shapes, backgrounds, sfx, animations(atlas["key"], frames))
+
+    with open(MANIFEST_JSON, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+    # Drop hashed files from earlier runs that nothing points at any more
+    current = {os.path.basename(entry["url"]) for entry in manifest.values()}
+    for fname in os.listdir(HASHED_DIR):
+        if fname not in current:
+            os.remove(os.path.join(HASHED_DIR, fname))
+    return manifest
+
+
+if __name__ == "__main__":
+    manifest = fingerprint()
+    for i, (source, entry) in enumerate(sorted(manifest.items()), 1):
+        print(f"  [{i}/{len(manifest)}] {source} -> {entry['url']} ({entry['bytes'] / 1024:.0f} KB)")
+    total = sum(entry["bytes"] for entry in manifest.values())
+    print(f"\nDone! Published {len(manifest)} files ({total / (1024 * 1024):.2f} MB) to "
+          f"{os.path.relpath(HASHED_DIR)} and wrote {os.path.relpath(MANIFEST_TS, ROOT_DIR)}.")
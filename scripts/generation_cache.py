@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""Content-addressed cache in front of generate_image.
+
+The key is a hash of the generator that made the image, the canonicalized
+prompt, the size/seed parameters and the bytes of every input image, so a
+request that would produce the same image is served from disk instead of
+the generator, and placeholders from --stub runs are never served to a run
+against the real API. Entries are evicted
+least-recently-used once the cache grows past its size cap.
+"""
+import argparse
+import functools
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+from collections.abc import Callable
+
+from tracing import span
+
+CACHE_DIR = os.path.join(os.path.dirname(__file__), "..", ".cache", "generation")
+DEFAULT_MAX_MB = 1024
+
+# Bump to invalidate every entry, e.g. when the generator model changes
+KEY_VERSION = 2
+
+
+def file_digest(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def generator_identity(generate: Callable) -> str:
+    """'module.function' of the generator behind any functools.wraps layers, plus its MODEL if it declares one."""
+    fn = inspect.unwrap(generate)
+    identity = f"{fn.__module__}.{fn.__qualname__}"
+    model = getattr(sys.modules.get(fn.__module__), "MODEL", None)
+    return f"{identity}:{model}" if model else identity
+
+
+def cache_key(
+    generator: str,
+    prompt: dict,
+    width: int,
+    height: int,
+    seed: int | None = None,
+    input_images: list[str] | None = None,
+) -> str:
+    payload = json.dumps({
+        "version": KEY_VERSION,
+        "generator": generator,
+        "prompt": prompt,
+        "width": width,
+        "height": height,
+        "seed": seed,
+        "input_images": [file_digest(p) for p in input_images or []],
+    }, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class GenerationCache:
+    def __init__(self, cache_dir: str = CACHE_DIR, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self._lock = threading.Lock()
+        self._total: int | None = None  # bytes on disk, counted on the first put()
+
+    def entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.png")
+
+    def get(self, key: str, save_path: str) -> bool:
+        """Copy the cached image for key to save_path; return False on a miss."""
+        entry = self.entry_path(key)
+        os.makedirs(os.path.dirname(save_path) or ".", exist_ok=True)
+        try:
+            os.utime(entry)  # mark as recently used
+            # Another worker's put() may evict the entry between these two calls
+            shutil.copyfile(entry, save_path)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return False
+        with self._lock:
+            self.hits += 1
+            self.bytes_saved += os.path.getsize(save_path)
+        return True
+
+    def put(self, key: str, source_path: str) -> None:
+        """Store the raw generated image at source_path under key, then enforce the size cap."""
+        entry = self.entry_path(key)
+        os.makedirs(os.path.dirname(entry), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(entry), suffix=".tmp")
+        os.close(fd)
+        shutil.copyfile(source_path, tmp)
+        size = os.path.getsize(tmp)
+        with self._lock:
+            if self._total is None:
+                self._total = sum(size for _, size, _ in self._entries())
+            try:
+                self._total -= os.path.getsize(entry)  # replacing an existing entry
+            except FileNotFoundError:
+                pass
+            os.replace(tmp, entry)
+            self._total += size
+            over = self._total > self.max_bytes
+        if over:
+            self.evict()
+
+    def _entries(self) -> list[tuple[float, int, str]]:
+        """(mtime, size, path) of every cached image."""
+        entries = []
+        for dirpath, _, fnames in os.walk(self.cache_dir):
+            for fname in fnames:
+                if fname.endswith(".png"):
+                    path = os.path.join(dirpath, fname)
+                    try:
+                        stat = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def evict(self) -> None:
+        """Delete least-recently-used entries until the cache fits in max_bytes.
+
+        put() keeps a running total and only calls this once it passes the cap.
+        """
+        with self._lock:
+            entries = self._entries()
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+            self._total = total
+
+    def wrap(self, generate: Callable[..., dict]) -> Callable[..., dict]:
+        """Return a drop-in replacement for generate that consults the cache first.
+
+        Entries are keyed by generate's generator_identity, so the stub and the
+        real generator never share them.
+        """
+        generator = generator_identity(generate)
+
+        @functools.wraps(generate)
+        def cached_generate(
+            prompt: dict,
+            save_path: str,
+            width: int = 512,
+            height: int = 512,
+            seed: int | None = None,
+            input_images: list[str] | None = None,
+        ) -> dict:
+            with span("cache_lookup"):
+                key = cache_key(generator, prompt, width, height, seed, input_images)
+                hit = self.get(key, save_path)
+            if hit:
+                return {"save_path": save_path, "seed": seed, "cached": True}
+            result = generate(
+                prompt=prompt,
+                save_path=save_path,
+                width=width,
+                height=height,
+                seed=seed,
+                input_images=input_images,
+            )
+            with span("cache_store"):
+                self.put(key, result.get("save_path", save_path))
+            return result
+        return cached_generate
+
+    def stats_line(self) -> str:
+        return (f"Generation cache: {self.hits} hits, {self.misses} misses, "
+                f"{self.bytes_saved / (1024 * 1024):.1f} MB saved")
+
+
+def add_cache_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--no-cache", action="store_true",
+                        help="always call the generator, bypassing the generation cache")
+    parser.add_argument("--cache-max-mb", type=int, default=DEFAULT_MAX_MB,
+                        help=f"generation cache size cap in MB (default: {DEFAULT_MAX_MB})")
+
+
+def cache_from_args(args: argparse.Namespace) -> GenerationCache | None:
+    if args.no_cache:
+        return None
+    return GenerationCache(max_bytes=args.cache_max_mb * 1024 * 1024)
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""Run generate_image over a batch of asset specs concurrently.
+
+Specs are the dicts in asset_specs.py: "prompt", "path", "w", "h",
+optional "seed" and "input_images". An asset whose input_images names another
+spec's path waits for that spec to finish, and is skipped if it failed.
+"""
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from tracing import span, traced
+
+SKILL_DIR = os.path.join(os.path.dirname(__file__), "..", ".claude", "skills", "image-generation", "scripts")
+
+_print_lock = threading.Lock()
+
+
+def log(message: str, error: bool = False) -> None:
+    """Print one whole line from any worker thread without interleaving."""
+    with _print_lock:
+        print(message, file=sys.stderr if error else sys.stdout, flush=True)
+
+
+def load_generate_image(stub: bool = False) -> Callable[..., dict]:
+    """Import the real generate_image from the image-generation skill, or the offline stub.
+
+    Calls are recorded as "generate" spans when tracing is enabled.
+    """
+    if stub:
+        from stub_generate import generate_image
+    else:
+        sys.path.insert(0, SKILL_DIR)
+        from generate import generate_image
+    return traced("generate", generate_image)
+
+
+def build_dependencies(assets: list[dict]) -> dict[str, set[str]]:
+    """Map each asset path to the paths of other assets in the batch it uses as input."""
+    paths = {os.path.normpath(a["path"]) for a in assets}
+    deps = {}
+    for asset in assets:
+        refs = {os.path.normpath(p) for p in asset.get("input_images") or []}
+        deps[os.path.normpath(asset["path"])] = refs & paths
+    return deps
+
+
+def check_acyclic(deps: dict[str, set[str]]) -> None:
+    """Raise ValueError if the input_images references form a cycle."""
+    done: set[str] = set()
+    active: set[str] = set()
+
+    def visit(path: str) -> None:
+        if path in done:
+            return
+        if path in active:
+            raise ValueError(f"Dependency cycle through {path}")
+        active.add(path)
+        for dep in deps[path]:
+            visit(dep)
+        active.discard(path)
+        done.add(path)
+
+    for path in deps:
+        visit(path)
+
+
+def generate_with_retry(
+    generate: Callable[..., dict],
+    asset: dict,
+    retries: int = 3,
+    backoff: float = 2.0,
+) -> dict:
+    """Call generate for one asset, retrying failures with exponential backoff."""
+    for attempt in range(retries + 1):
+        try:
+            return generate(
+                prompt=asset["prompt"],
+                save_path=asset["path"],
+                width=asset["w"],
+                height=asset["h"],
+                seed=asset.get("seed"),
+                input_images=asset.get("input_images"),
+            )
+        except Exception as e:
+            if attempt == retries:
+                raise
+            delay = backoff * 2 ** attempt
+            log(f"  -> {os.path.basename(asset['path'])} attempt {attempt + 1} failed ({e}), "
+                f"retrying in {delay:.1f}s", error=True)
+            time.sleep(delay)
+    raise AssertionError("unreachable")
+
+
+def run_generation(
+    assets: list[dict],
+    generate: Callable[..., dict],
+    concurrency: int = 4,
+    retries: int = 3,
+    backoff: float = 2.0,
+) -> dict[str, str | None]:
+    """Generate every asset with at most `concurrency` requests in flight.
+
+    Returns a dict from asset path to None on success or an error message on
+    failure, in the same order as `assets`.
+    """
+    deps = build_dependencies(assets)
+    check_acyclic(deps)
+    by_path = {os.path.normpath(a["path"]): a for a in assets}
+    order = list(by_path)
+    total = len(order)
+    results: dict[str, str | None] = {}
+    started = 0
+
+    def run(path: str) -> None:
+        with span(os.path.basename(path), cat="asset"):
+            result = generate_with_retry(generate, by_path[path], retries, backoff)
+        log(f"  -> Done: {result['save_path']}")
+
+    concurrency = max(1, concurrency)
+    pending = list(order)
+    running = {}
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        while pending or running:
+            for path in list(pending):
+                if len(running) >= concurrency:
+                    break
+                failed = [d for d in deps[path] if d in results and results[d] is not None]
+                if failed:
+                    pending.remove(path)
+                    results[path] = f"skipped, {os.path.basename(failed[0])} failed"
+                    log(f"  -> SKIPPED {os.path.basename(path)}: {os.path.basename(failed[0])} failed", error=True)
+                elif all(d in results for d in deps[path]):
+                    pending.remove(path)
+                    started += 1
+                    log(f"[{started}/{total}] Generating {os.path.basename(path)}...")
+                    running[pool.submit(run, path)] = path
+            if not running:
+                continue
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                path = running.pop(future)
+                error = future.exception()
+                results[path] = None if error is None else f"{type(error).__name__}: {error}"
+                if error is not None:
+                    log(f"  -> FAILED {os.path.basename(path)}: {results[path]}", error=True)
+
+    return {path: results[path] for path in order}
+
+
+def print_summary(results: dict[str, str | None]) -> None:
+    ok = [p for p, error in results.items() if error is None]
+    failed = {p: error for p, error in results.items() if error is not None}
+    print(f"\nGenerated {len(ok)} of {len(results)} assets.")
+    if failed:
+        print(f"{len(failed)} failed:", file=sys.stderr)
+        for path, error in failed.items():
+            print(f"  {os.path.basename(path)}: {error}", file=sys.stderr)
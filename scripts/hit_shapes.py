@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Precompute tight collision shapes for every atlas frame from its alpha mask.
+
+Sprites sit on canvases that are mostly transparent margin, so a
+physics body sized to the frame is far bigger than the creature drawn on it.
+For every frame (including each walk and flip frame) this records:
+
+- box: the smallest rectangle (x, y, w, h) holding every pixel with alpha of
+  at least --threshold, which becomes the Arcade physics body, and
+- hull: a convex polygon around the same pixels, simplified to at most
+  --max-vertices corners by cutting away the cheapest edges outwards, so it
+  still encloses every opaque pixel. It is left out when it isn't at least
+  HULL_MIN_SAVING smaller than the box, since the box test is then as good.
+
+Coordinates are in pixels of the frame's untrimmed canvas at the size it is
+packed at (see downscale_sprites.py), the space Phaser's frame size, origin
+and body offsets use. pack_atlas.py writes the
+shapes next to the atlas as hit_shapes.json and fingerprint_assets.py
+publishes it; run this script on its own to see how much each shape shrinks.
+"""
+import argparse
+import json
+import os
+
+import numpy as np
+from PIL import Image
+
+from downscale_sprites import load_display_sprites
+from trim_sprites import collect_sprites
+
+BUILD_DIR = os.path.join(os.path.dirname(__file__), "..", "build", "assets")
+HIT_SHAPES_JSON = os.path.join(BUILD_DIR, "atlas", "hit_shapes.json")
+
+ALPHA_THRESHOLD = 128  # soft fringe pixels below this don't count as solid
+MAX_VERTICES = 8
+HULL_MIN_SAVING = 0.1  # keep the hull only if it's at least 10% smaller than the box
+
+Point = tuple[float, float]
+
+
+def opaque_mask(img: Image.Image, threshold: int = ALPHA_THRESHOLD) -> np.ndarray:
+    if img.mode != "RGBA":
+        return np.ones((img.height, img.width), dtype=bool)
+    return np.array(img.getchannel("A")) >= threshold
+
+
+def bounding_box(mask: np.ndarray) -> tuple[int, int, int, int] | None:
+    """(x, y, w, h) around every True pixel, or None if there are none."""
+    rows = np.flatnonzero(mask.any(axis=1))
+    cols = np.flatnonzero(mask.any(axis=0))
+    if len(rows) == 0:
+        return None
+    return int(cols[0]), int(rows[0]), int(cols[-1] - cols[0] + 1), int(rows[-1] - rows[0] + 1)
+
+
+def cross(o: Point, a: Point, b: Point) -> float:
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def polygon_area(points: list[Point]) -> float:
+    return abs(sum(x0 * y1 - x1 * y0 for (x0, y0), (x1, y1) in zip(points, points[1:] + points[:1]))) / 2
+
+
+def convex_hull(mask: np.ndarray) -> list[Point]:
+    """Convex hull of the True pixels' squares, without collinear points (monotone chain)."""
+    rows = np.flatnonzero(mask.any(axis=1))
+    left = mask[rows].argmax(axis=1)
+    right = mask.shape[1] - mask[rows, ::-1].argmax(axis=1)
+    # Only each row's outermost pixel corners can be on the hull
+    points = sorted({(float(x), float(y + dy)) for y, l, r in zip(rows, left, right) for x in (l, r) for dy in (0, 1)})
+
+    def half(pts: list[Point]) -> list[Point]:
+        chain: list[Point] = []
+        for p in pts:
+            while len(chain) >= 2 and cross(chain[-2], chain[-1], p) <= 0:
+                chain.pop()
+            chain.append(p)
+        return chain[:-1]
+
+    return half(points) + half(points[::-1])
+
+
+def _cut_edge(poly: list[Point], i: int) -> tuple[Point, float] | None:
+    """Where the neighbours of edge i meet if it's removed, and the area that adds.
+
+    None if they don't meet outside the polygon (the corners turn 180 degrees or more).
+    """
+    n = len(poly)
+    a, b, c, d = poly[i - 1], poly[i], poly[(i + 1) % n], poly[(i + 2) % n]
+    d1 = (b[0] - a[0], b[1] - a[1])
+    d2 = (c[0] - d[0], c[1] - d[1])
+    denom = d1[0] * d2[1] - d1[1] * d2[0]
+    if denom == 0:
+        return None
+    t = ((c[0] - b[0]) * d2[1] - (c[1] - b[1]) * d2[0]) / denom
+    u = ((c[0] - b[0]) * d1[1] - (c[1] - b[1]) * d1[0]) / denom
+    if t <= 0 or u <= 0:
+        return None
+    meet = (b[0] + t * d1[0], b[1] + t * d1[1])
+    return meet, abs(cross(b, meet, c)) / 2
+
+
+def simplify_hull(hull: list[Point], max_vertices: int = MAX_VERTICES) -> list[Point]:
+    """Reduce a convex polygon to at most max_vertices corners that still enclose it.
+
+    Repeatedly removes the edge whose neighbouring edges, extended to meet,
+    add the least area.
+    """
+    poly = list(hull)
+    while len(poly) > max(3, max_vertices):
+        best = None
+        for i in range(len(poly)):
+            cut = _cut_edge(poly, i)
+            if cut is not None and (best is None or cut[1] < best[2]):
+                best = (i, cut[0], cut[1])
+        if best is None:
+            break
+        i, meet, _ = best
+        poly[i] = meet
+        del poly[(i + 1) % len(poly)]
+    return poly
+
+
+def hit_shape(img: Image.Image, threshold: int = ALPHA_THRESHOLD, max_vertices: int = MAX_VERTICES) -> dict | None:
+    """The frame's box and (if it's worth testing) hull, or None if nothing is opaque."""
+    mask = opaque_mask(img, threshold)
+    box = bounding_box(mask)
+    if box is None:
+        return None
+    shape: dict = {"box": list(box)}
+    if max_vertices >= 3:
+        hull = simplify_hull(convex_hull(mask), max_vertices)
+        if polygon_area(hull) <= (1 - HULL_MIN_SAVING) * box[2] * box[3]:
+            shape["hull"] = [round(v, 1) for p in hull for v in p]
+    return shape
+
+
+def build_hit_shapes(
+    images: dict[str, Image.Image],
+    threshold: int = ALPHA_THRESHOLD,
+    max_vertices: int = MAX_VERTICES,
+) -> dict[str, dict]:
+    """Hit shape per frame name; fully transparent frames are left out."""
+    shapes = {}
+    for name, img in images.items():
+        shape = hit_shape(img, threshold, max_vertices)
+        if shape is not None:
+            shapes[name] = shape
+    return shapes
+
+
+def write_hit_shapes(shapes: dict[str, dict]) -> str:
+    os.makedirs(os.path.dirname(HIT_SHAPES_JSON), exist_ok=True)
+    with open(HIT_SHAPES_JSON, "w") as f:
+        json.dump(shapes, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return HIT_SHAPES_JSON
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threshold", type=int, default=ALPHA_THRESHOLD,
+                        help=f"minimum alpha of a solid pixel (default: {ALPHA_THRESHOLD})")
+    parser.add_argument("--max-vertices", type=int, default=MAX_VERTICES,
+                        help=f"corners per hull, 0 for boxes only (default: {MAX_VERTICES})")
+    parser.add_argument("--write", action="store_true",
+                        help=f"write {os.path.relpath(HIT_SHAPES_JSON)} (pack_atlas.py also does)")
+    args = parser.parse_args()
+
+    sprites = collect_sprites()
+    images, _ = load_display_sprites(sprites)
+    shapes = build_hit_shapes(images, args.threshold, args.max_vertices)
+
+    canvas = boxed = hulled = 0
+    for i, name in enumerate(sprites, 1):
+        area = images[name].width * images[name].height
+        canvas += area
+        shape = shapes.get(name)
+        if shape is None:
+            print(f"  [{i}/{len(sprites)}] {name}: fully transparent")
+            continue
+        x, y, w, h = shape["box"]
+        hull = shape.get("hull")
+        hull_area = polygon_area(list(zip(hull[::2], hull[1::2]))) if hull else w * h
+        boxed += w * h
+        hulled += hull_area
+        hull_note = f", hull {len(hull) // 2} corners {hull_area / area:.0%}" if hull else ""
+        print(f"  [{i}/{len(sprites)}] {name}: box {w}x{h} at ({x}, {y}) {w * h / area:.0%} of canvas{hull_note}")
+    print(f"\nArea tested: canvas 100% -> box {boxed / canvas:.0%} -> box or hull {hulled / canvas:.0%}")
+
+    if args.write:
+        print(f"Done! Wrote {os.path.relpath(write_hit_shapes(shapes))}.")
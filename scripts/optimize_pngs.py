@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""Recompress the PNGs under public/assets and build/assets, losslessly or with palette quantization.
+
+Lossless mode re-encodes every image at zlib level 9 with the most promising
+PNG row filters (fixed, or chosen per row) and several zlib strategies, and
+also tries smaller pixel formats: RGB when alpha is unused, greyscale, and an
+indexed palette at 1/2/4/8 bits when the image has few enough colours. The
+smallest encoding that decodes to the exact same RGBA pixels wins.
+
+Lossy mode (--lossy) first quantizes to a --colors palette and keeps the
+result only if its perceptual difference from the original (CIE76 delta E,
+composited over mid-grey) stays within the guard; otherwise the file falls
+back to lossless.
+
+Files are only rewritten when the new encoding is smaller.
+"""
+import argparse
+import io
+import json
+import os
+import struct
+import sys
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from PIL import Image, features
+
+ASSETS_DIR = os.path.join(os.path.dirname(__file__), "..", "public", "assets")
+BUILD_DIR = os.path.join(os.path.dirname(__file__), "..", "build", "assets")
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+FILTERS = ("none", "sub", "up", "average", "paeth", "adaptive")
+STRATEGIES = {
+    "default": zlib.Z_DEFAULT_STRATEGY,
+    "filtered": zlib.Z_FILTERED,
+    "rle": zlib.Z_RLE,
+}
+
+SHORTLIST = 2  # filters per pixel format that get the full zlib sweep
+
+COLORS = 256
+MAX_MEAN_DELTA_E = 1.0  # average colour error a player won't notice
+MAX_P99_DELTA_E = 5.0  # and no more than 1% of pixels visibly off
+
+
+# --- PNG encoding -----------------------------------------------------------
+
+def png_chunk(tag: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+
+
+def _filtered(raw: np.ndarray, bpp: int, filter_type: int) -> np.ndarray:
+    """Apply one PNG filter (0-4) to every row of raw scanline bytes."""
+    x = raw.astype(np.int16)
+    if filter_type == 0:
+        return raw
+    a = np.zeros_like(x)
+    a[:, bpp:] = x[:, :-bpp]
+    if filter_type == 1:
+        return (x - a).astype(np.uint8)
+    b = np.zeros_like(x)
+    b[1:] = x[:-1]
+    if filter_type == 2:
+        return (x - b).astype(np.uint8)
+    if filter_type == 3:
+        return (x - (a + b) // 2).astype(np.uint8)
+    c = np.zeros_like(x)
+    c[1:, bpp:] = x[:-1, :-bpp]
+    p = a + b - c
+    pa, pb, pc = np.abs(p - a), np.abs(p - b), np.abs(p - c)
+    pred = np.where((pa <= pb) & (pa <= pc), a, np.where(pb <= pc, b, c))
+    return (x - pred).astype(np.uint8)
+
+
+def filter_scanlines(raw: np.ndarray, bpp: int, method: str) -> bytes:
+    """Filter raw (height x stride) scanlines and prefix each row with its filter byte."""
+    if method == "adaptive":
+        # Standard heuristic: per row, the filter with the smallest sum of signed residuals
+        candidates = np.stack([_filtered(raw, bpp, f) for f in range(5)])
+        scores = np.abs(candidates.view(np.int8).astype(np.int32)).sum(axis=2)
+        choice = scores.argmin(axis=0)
+        rows = candidates[choice, np.arange(raw.shape[0])]
+    else:
+        choice = np.full(raw.shape[0], FILTERS.index(method))
+        rows = _filtered(raw, bpp, int(choice[0]))
+    return np.hstack([choice.astype(np.uint8)[:, None], rows]).tobytes()
+
+
+def _pack_bits(indices: np.ndarray, bit_depth: int) -> np.ndarray:
+    """Pack 8-bit palette indices into rows of 1/2/4-bit samples."""
+    if bit_depth == 8:
+        return indices
+    per_byte = 8 // bit_depth
+    h, w = indices.shape
+    padded = np.zeros((h, -(-w // per_byte) * per_byte), dtype=np.uint8)
+    padded[:, :w] = indices
+    groups = padded.reshape(h, -1, per_byte).astype(np.uint16)
+    shifts = np.arange(per_byte - 1, -1, -1) * bit_depth
+    return (groups << shifts).sum(axis=2).astype(np.uint8)
+
+
+def representations(rgba: np.ndarray) -> list[dict]:
+    """Every lossless pixel format the image fits in, smallest raw size first."""
+    h, w, _ = rgba.shape
+    opaque = bool((rgba[..., 3] == 255).all())
+    grey = bool(((rgba[..., 0] == rgba[..., 1]) & (rgba[..., 1] == rgba[..., 2])).all())
+    reps = []
+
+    flat = np.ascontiguousarray(rgba).view(np.uint32).reshape(-1)
+    colors, inverse = np.unique(flat, return_inverse=True)
+    if len(colors) <= 256:
+        palette = colors.view(np.uint8).reshape(-1, 4)
+        # Translucent entries first so tRNS can stop at the last one
+        order = np.argsort(palette[:, 3] == 255, kind="stable")
+        remap = np.empty_like(order)
+        remap[order] = np.arange(len(order))
+        palette = palette[order]
+        indices = remap[inverse].astype(np.uint8).reshape(h, w)
+        bit_depth = next(d for d in (1, 2, 4, 8) if len(palette) <= 1 << d)
+        translucent = int((palette[:, 3] < 255).sum())
+        extra = [png_chunk(b"PLTE", palette[:, :3].tobytes())]
+        if translucent:
+            extra.append(png_chunk(b"tRNS", palette[:translucent, 3].tobytes()))
+        reps.append({"name": f"palette{bit_depth}", "color_type": 3, "bit_depth": bit_depth,
+                     "raw": _pack_bits(indices, bit_depth), "bpp": 1, "extra": extra})
+
+    if opaque and grey:
+        reps.append({"name": "grey", "color_type": 0, "bit_depth": 8, "raw": rgba[..., 0], "bpp": 1, "extra": []})
+    elif grey:
+        reps.append({"name": "grey+alpha", "color_type": 4, "bit_depth": 8,
+                     "raw": rgba[..., [0, 3]].reshape(h, w * 2), "bpp": 2, "extra": []})
+    if opaque:
+        reps.append({"name": "rgb", "color_type": 2, "bit_depth": 8,
+                     "raw": rgba[..., :3].reshape(h, w * 3), "bpp": 3, "extra": []})
+    else:
+        reps.append({"name": "rgba", "color_type": 6, "bit_depth": 8,
+                     "raw": rgba.reshape(h, w * 4), "bpp": 4, "extra": []})
+    return reps
+
+
+def encode_png(rep: dict, width: int, height: int, filter_method: str, strategy: int) -> bytes:
+    ihdr = struct.pack(">IIBBBBB", width, height, rep["bit_depth"], rep["color_type"], 0, 0, 0)
+    compressor = zlib.compressobj(9, zlib.DEFLATED, 15, 9, strategy)
+    data = filter_scanlines(np.ascontiguousarray(rep["raw"]), rep["bpp"], filter_method)
+    idat = compressor.compress(data) + compressor.flush()
+    return PNG_SIGNATURE + png_chunk(b"IHDR", ihdr) + b"".join(rep["extra"]) + png_chunk(b"IDAT", idat) + png_chunk(b"IEND", b"")
+
+
+def smallest_lossless(rgba: np.ndarray, shortlist: int = SHORTLIST) -> tuple[bytes, str]:
+    """Return the smallest lossless PNG of rgba and a label for the encoding that won.
+
+    Every filter is scored with a quick zlib pass; only the best few per pixel
+    format get the full level-9 sweep over zlib strategies.
+    """
+    h, w, _ = rgba.shape
+    best, label = None, ""
+    for rep in representations(rgba):
+        raw = np.ascontiguousarray(rep["raw"])
+        scored = sorted(FILTERS, key=lambda f: len(zlib.compress(filter_scanlines(raw, rep["bpp"], f), 1)))
+        for filter_method in scored[:shortlist]:
+            for strategy_name, strategy in STRATEGIES.items():
+                data = encode_png(rep, w, h, filter_method, strategy)
+                if best is None or len(data) < len(best):
+                    best, label = data, f"{rep['name']}/{filter_method}/{strategy_name}"
+    return best, label
+
+
+# --- Perceptual guard -------------------------------------------------------
+
+def srgb_to_lab(rgb: np.ndarray) -> np.ndarray:
+    c = rgb / 255.0
+    linear = np.where(c <= 0.04045, c / 12.92, ((c + 0.055) / 1.055) ** 2.4)
+    m = np.array([[0.4124, 0.3576, 0.1805], [0.2126, 0.7152, 0.0722], [0.0193, 0.1192, 0.9505]])
+    xyz = linear @ m.T / np.array([0.95047, 1.0, 1.08883])
+    d = 6 / 29
+    f = np.where(xyz > d ** 3, np.cbrt(xyz), xyz / (3 * d * d) + 4 / 29)
+    return np.stack([116 * f[..., 1] - 16, 500 * (f[..., 0] - f[..., 1]), 200 * (f[..., 1] - f[..., 2])], axis=-1)
+
+
+def delta_e(original: np.ndarray, candidate: np.ndarray) -> tuple[float, float]:
+    """Mean and 99th-percentile CIE76 difference over pixels visible in either image.
+
+    Both are composited over mid-grey first, so alpha errors count as colour errors.
+    """
+    def over_grey(rgba: np.ndarray) -> np.ndarray:
+        alpha = rgba[..., 3:4] / 255.0
+        return rgba[..., :3] * alpha + 128 * (1 - alpha)
+
+    visible = (original[..., 3] > 0) | (candidate[..., 3] > 0)
+    if not visible.any():
+        return 0.0, 0.0
+    diff = np.linalg.norm(srgb_to_lab(over_grey(original)[visible]) - srgb_to_lab(over_grey(candidate)[visible]), axis=-1)
+    return float(diff.mean()), float(np.percentile(diff, 99))
+
+
+def quantize(img: Image.Image, colors: int) -> np.ndarray:
+    # libimagequant gives far better palettes when Pillow is built with it; fast
+    # octree is the built-in fallback that still understands alpha. No dithering
+    # keeps flat pixel-art areas flat.
+    method = Image.Quantize.LIBIMAGEQUANT if features.check("libimagequant") else Image.Quantize.FASTOCTREE
+    quantized = img.quantize(colors=colors, method=method, dither=Image.Dither.NONE)
+    return np.array(quantized.convert("RGBA"))
+
+
+# --- Driver ----------------------------------------------------------------
+
+def optimize_file(filepath: str, lossy: bool = False, colors: int = COLORS,
+                  max_mean: float = MAX_MEAN_DELTA_E, max_p99: float = MAX_P99_DELTA_E) -> dict:
+    """Optimize one PNG in place; returns a report row (raises on unreadable files)."""
+    start = time.perf_counter()
+    before = os.path.getsize(filepath)
+    img = Image.open(filepath)
+    img.load()
+    rgba = np.array(img.convert("RGBA"))
+
+    data, label = smallest_lossless(rgba)
+    note = ""
+    if lossy:
+        candidate = quantize(img.convert("RGBA"), colors)
+        mean, p99 = delta_e(rgba, candidate)
+        if mean <= max_mean and p99 <= max_p99:
+            lossy_data, lossy_label = smallest_lossless(candidate)
+            if len(lossy_data) < len(data):
+                data, label = lossy_data, f"quantized{colors}:{lossy_label}"
+            note = f"dE mean {mean:.2f} p99 {p99:.2f}"
+        else:
+            note = f"quantize rejected (dE mean {mean:.2f} p99 {p99:.2f})"
+
+    if not lossy or not label.startswith("quantized"):
+        # Paranoia: the winner must decode to the original pixels exactly
+        decoded = np.array(Image.open(io.BytesIO(data)).convert("RGBA"))
+        if not np.array_equal(decoded, rgba):
+            raise ValueError(f"lossless re-encode of {filepath} changed pixels ({label})")
+
+    written = len(data) < before
+    if written:
+        with open(filepath, "wb") as f:
+            f.write(data)
+    return {
+        "file": display_path(filepath),
+        "before": before,
+        "after": len(data) if written else before,
+        "encoding": label if written else "unchanged",
+        "seconds": round(time.perf_counter() - start, 3),
+        "note": note,
+    }
+
+
+def display_path(filepath: str) -> str:
+    path = os.path.relpath(filepath, ASSETS_DIR)
+    return (os.path.relpath(filepath) if path.startswith("..") else path).replace(os.sep, "/")
+
+
+def try_optimize_file(filepath: str, **options) -> dict:
+    try:
+        return optimize_file(filepath, **options)
+    except Exception as e:
+        return {"file": display_path(filepath),
+                "error": f"{type(e).__name__}: {e}"}
+
+
+def collect_pngs(root: str = ASSETS_DIR) -> list[str]:
+    files = []
+    for dirpath, dirnames, fnames in os.walk(root):
+        # Published copies are named after their bytes; fingerprint_assets.py republishes what changed
+        dirnames[:] = sorted(d for d in dirnames if d != "hashed")
+        files.extend(os.path.join(dirpath, f) for f in sorted(fnames) if f.endswith(".png"))
+    return files
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="*", help="PNG files or directories (default: public/assets and build/assets)")
+    parser.add_argument("--lossy", action="store_true", help="allow palette quantization")
+    parser.add_argument("--colors", type=int, default=COLORS, help=f"palette size for --lossy (default: {COLORS})")
+    parser.add_argument("--max-mean-delta-e", type=float, default=MAX_MEAN_DELTA_E,
+                        help=f"reject quantization above this mean delta E (default: {MAX_MEAN_DELTA_E})")
+    parser.add_argument("--max-p99-delta-e", type=float, default=MAX_P99_DELTA_E,
+                        help=f"reject quantization above this 99th-percentile delta E (default: {MAX_P99_DELTA_E})")
+    parser.add_argument("-j", "--jobs", type=int, default=0,
+                        help="number of worker processes (default: 0 = one per CPU)")
+    parser.add_argument("--report", help="also write the per-file report as JSON to this path")
+    args = parser.parse_args()
+
+    files = []
+    for path in args.paths or [ASSETS_DIR, BUILD_DIR]:
+        files.extend(collect_pngs(path) if os.path.isdir(path) else [path])
+    options = {"lossy": args.lossy, "colors": args.colors,
+               "max_mean": args.max_mean_delta_e, "max_p99": args.max_p99_delta_e}
+    jobs = args.jobs or os.cpu_count() or 1
+
+    print(f"Optimizing {len(files)} PNGs ({'lossy' if args.lossy else 'lossless'}) with {jobs} job(s)...")
+    rows = []
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(try_optimize_file, f, **options) for f in files]
+        for i, future in enumerate(futures, 1):
+            row = future.result()
+            rows.append(row)
+            if "error" in row:
+                print(f"  [{i}/{len(files)}] {row['file']} -> FAILED: {row['error']}", file=sys.stderr)
+                continue
+            saved = row["before"] - row["after"]
+            print(f"  [{i}/{len(files)}] {row['file']}: {row['before'] / 1024:.0f} KB -> "
+                  f"{row['after'] / 1024:.0f} KB (-{saved / 1024:.0f} KB) "
+                  f"{row['encoding']} in {row['seconds']:.2f}s {row['note']}".rstrip())
+
+    ok = [r for r in rows if "error" not in r]
+    before = sum(r["before"] for r in ok)
+    after = sum(r["after"] for r in ok)
+    print(f"\nTotal: {before / (1024 * 1024):.2f} MB -> {after / (1024 * 1024):.2f} MB "
+          f"({(before - after) / max(1, before):.1%} saved), "
+          f"{sum(r['seconds'] for r in ok):.1f}s encode time")
+
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(rows, f, indent=2)
+            f.write("\n")
+
+    if len(ok) != len(rows):
+        sys.exit(1)
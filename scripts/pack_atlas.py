@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""Pack processed sprites into a Phaser multi-atlas.
+
+Run after remove_backgrounds.py. Every PNG in public/assets/sprites and
+public/assets/ui becomes a frame named after its file (the same names
+PreloadScene used as texture keys). Frames are shrunk to the size the game
+draws them at (see downscale_sprites.py and --density), trimmed to their
+alpha bounding box (see trim_sprites.py) and bin-packed into as few pages
+as fit in --max-size, and the pages plus one JSON file in Phaser's
+multiatlas format are written to build/assets/atlas/. Trimmed frames keep
+their canvas size and offset, so Phaser still positions them like the full
+canvas. Each frame records the factor it was shrunk by as "scale", which
+fingerprint_assets.py hands to the game as FRAME_SCALES. Each frame's
+collision box and hull (see hit_shapes.py) are written next to the atlas as
+hit_shapes.json.
+"""
+import argparse
+import json
+import os
+
+from PIL import Image
+
+from downscale_sprites import DENSITY, load_display_sprites
+from hit_shapes import build_hit_shapes, write_hit_shapes
+from trim_sprites import collect_sprites, trim
+
+BUILD_DIR = os.path.join(os.path.dirname(__file__), "..", "build", "assets")
+ATLAS_DIR = os.path.join(BUILD_DIR, "atlas")
+ATLAS_NAME = "sprites"
+
+MAX_SIZE = 2048  # safe maximum texture size for low-end WebGL devices
+PADDING = 2  # transparent gap between frames so linear filtering doesn't bleed
+
+
+class MaxRectsBin:
+    """MaxRects bin packer using the best-short-side-fit heuristic."""
+
+    def __init__(self, width: int, height: int):
+        self.free = [(0, 0, width, height)]
+
+    def insert(self, w: int, h: int) -> tuple[int, int] | None:
+        best = None
+        best_score = None
+        for fx, fy, fw, fh in self.free:
+            if w <= fw and h <= fh:
+                score = (min(fw - w, fh - h), max(fw - w, fh - h))
+                if best_score is None or score < best_score:
+                    best, best_score = (fx, fy), score
+        if best is None:
+            return None
+        self._split(best[0], best[1], w, h)
+        return best
+
+    def _split(self, x: int, y: int, w: int, h: int) -> None:
+        free = []
+        for fx, fy, fw, fh in self.free:
+            if x >= fx + fw or x + w <= fx or y >= fy + fh or y + h <= fy:
+                free.append((fx, fy, fw, fh))
+                continue
+            # Keep the parts of the free rect not covered by the placed rect
+            if x > fx:
+                free.append((fx, fy, x - fx, fh))
+            if x + w < fx + fw:
+                free.append((x + w, fy, fx + fw - x - w, fh))
+            if y > fy:
+                free.append((fx, fy, fw, y - fy))
+            if y + h < fy + fh:
+                free.append((fx, y + h, fw, fy + fh - y - h))
+        # Drop free rects fully contained in another one
+        self.free = [
+            a for i, a in enumerate(free)
+            if not any(
+                i != j and b[0] <= a[0] and b[1] <= a[1]
+                and a[0] + a[2] <= b[0] + b[2] and a[1] + a[3] <= b[1] + b[3]
+                and (a != b or j < i)
+                for j, b in enumerate(free)
+            )
+        ]
+
+
+def place(names: list[str], sizes: dict[str, tuple[int, int]], width: int, height: int, padding: int) -> dict[str, tuple[int, int]]:
+    """Place as many of names as fit in a width x height page, in order."""
+    # Padding is added to each frame's right/bottom, so the page gets one extra gap to absorb it
+    bin_ = MaxRectsBin(width + padding, height + padding)
+    page = {}
+    for name in names:
+        w, h = sizes[name]
+        pos = bin_.insert(w + padding, h + padding)
+        if pos is not None:
+            page[name] = pos
+    return page
+
+
+def shrink(names: list[str], sizes: dict[str, tuple[int, int]], max_size: int, padding: int) -> dict[str, tuple[int, int]]:
+    """Repack a page's frames into the smallest height, then width, that still holds all of them."""
+    def fits(width: int, height: int) -> dict[str, tuple[int, int]] | None:
+        page = place(names, sizes, width, height, padding)
+        return page if len(page) == len(names) else None
+
+    best = fits(max_size, max_size)
+    for axis in (1, 0):
+        lo = max(sizes[n][axis] for n in names)
+        hi = max_size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            dims = [max_size, max_size]
+            if best is not None:
+                dims = [max(x + sizes[n][0] for n, (x, y) in best.items()),
+                        max(y + sizes[n][1] for n, (x, y) in best.items())]
+            dims[axis] = mid
+            page = fits(*dims)
+            if page is not None:
+                best, hi = page, mid
+            else:
+                lo = mid + 1
+    return best
+
+
+def pack(sizes: dict[str, tuple[int, int]], max_size: int = MAX_SIZE, padding: int = PADDING) -> list[dict[str, tuple[int, int]]]:
+    """Assign every frame a page and position; returns one {name: (x, y)} dict per page."""
+    for name, (w, h) in sizes.items():
+        if w > max_size or h > max_size:
+            raise ValueError(f"{name} ({w}x{h}) does not fit in a {max_size}px atlas page")
+
+    # Largest first gives the packer the most freedom; names break ties deterministically
+    remaining = sorted(sizes, key=lambda n: (-max(sizes[n]), -sizes[n][0] * sizes[n][1], n))
+    pages = []
+    while remaining:
+        page = place(remaining, sizes, max_size, max_size, padding)
+        pages.append(shrink([n for n in remaining if n in page], sizes, max_size, padding))
+        remaining = [n for n in remaining if n not in page]
+    return pages
+
+
+def build_atlas(
+    sprites: dict[str, str],
+    max_size: int = MAX_SIZE,
+    padding: int = PADDING,
+    trim_padding: int | None = 0,
+    density: float = DENSITY,
+) -> tuple[list[Image.Image], dict]:
+    """Pack sprites into page images and the matching Phaser multiatlas JSON.
+
+    trim_padding=None packs the full canvases untrimmed.
+    """
+    images, scales = load_display_sprites(sprites, density)
+    return build_atlas_from_images(images, max_size, padding, trim_padding, scales)
+
+
+def build_atlas_from_images(
+    images: dict[str, Image.Image],
+    max_size: int = MAX_SIZE,
+    padding: int = PADDING,
+    trim_padding: int | None = 0,
+    scales: dict[str, float] | None = None,
+) -> tuple[list[Image.Image], dict]:
+    """build_atlas for sprites already decoded (RGBA) at display size, e.g. kept in memory by a watcher.
+
+    scales holds the factor each one was shrunk by (1 if left out).
+    """
+    scales = scales or {}
+    if trim_padding is None:
+        trim_meta = {
+            name: {
+                "trimmed": False,
+                "sourceSize": {"w": img.width, "h": img.height},
+                "spriteSourceSize": {"x": 0, "y": 0, "w": img.width, "h": img.height},
+            }
+            for name, img in images.items()
+        }
+    else:
+        images, trim_meta = trim(images, trim_padding)
+    layout = pack({name: img.size for name, img in images.items()}, max_size, padding)
+
+    pages = []
+    textures = []
+    for i, page in enumerate(layout):
+        # Shrink the page to the area actually used
+        width = max(x + images[n].width for n, (x, y) in page.items())
+        height = max(y + images[n].height for n, (x, y) in page.items())
+        sheet = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+        frames = []
+        for name in sorted(page):
+            x, y = page[name]
+            img = images[name]
+            sheet.paste(img, (x, y))
+            frames.append({
+                "filename": name,
+                "rotated": False,
+                **trim_meta[name],
+                "frame": {"x": x, "y": y, "w": img.width, "h": img.height},
+                "scale": round(scales.get(name, 1.0), 6),
+            })
+        pages.append(sheet)
+        textures.append({
+            "image": f"{ATLAS_NAME}-{i}.png",
+            "format": "RGBA8888",
+            "size": {"w": width, "h": height},
+            "scale": 1,
+            "frames": frames,
+        })
+
+    atlas = {"textures": textures, "meta": {"app": "scripts/pack_atlas.py", "version": "1.0"}}
+    return pages, atlas
+
+
+def write_atlas(pages: list[Image.Image], atlas: dict, only: set[int] | None = None, **save_options) -> list[str]:
+    """Write the page images (or just the indices in `only`) and the JSON; returns the paths written.
+
+    Pages left over from an earlier atlas with more pages are deleted, along with their WebP copies.
+    """
+    os.makedirs(ATLAS_DIR, exist_ok=True)
+    current = {os.path.splitext(texture["image"])[0] for texture in atlas["textures"]}
+    for fname in os.listdir(ATLAS_DIR):
+        stem, ext = os.path.splitext(fname)
+        if stem.startswith(f"{ATLAS_NAME}-") and ext in (".png", ".webp") and stem not in current:
+            os.remove(os.path.join(ATLAS_DIR, fname))
+
+    written = []
+    for i, (texture, page) in enumerate(zip(atlas["textures"], pages)):
+        if only is None or i in only:
+            path = os.path.join(ATLAS_DIR, texture["image"])
+            page.save(path, **save_options)
+            written.append(path)
+    path = os.path.join(ATLAS_DIR, f"{ATLAS_NAME}.json")
+    with open(path, "w") as f:
+        json.dump(atlas, f, indent=2)
+        f.write("\n")
+    written.append(path)
+    return written
+
+
+def print_report(sprites: dict[str, str], pages: list[Image.Image], atlas: dict) -> None:
+    print("\nAtlas report:")
+    total_used = 0
+    total_area = 0
+    for texture, page in zip(atlas["textures"], pages):
+        used = sum(f["frame"]["w"] * f["frame"]["h"] for f in texture["frames"])
+        area = page.width * page.height
+        total_used += used
+        total_area += area
+        print(f"  {texture['image']}: {page.width}x{page.height}, "
+              f"{len(texture['frames'])} frames, {used / area:.1%} filled")
+    print(f"  Overall fill: {total_used / total_area:.1%}")
+    requests_after = len(pages) + 1  # pages plus the JSON
+    print(f"  Requests: {len(sprites)} images -> {requests_after} files "
+          f"({len(sprites) - requests_after} fewer)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--max-size", type=int, default=MAX_SIZE,
+                        help=f"maximum atlas page width/height (default: {MAX_SIZE})")
+    parser.add_argument("--padding", type=int, default=PADDING,
+                        help=f"pixels between frames (default: {PADDING})")
+    parser.add_argument("--trim-padding", type=int, default=0,
+                        help="transparent pixels kept around each trimmed frame (default: 0)")
+    parser.add_argument("--no-trim", action="store_true",
+                        help="pack the full sprite canvases without trimming")
+    parser.add_argument("--density", type=float, default=DENSITY,
+                        help=f"atlas pixels per displayed pixel (default: {DENSITY})")
+    args = parser.parse_args()
+
+    sprites = collect_sprites()
+    print(f"Packing {len(sprites)} sprites at {args.density:g}x display size...")
+    images, scales = load_display_sprites(sprites, args.density)
+    pages, atlas = build_atlas_from_images(images, args.max_size, args.padding,
+                                           None if args.no_trim else args.trim_padding, scales)
+
+    write_atlas(pages, atlas)
+    write_hit_shapes(build_hit_shapes(images))
+    print_report(sprites, pages, atlas)
+    print(f"\nDone! Wrote {len(pages)} page(s) to {os.path.relpath(ATLAS_DIR)}; "
+          f"run scripts/encode_webp.py and scripts/fingerprint_assets.py to publish them to the game.")
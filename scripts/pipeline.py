@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""Chain generation and post-processing so each image is written to disk once.
+
+Pipeline.wrap(generate) returns a drop-in generate_image replacement: the
+generator writes its raw output to a scratch file, which is decoded once and
+run through the configured stages in memory, and only the final image is
+encoded to save_path. The stages are image -> image functions from STAGES,
+each with a predicate for which outputs it applies to:
+
+  remove_background  the edge flood fill from remove_backgrounds.py, for the
+                     same files that script would process
+
+--optimize encodes the final image with optimize_pngs.py's smallest lossless
+encoding instead of a plain PNG save, and --keep-intermediates DIR saves the
+image after every stage for debugging. Files that went through
+remove_background are recorded in remove_backgrounds.py's manifest, so a
+later run of that script skips them.
+"""
+import argparse
+import functools
+import os
+import shutil
+import tempfile
+import threading
+from collections.abc import Callable
+
+import numpy as np
+from PIL import Image
+
+import remove_backgrounds
+from optimize_pngs import smallest_lossless
+from tracing import span
+
+# name -> (transform, applies_to(save_path))
+STAGES: dict[str, tuple[Callable[[Image.Image], Image.Image], Callable[[str], bool]]] = {
+    "remove_background": (remove_backgrounds.flood_fill_transparency, remove_backgrounds.wants_background_removed),
+}
+DEFAULT_STAGES = ["remove_background"]
+
+
+class Pipeline:
+    def __init__(self, stages: list[str] = DEFAULT_STAGES, optimize: bool = False, keep_dir: str | None = None):
+        unknown = [s for s in stages if s not in STAGES]
+        if unknown:
+            raise ValueError(f"Unknown pipeline stage(s): {', '.join(unknown)}")
+        self.stages = list(stages)
+        self.optimize = optimize
+        self.keep_dir = keep_dir
+        self.background_removed: dict[str, str] = {}  # save_path -> output hash
+        self._lock = threading.Lock()
+
+    def process(self, img: Image.Image, save_path: str) -> tuple[Image.Image, list[str]]:
+        """Run every stage that applies to save_path; returns the result and the stages applied."""
+        applied = []
+        name = os.path.basename(save_path)[:-4]
+        for stage in self.stages:
+            transform, applies_to = STAGES[stage]
+            if not applies_to(save_path):
+                continue
+            with span(stage):
+                img = transform(img)
+            applied.append(stage)
+            if self.keep_dir:
+                os.makedirs(self.keep_dir, exist_ok=True)
+                img.save(os.path.join(self.keep_dir, f"{name}.{len(applied)}-{stage}.png"))
+        return img, applied
+
+    def encode(self, img: Image.Image, save_path: str) -> None:
+        """Write img to save_path atomically, so a crash never leaves a half-written sprite."""
+        dirpath = os.path.dirname(save_path) or "."
+        os.makedirs(dirpath, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=dirpath, suffix=".tmp")
+        with span("encode"):
+            if self.optimize:
+                data, _ = smallest_lossless(np.array(img.convert("RGBA")))
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+            else:
+                os.close(fd)
+                img.save(tmp, format="PNG")
+        os.replace(tmp, save_path)
+
+    def wrap(self, generate: Callable[..., dict]) -> Callable[..., dict]:
+        """Return a drop-in replacement for generate that post-processes before writing."""
+        @functools.wraps(generate)
+        def chained_generate(
+            prompt: dict,
+            save_path: str,
+            width: int = 512,
+            height: int = 512,
+            seed: int | None = None,
+            input_images: list[str] | None = None,
+        ) -> dict:
+            scratch = tempfile.mkdtemp(prefix="pipeline-")
+            try:
+                raw_path = os.path.join(scratch, os.path.basename(save_path))
+                result = generate(
+                    prompt=prompt,
+                    save_path=raw_path,
+                    width=width,
+                    height=height,
+                    seed=seed,
+                    input_images=input_images,
+                )
+                raw_path = result.get("save_path", raw_path)
+                if self.keep_dir:
+                    os.makedirs(self.keep_dir, exist_ok=True)
+                    shutil.copyfile(raw_path, os.path.join(self.keep_dir, f"{os.path.basename(save_path)[:-4]}.0-raw.png"))
+
+                if not self.optimize and not any(STAGES[s][1](save_path) for s in self.stages):
+                    # Nothing to do: move the generator's file into place without decoding it
+                    os.makedirs(os.path.dirname(save_path) or ".", exist_ok=True)
+                    shutil.move(raw_path, save_path)
+                    return {**result, "save_path": save_path, "stages": []}
+
+                with span("decode"):
+                    img = Image.open(raw_path)
+                    img.load()
+                img, applied = self.process(img, save_path)
+                self.encode(img, save_path)
+            finally:
+                shutil.rmtree(scratch, ignore_errors=True)
+
+            if "remove_background" in applied:
+                with self._lock:
+                    self.background_removed[save_path] = remove_backgrounds.file_hash(save_path)
+            return {**result, "save_path": save_path, "stages": applied}
+        return chained_generate
+
+    def save_manifest(self) -> None:
+        """Record background-removed outputs so remove_backgrounds.py doesn't redo them."""
+        if not self.background_removed:
+            return
+        manifest = remove_backgrounds.load_manifest()
+        for path, digest in self.background_removed.items():
+            manifest["files"][remove_backgrounds.manifest_key(path)] = digest
+        remove_backgrounds.save_manifest(manifest)
+
+    def removes_backgrounds(self) -> bool:
+        return "remove_background" in self.stages
+
+
+def parse_stages(value: str) -> list[str]:
+    stages = [s.strip() for s in value.split(",") if s.strip()]
+    unknown = [s for s in stages if s not in STAGES]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown stage(s): {', '.join(unknown)}")
+    return stages
+
+
+def add_pipeline_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--stages", type=parse_stages, default=DEFAULT_STAGES,
+                        help=f"comma-separated post-processing stages from: {', '.join(STAGES)} "
+                             f"(default: {','.join(DEFAULT_STAGES)}; '' writes raw output)")
+    parser.add_argument("--optimize", action="store_true",
+                        help="write the final PNGs with optimize_pngs.py's smallest lossless encoding")
+    parser.add_argument("--keep-intermediates", metavar="DIR",
+                        help="also save the raw output and every stage's result to DIR")
+
+
+def pipeline_from_args(args: argparse.Namespace) -> Pipeline:
+    return Pipeline(args.stages, args.optimize, args.keep_intermediates)
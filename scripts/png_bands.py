@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Read and write PNGs a band of rows at a time, for images too big to hold decoded.
+
+PNGBandReader inflates the IDAT stream incrementally and yields RGBA bands of
+at most `rows` rows. PIL does the unfiltering: each band's filtered
+scanlines are wrapped in a tiny PNG whose first row is the previous band's
+last row (unfiltered), so Up/Average/Paeth rows at the top of the band see
+the right prior row. The result converts to RGBA exactly like
+Image.open(path).convert("RGBA").
+
+PNGBandWriter streams RGBA bands into an 8-bit RGBA PNG with the same
+per-row adaptive filtering as optimize_pngs.filter_scanlines.
+
+Interlaced and 16-bit PNGs, and greyscale PNGs below 8 bits with a
+transparent colour key, raise UnsupportedPNGError. Callers fall back to
+decoding the whole image with PIL.
+"""
+import io
+import struct
+import zlib
+from collections.abc import Iterator
+from typing import BinaryIO
+
+import numpy as np
+from PIL import Image
+
+from optimize_pngs import PNG_SIGNATURE, filter_scanlines, png_chunk
+
+READ_SIZE = 1 << 16  # compressed bytes read from the file at a time
+IDAT_SIZE = 1 << 16  # compressed bytes per IDAT chunk written
+
+CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}  # samples per pixel by colour type
+# An 8-bit colour type with the same bytes per pixel, so PIL unfilters any
+# scanline byte-for-byte: bpp -> colour type
+RAW_TYPES = {1: 0, 2: 4, 3: 2, 4: 6}
+
+
+class UnsupportedPNGError(ValueError):
+    pass
+
+
+class PNGBandReader:
+    def __init__(self, path: str):
+        self.path = path
+        self.palette: np.ndarray | None = None
+        self.transparency: bytes | None = None
+        with open(path, "rb") as f:
+            if f.read(len(PNG_SIGNATURE)) != PNG_SIGNATURE:
+                raise UnsupportedPNGError(f"{path} is not a PNG")
+            while True:
+                tag, data = self._read_chunk(f)
+                if tag == b"IHDR":
+                    (self.width, self.height, self.bit_depth, self.color_type,
+                     _, _, interlace) = struct.unpack(">IIBBBBB", data)
+                elif tag == b"PLTE":
+                    self.palette = np.frombuffer(data, dtype=np.uint8).reshape(-1, 3)
+                elif tag == b"tRNS":
+                    self.transparency = data
+                elif tag in (b"IDAT", b"IEND"):
+                    break
+
+        if interlace:
+            raise UnsupportedPNGError("interlaced PNGs can't be read in bands")
+        if self.bit_depth == 16:
+            raise UnsupportedPNGError("16-bit PNGs can't be read in bands")
+        if self.color_type == 0 and self.bit_depth < 8 and self.transparency:
+            raise UnsupportedPNGError("low bit depth greyscale with a colour key can't be read in bands")
+        bits = CHANNELS[self.color_type] * self.bit_depth
+        self.stride = (self.width * bits + 7) // 8
+        self.bpp = max(1, bits // 8)
+
+    @staticmethod
+    def _read_chunk(f: BinaryIO) -> tuple[bytes, bytes]:
+        length, tag = struct.unpack(">I4s", f.read(8))
+        data = f.read(length)
+        f.read(4)  # CRC; zlib catches corrupt image data
+        return tag, data
+
+    def _idat(self) -> Iterator[bytes]:
+        """The concatenated IDAT payloads, READ_SIZE bytes at a time."""
+        with open(self.path, "rb") as f:
+            f.seek(len(PNG_SIGNATURE))
+            seen_idat = False
+            while True:
+                length, tag = struct.unpack(">I4s", f.read(8))
+                if tag != b"IDAT":
+                    if seen_idat or tag == b"IEND":
+                        return
+                    f.seek(length + 4, io.SEEK_CUR)
+                    continue
+                seen_idat = True
+                while length:
+                    data = f.read(min(length, READ_SIZE))
+                    length -= len(data)
+                    yield data
+                f.read(4)
+
+    def _unfilter(self, filtered: bytes, rows: int, prior: bytes) -> np.ndarray:
+        """Undo the PNG filters of `rows` scanlines whose previous row is `prior`."""
+        ihdr = struct.pack(">IIBBBBB", self.stride // self.bpp, rows + 1, 8, RAW_TYPES[self.bpp], 0, 0, 0)
+        png = (PNG_SIGNATURE + png_chunk(b"IHDR", ihdr)
+               + png_chunk(b"IDAT", zlib.compress(b"\x00" + prior + filtered, 0)) + png_chunk(b"IEND", b""))
+        with Image.open(io.BytesIO(png)) as img:
+            raw = np.frombuffer(img.tobytes(), dtype=np.uint8)
+        return raw.reshape(rows + 1, self.stride)[1:]
+
+    def _to_rgba(self, raw: np.ndarray) -> np.ndarray:
+        n, w = raw.shape[0], self.width
+        if self.bit_depth < 8:
+            per_byte = 8 // self.bit_depth
+            shifts = np.arange(per_byte - 1, -1, -1, dtype=np.uint8) * self.bit_depth
+            samples = (raw[:, :, None] >> shifts) & ((1 << self.bit_depth) - 1)
+            samples = samples.reshape(n, -1)[:, :w]
+        else:
+            samples = raw.reshape(n, w, CHANNELS[self.color_type])
+
+        rgba = np.empty((n, w, 4), dtype=np.uint8)
+        if self.color_type == 3:
+            lut = np.zeros((256, 4), dtype=np.uint8)
+            lut[:, 3] = 255
+            lut[:len(self.palette), :3] = self.palette
+            if self.transparency:
+                lut[:len(self.transparency), 3] = np.frombuffer(self.transparency, dtype=np.uint8)
+            return lut[samples if self.bit_depth < 8 else samples[..., 0]]
+        if self.color_type in (0, 4):
+            grey = samples if self.bit_depth < 8 else samples[..., 0]
+            rgba[..., :3] = (grey * (255 // ((1 << self.bit_depth) - 1)))[..., None]
+            rgba[..., 3] = samples[..., 1] if self.color_type == 4 else 255
+            if self.color_type == 0 and self.transparency:
+                rgba[grey == struct.unpack(">H", self.transparency)[0], 3] = 0
+            return rgba
+        rgba[..., :3] = samples[..., :3]
+        rgba[..., 3] = samples[..., 3] if self.color_type == 6 else 255
+        if self.color_type == 2 and self.transparency:
+            key = np.array(struct.unpack(">HHH", self.transparency), dtype=np.uint16)
+            rgba[(samples == key).all(axis=2), 3] = 0
+        return rgba
+
+    def bands(self, rows: int) -> Iterator[np.ndarray]:
+        """Yield the image as RGBA arrays of `rows` rows (the last band may be shorter)."""
+        inflate = zlib.decompressobj()
+        chunks = self._idat()
+        prior = bytes(self.stride)
+        for y in range(0, self.height, rows):
+            n = min(rows, self.height - y)
+            want = n * (self.stride + 1)
+            parts, have = [], 0
+            while have < want:
+                data = inflate.unconsumed_tail or next(chunks, b"")
+                if not data:
+                    raise ValueError(f"{self.path}: image data ends at row {y}")
+                part = inflate.decompress(data, want - have)
+                parts.append(part)
+                have += len(part)
+            raw = self._unfilter(b"".join(parts), n, prior)
+            prior = raw[-1].tobytes()
+            yield self._to_rgba(raw)
+
+
+class PNGBandWriter:
+    """Write an 8-bit RGBA PNG to f one band of rows at a time."""
+
+    def __init__(self, f: BinaryIO, width: int, height: int, level: int = 6):
+        self.f = f
+        self.width = width
+        self._deflate = zlib.compressobj(level)
+        self._pending: list[bytes] = []
+        self._pending_size = 0
+        self._prior: np.ndarray | None = None
+        f.write(PNG_SIGNATURE + png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)))
+
+    def _emit(self, data: bytes, final: bool = False) -> None:
+        if data:
+            self._pending.append(data)
+            self._pending_size += len(data)
+        if self._pending and (final or self._pending_size >= IDAT_SIZE):
+            self.f.write(png_chunk(b"IDAT", b"".join(self._pending)))
+            self._pending, self._pending_size = [], 0
+
+    def write(self, rgba: np.ndarray) -> None:
+        raw = rgba.reshape(rgba.shape[0], self.width * 4)
+        if self._prior is None:
+            data = filter_scanlines(raw, 4, "adaptive")
+        else:
+            # Filter with the previous band's last row above, then drop that row
+            data = filter_scanlines(np.vstack([self._prior, raw]), 4, "adaptive")[raw.shape[1] + 1:]
+        self._prior = raw[-1:].copy()
+        self._emit(self._deflate.compress(data))
+
+    def close(self) -> None:
+        self._emit(self._deflate.flush(), final=True)
+        self.f.write(png_chunk(b"IEND", b""))
@@ -1,21 +1,76 @@
 #!/usr/bin/env python3
 """Remove black backgrounds from all sprite PNGs using edge flood-fill."""
+import argparse
+import hashlib
+import json
 import os
+import sys
+import tempfile
 from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 from PIL import Image
+from scipy import ndimage, sparse
+from scipy.sparse import csgraph
+
+from png_bands import PNGBandReader, PNGBandWriter, UnsupportedPNGError
+from tracing import add_tracing_arguments, finish_tracing, span, traced_map, tracing_from_args
 
 THRESHOLD = 40  # pixels with R,G,B all below this are considered "black"
 
 SPRITE_DIR = os.path.join(os.path.dirname(__file__), "..", "public", "assets", "sprites")
 BG_DIR = os.path.join(os.path.dirname(__file__), "..", "public", "assets", "backgrounds")
+ASSETS_DIR = os.path.join(os.path.dirname(__file__), "..", "public", "assets")
+
+# Records the hash of every processed output plus the settings used, so reruns skip them
+MANIFEST_PATH = os.path.join(ASSETS_DIR, ".remove_backgrounds.json")
+
+ENGINES = ("numpy", "banded", "reference")
+
+BAND_MEMORY_MB = 64  # default working-memory cap of the banded engine
+BAND_BYTES_PER_PIXEL = 256  # its peak working set (RSS) per pixel of a band, measured
 
 
 def is_near_black(r: int, g: int, b: int) -> bool:
     return r < THRESHOLD and g < THRESHOLD and b < THRESHOLD
 
 
-def flood_fill_transparency(img: Image.Image) -> Image.Image:
+def flood_fill_transparency(img: Image.Image, engine: str = "numpy",
+                            max_memory_mb: float = BAND_MEMORY_MB) -> Image.Image:
     """Flood-fill from all edges to make connected near-black pixels transparent."""
+    if engine == "numpy":
+        return flood_fill_numpy(img)
+    if engine == "banded":
+        return flood_fill_banded(img, max_memory_mb)
+    if engine == "reference":
+        return flood_fill_reference(img)
+    raise ValueError(f"Unknown flood-fill engine: {engine!r}")
+
+
+def flood_fill_numpy(img: Image.Image) -> Image.Image:
+    """Vectorized flood fill: label near-black regions and clear the edge-touching ones.
+
+    Produces the same pixels as flood_fill_reference (4-connectivity, filled
+    pixels become (0, 0, 0, 0)) without per-pixel Python work.
+    """
+    arr = np.array(img.convert("RGBA"))
+    mask = (arr[..., :3] < THRESHOLD).all(axis=2)
+
+    # Default structuring element is the 4-connected cross, same as the BFS
+    labels, count = ndimage.label(mask)
+    edge_labels = np.concatenate((labels[0], labels[-1], labels[:, 0], labels[:, -1]))
+    touches_edge = np.zeros(count + 1, dtype=bool)
+    touches_edge[edge_labels] = True
+    touches_edge[0] = False  # label 0 is "not near-black"
+
+    arr[touches_edge[labels]] = 0
+    return Image.fromarray(arr, "RGBA")
+
+
+def flood_fill_reference(img: Image.Image) -> Image.Image:
+    """Original pure-Python BFS, kept as the reference the numpy engine is checked against."""
     img = img.convert("RGBA")
     pixels = img.load()
     w, h = img.size
@@ -52,28 +107,306 @@ def flood_fill_transparency(img: Image.Image) -> Image.Image:
     return img
 
 
-def process_file(filepath: str) -> None:
-    img = Image.open(filepath)
-    result = flood_fill_transparency(img)
-    result.save(filepath)
+def band_rows(width: int, max_memory_mb: float = BAND_MEMORY_MB) -> int:
+    """Rows per band that keep the banded engine's working set under max_memory_mb."""
+    return max(1, int(max_memory_mb * 1024 * 1024) // (width * BAND_BYTES_PER_PIXEL))
 
 
-if __name__ == "__main__":
+def _label_band(band: np.ndarray, first: bool, last: bool) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Label the near-black regions of one band.
+
+    Returns (labels, crossing, on_edge): crossing are the sorted labels that
+    touch the band's top or bottom row and so may continue into the next
+    band, and on_edge flags the labels that touch the image edge in this band.
+    """
+    mask = (band[..., :3] < THRESHOLD).all(axis=2)
+    labels, count = ndimage.label(mask)
+    crossing = np.unique(np.concatenate((labels[0], labels[-1])))
+    crossing = crossing[crossing != 0]
+    on_edge = np.zeros(count + 1, dtype=bool)
+    on_edge[labels[:, 0]] = True
+    on_edge[labels[:, -1]] = True
+    if first:
+        on_edge[labels[0]] = True
+    if last:
+        on_edge[labels[-1]] = True
+    on_edge[0] = False
+    return labels, crossing, on_edge
+
+
+def fill_bands(open_bands: Callable[[], Iterable[np.ndarray]], height: int) -> Iterator[tuple[np.ndarray, bool]]:
+    """Flood-fill an image that is only ever held one band of rows at a time.
+
+    open_bands() must yield the same RGBA bands, top to bottom, every time it
+    is called; it is called twice. The first pass labels each band on its
+    own. Every region that crosses a band border becomes a node of a graph,
+    joined to the regions it touches in the band above, so the graph's
+    connected components are the image's regions and each one reaches the
+    edge if any of its nodes does. No per-pixel state outlives a band: the
+    graph has at most one node per near-black run along each border row.
+    The second pass labels each band again and clears the regions that reach
+    the edge, giving exactly the pixels of flood_fill_numpy.
+
+    Yields (band, changed) for every band of the second pass, filled in place.
+    """
+    node_on_edge = []
+    joins = []
+    above = None  # node of each pixel in the previous band's bottom row, -1 for none
+    y = total = 0
+    for band in open_bands():
+        labels, crossing, on_edge = _label_band(band, y == 0, y + len(band) == height)
+        node = np.full(len(on_edge), -1, dtype=np.int64)
+        node[crossing] = total + np.arange(len(crossing))
+        if above is not None:
+            top = node[labels[0]]
+            touching = (above >= 0) & (top >= 0)
+            joins.append(np.unique(np.stack((above[touching], top[touching]), axis=1), axis=0))
+        above = node[labels[-1]]
+        node_on_edge.append(on_edge[crossing])
+        total += len(crossing)
+        y += len(band)
+
+    fills = np.zeros(0, dtype=bool)
+    if total:
+        pairs = np.concatenate(joins) if joins else np.zeros((0, 2), dtype=np.int64)
+        graph = sparse.coo_matrix((np.ones(len(pairs), dtype=bool), (pairs[:, 0], pairs[:, 1])), shape=(total, total))
+        _, component = csgraph.connected_components(graph, directed=False)
+        fills = (np.bincount(component, weights=np.concatenate(node_on_edge)) > 0)[component]
+
+    y = start = 0
+    for band in open_bands():
+        labels, crossing, on_edge = _label_band(band, y == 0, y + len(band) == height)
+        on_edge[crossing] = fills[start:start + len(crossing)]
+        start += len(crossing)
+        fill = on_edge[labels]
+        changed = bool(band[fill].any())
+        band[fill] = 0
+        y += len(band)
+        yield band, changed
+
+
+def flood_fill_banded(img: Image.Image, max_memory_mb: float = BAND_MEMORY_MB) -> Image.Image:
+    """fill_bands over an in-memory image: the labelling works within max_memory_mb."""
+    arr = np.array(img.convert("RGBA"))
+    rows = band_rows(arr.shape[1], max_memory_mb)
+    for _ in fill_bands(lambda: (arr[y:y + rows] for y in range(0, len(arr), rows)), len(arr)):
+        pass
+    return Image.fromarray(arr, "RGBA")
+
+
+def fill_png_banded(filepath: str, max_memory_mb: float = BAND_MEMORY_MB) -> bool:
+    """Flood-fill the PNG at filepath in place, streaming it band by band; returns whether it changed.
+
+    Neither the source nor the result is ever decoded whole, so peak memory
+    stays around max_memory_mb whatever the image size. Raises
+    UnsupportedPNGError, before writing anything, for PNGs that can't be
+    streamed.
+    """
+    reader = PNGBandReader(filepath)
+    rows = band_rows(reader.width, max_memory_mb)
+    changed = False
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(filepath) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            writer = PNGBandWriter(f, reader.width, reader.height)
+            for band, band_changed in fill_bands(lambda: reader.bands(rows), reader.height):
+                writer.write(band)
+                changed |= band_changed
+            writer.close()
+        if changed:
+            os.replace(tmp, filepath)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return changed
+
+
+def engines_match(img: Image.Image, engine: str = "reference", max_memory_mb: float = BAND_MEMORY_MB) -> bool:
+    """Run the numpy engine and another on img and report whether their RGBA bytes are identical."""
+    return flood_fill_numpy(img).tobytes() == flood_fill_transparency(img, engine, max_memory_mb).tobytes()
+
+
+def file_hash(filepath: str) -> str:
+    with open(filepath, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def process_file(filepath: str, engine: str = "numpy", max_memory_mb: float = BAND_MEMORY_MB) -> str:
+    """Remove the background of filepath in place and return the hash of the result.
+
+    The file is only rewritten when the flood fill actually changes a pixel, so
+    already-processed sprites keep their bytes (and any recompression from
+    optimize_pngs.py) and don't churn in git. The banded engine streams the
+    file through fill_png_banded unless it is a PNG that can't be streamed.
+    """
+    with span(os.path.basename(filepath), cat="asset"):
+        streamed = False
+        if engine == "banded":
+            try:
+                with span("flood_fill", engine=engine):
+                    fill_png_banded(filepath, max_memory_mb)
+                streamed = True
+            except UnsupportedPNGError:
+                pass  # decode it whole, but still label it band by band
+        if not streamed:
+            with span("decode"):
+                img = Image.open(filepath)
+                img.load()
+            with span("flood_fill", engine=engine):
+                result = flood_fill_transparency(img, engine, max_memory_mb)
+            if result.tobytes() != img.convert("RGBA").tobytes():
+                with span("encode"):
+                    result.save(filepath)
+        with span("hash"):
+            return file_hash(filepath)
+
+
+def try_process_file(filepath: str, engine: str = "numpy",
+                     max_memory_mb: float = BAND_MEMORY_MB) -> tuple[str | None, str | None]:
+    """Process one file, returning (output hash, None) or (None, error message) instead of raising."""
+    try:
+        return process_file(filepath, engine, max_memory_mb), None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+def process_files(files: list[str], engine: str = "numpy", jobs: int = 1,
+                  max_memory_mb: float = BAND_MEMORY_MB) -> list[tuple[str | None, str | None]]:
+    """Process files across `jobs` worker processes.
+
+    Results come back in input order, one (hash, error) pair per file, and are
+    printed as they arrive so the log reads the same for any job count.
+    """
+    def report(i: int, filepath: str, error: str | None) -> None:
+        status = f" -> FAILED: {error}" if error else ""
+        print(f"  [{i}/{len(files)}] {os.path.basename(filepath)}{status}",
+              file=sys.stderr if error else sys.stdout)
+
+    if jobs <= 1:
+        results = []
+        for i, filepath in enumerate(files, 1):
+            digest, error = try_process_file(filepath, engine, max_memory_mb)
+            report(i, filepath, error)
+            results.append((digest, error))
+        return results
+
+    results = []
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        outcomes = traced_map(pool, try_process_file, files, [engine] * len(files), [max_memory_mb] * len(files))
+        for i, (filepath, (digest, error)) in enumerate(zip(files, outcomes), 1):
+            report(i, filepath, error)
+            results.append((digest, error))
+    return results
+
+
+def manifest_key(filepath: str) -> str:
+    return os.path.relpath(filepath, ASSETS_DIR).replace(os.sep, "/")
+
+
+def load_manifest() -> dict:
+    """Load the manifest, discarding it if it was written with different settings."""
+    try:
+        with open(MANIFEST_PATH) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {"threshold": THRESHOLD, "files": {}}
+    if manifest.get("threshold") != THRESHOLD:
+        return {"threshold": THRESHOLD, "files": {}}
+    return manifest
+
+
+def save_manifest(manifest: dict) -> None:
+    with open(MANIFEST_PATH, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def stale_files(files: list[str], manifest: dict) -> list[str]:
+    """Files that are new or whose bytes no longer match their recorded output hash."""
+    recorded = manifest["files"]
+    return [f for f in files if recorded.get(manifest_key(f)) != file_hash(f)]
+
+
+def wants_background_removed(filepath: str) -> bool:
+    """Whether filepath is one of the files this script processes."""
+    dirpath = os.path.realpath(os.path.dirname(filepath))
+    if dirpath not in (os.path.realpath(SPRITE_DIR), os.path.realpath(BG_DIR)):
+        return False
+    # Skip background images - they should keep their dark areas
+    return filepath.endswith(".png") and not os.path.basename(filepath).startswith("terrarium_")
+
+
+def collect_files() -> list[str]:
     files = []
     for dirpath in [SPRITE_DIR, BG_DIR]:
         if not os.path.isdir(dirpath):
             continue
         for fname in sorted(os.listdir(dirpath)):
-            if fname.endswith(".png"):
-                files.append(os.path.join(dirpath, fname))
+            files.append(os.path.join(dirpath, fname))
+    return [f for f in files if wants_background_removed(f)]
 
-    # Skip background images - they should keep their dark areas
-    files = [f for f in files if not os.path.basename(f).startswith("terrarium_")]
 
-    print(f"Processing {len(files)} sprites...")
-    for i, filepath in enumerate(files, 1):
-        name = os.path.basename(filepath)
-        print(f"  [{i}/{len(files)}] {name}")
-        process_file(filepath)
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("files", nargs="*", metavar="FILE",
+                        help="process these PNGs instead of every sprite, e.g. large source art")
+    parser.add_argument("--engine", choices=ENGINES, default="numpy",
+                        help="flood-fill implementation (default: numpy)")
+    parser.add_argument("--max-memory-mb", type=float, default=BAND_MEMORY_MB,
+                        help=f"working-memory cap per worker for --engine banded (default: {BAND_MEMORY_MB})")
+    parser.add_argument("--verify", action="store_true",
+                        help="diff the numpy engine against --engine (the reference BFS if that is numpy) "
+                             "without writing files")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="number of worker processes (default: 1, 0 = one per CPU)")
+    parser.add_argument("--force", action="store_true",
+                        help="reprocess every file, ignoring the manifest")
+    add_tracing_arguments(parser)
+    args = parser.parse_args()
+    tracing_from_args(args)
+    jobs = args.jobs or os.cpu_count() or 1
+
+    files = [os.path.abspath(f) for f in args.files] or collect_files()
+
+    if args.verify:
+        other = "reference" if args.engine == "numpy" else args.engine
+        print(f"Verifying the numpy engine against {other} on {len(files)} sprites...")
+        mismatches = []
+        for i, filepath in enumerate(files, 1):
+            name = os.path.basename(filepath)
+            with span(name, cat="asset"):
+                ok = engines_match(Image.open(filepath), other, args.max_memory_mb)
+            print(f"  [{i}/{len(files)}] {name}: {'ok' if ok else 'MISMATCH'}")
+            if not ok:
+                mismatches.append(name)
+        finish_tracing(args)
+        if mismatches:
+            print(f"\n{len(mismatches)} file(s) differ: {', '.join(mismatches)}", file=sys.stderr)
+            sys.exit(1)
+        print("\nDone! Both engines produce identical output.")
+        sys.exit(0)
+
+    manifest = load_manifest()
+    todo = list(files) if args.force else stale_files(files, manifest)
+    print(f"Processing {len(todo)} of {len(files)} sprites with {jobs} job(s) "
+          f"({len(files) - len(todo)} up to date)...")
+    results = process_files(todo, args.engine, jobs, args.max_memory_mb)
+
+    failed = []
+    for filepath, (digest, error) in zip(todo, results):
+        if error:
+            manifest["files"].pop(manifest_key(filepath), None)
+            failed.append(os.path.basename(filepath))
+        elif wants_background_removed(filepath):
+            manifest["files"][manifest_key(filepath)] = digest
+    if not args.files:
+        # Forget sprites that have been deleted since the last run
+        current = {manifest_key(f) for f in files}
+        manifest["files"] = {k: v for k, v in manifest["files"].items() if k in current}
+    save_manifest(manifest)
+    finish_tracing(args)
 
+    if failed:
+        print(f"\n{len(failed)} of {len(todo)} file(s) failed: {', '.join(failed)}", file=sys.stderr)
+        sys.exit(1)
     print("\nDone! All black backgrounds removed.")
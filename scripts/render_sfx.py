@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""Pre-render AudioManager's synthesized sound effects into one audio sprite.
+
+Every one-shot effect in src/game/managers/AudioManager.ts builds a fresh
+graph of oscillators, noise buffers, filters and gain automation on each
+call. This re-implements those recipes in NumPy, with the same frequencies,
+waveforms, envelopes and timings, and renders them offline into a single
+MP3 at build/assets/audio/sfx.mp3. Next to it, sfx.json maps each effect
+name to its slices ({"start", "duration"} in seconds). AudioManager then
+plays an effect as one AudioBufferSourceNode over a slice, and falls back
+to live synthesis if the sprite didn't load.
+
+Effects built from Math.random() noise are rendered as several seeded
+variants, and the ambient pentatonic notes as one slice per note. The game
+picks a slice at random, so repeats still vary. The ambient wind and drone
+loops are built once per game and stay live.
+
+Web Audio semantics reproduced here: the oscillator waveforms are
+band-limited like the browser's PeriodicWave (Fourier series up to
+Nyquist); gain ramps follow setValueAtTime / linearRampToValueAtTime /
+exponentialRampToValueAtTime; the lowpass biquad takes its Q in dB.
+
+Needs the lameenc package to encode MP3 (pip install lameenc). Run
+fingerprint_assets.py afterwards to publish the sprite to the game.
+"""
+import argparse
+import json
+import os
+from collections.abc import Callable
+
+import numpy as np
+from scipy import signal
+
+ROOT_DIR = os.path.join(os.path.dirname(__file__), "..")
+AUDIO_DIR = os.path.join(ROOT_DIR, "build", "assets", "audio")
+SPRITE_MP3 = os.path.join(AUDIO_DIR, "sfx.mp3")
+SPRITE_JSON = os.path.join(AUDIO_DIR, "sfx.json")
+
+SAMPLE_RATE = 44100
+BITRATE = 96  # kbps, mono
+GAP = 0.05  # seconds of silence around every slice
+NOISE_VARIANTS = 4
+
+# An MP3 decoder outputs the encoder's 576-sample delay before the audio, plus
+# 529 more samples if it doesn't trim its own decoder delay. Slices start after
+# the first and run on for the second, so either way nothing is cut: at worst
+# a few ms of the surrounding gap is played.
+ENCODER_DELAY = 576
+DECODER_DELAY = 529
+
+PENTATONIC = [261.63, 329.63, 392.00, 440.00, 523.25]  # C4, E4, G4, A4, C5
+
+
+# --- Web Audio building blocks -----------------------------------------------
+
+def oscillator(wave: str, freq: float | np.ndarray, n: int) -> np.ndarray:
+    """n samples of an OscillatorNode; freq may be a per-sample array (frequency automation)."""
+    freq = np.broadcast_to(np.asarray(freq, dtype=np.float64), (n,))
+    phase = 2 * np.pi * (np.cumsum(freq) - freq[0]) / SAMPLE_RATE
+    if wave == "sine":
+        return np.sin(phase)
+    # Band-limited Fourier series, the coefficients the Web Audio spec gives each waveform
+    harmonics = max(1, int(SAMPLE_RATE / 2 // freq.max()))
+    out = np.zeros(n)
+    for k in range(1, harmonics + 1):
+        if wave == "square":
+            b = 4 / (k * np.pi) if k % 2 else 0.0
+        elif wave == "sawtooth":
+            b = (-1) ** (k + 1) * 2 / (k * np.pi)
+        elif wave == "triangle":
+            b = 8 * np.sin(k * np.pi / 2) / (k * np.pi) ** 2
+        else:
+            raise ValueError(f"Unknown oscillator type: {wave!r}")
+        if b:
+            out += b * np.sin(k * phase)
+    return out
+
+
+def automation(events: list[tuple[str, float, float]], n: int) -> np.ndarray:
+    """n samples of an AudioParam driven by (kind, value, time) events.
+
+    kind is "set" (setValueAtTime), "linear" (linearRampToValueAtTime) or
+    "exp" (exponentialRampToValueAtTime); times are seconds from the start.
+    """
+    t = np.arange(n) / SAMPLE_RATE
+    out = np.zeros(n)
+    value, start = 0.0, 0.0
+    for kind, target, time in events:
+        span = (t >= start) & (t < time)
+        if kind == "linear":
+            out[span] = value + (target - value) * (t[span] - start) / (time - start)
+        elif kind == "exp":
+            out[span] = value * (target / value) ** ((t[span] - start) / (time - start))
+        else:
+            out[span] = value
+        value, start = target, time
+    out[t >= start] = value
+    return out
+
+
+def note(freq: float, wave: str, duration: float, peak: float) -> np.ndarray:
+    """AudioManager.playNote: a short attack to peak, then an exponential decay, then stop."""
+    n = round(duration * SAMPLE_RATE)
+    attack = min(0.01, duration * 0.1)
+    gain = automation([("set", 0, 0), ("linear", peak, attack), ("exp", 0.001, duration)], n)
+    return oscillator(wave, freq, n) * gain
+
+
+def mix(parts: list[tuple[float, np.ndarray]]) -> np.ndarray:
+    """Sum (start seconds, samples) parts into one buffer."""
+    n = max(round(start * SAMPLE_RATE) + len(samples) for start, samples in parts)
+    out = np.zeros(n)
+    for start, samples in parts:
+        i = round(start * SAMPLE_RATE)
+        out[i:i + len(samples)] += samples
+    return out
+
+
+def arpeggio(freqs: list[float], wave: str, step: float, duration: float, peak: float) -> np.ndarray:
+    return mix([(i * step, note(f, wave, duration, peak)) for i, f in enumerate(freqs)])
+
+
+def brown_noise(n: int, rng: np.random.Generator) -> np.ndarray:
+    """The leaky-integrated white noise of playFoodDrop, normalized to a peak of 1."""
+    white = rng.random(n) * 2 - 1
+    noise = signal.lfilter([0.02], [1, -0.99], white)
+    peak = np.abs(noise).max()
+    return noise / peak if peak > 0 else noise
+
+
+def lowpass(samples: np.ndarray, freq: float, q_db: float = 1.0) -> np.ndarray:
+    """BiquadFilterNode type 'lowpass' (Q in dB, default 1)."""
+    w0 = 2 * np.pi * freq / SAMPLE_RATE
+    alpha = np.sin(w0) / (2 * 10 ** (q_db / 20))
+    cos = np.cos(w0)
+    b = [(1 - cos) / 2, 1 - cos, (1 - cos) / 2]
+    a = [1 + alpha, -2 * cos, 1 - alpha]
+    return signal.lfilter(b, a, samples)
+
+
+# --- Recipes, one per AudioManager method --------------------------------------
+
+def coin_collect(variant: int) -> np.ndarray:
+    return arpeggio([523.25, 659.25, 783.99], "sine", 0.08, 0.08, 0.3)  # C5, E5, G5
+
+
+def animal_death(variant: int) -> np.ndarray:
+    return arpeggio([523.25, 440.00, 349.23], "sine", 0.2, 0.2, 0.25)  # C5, A4, F4
+
+
+def animal_grow(variant: int) -> np.ndarray:
+    freqs = [261.63, 329.63, 392.00, 523.25, 659.25]  # C4, E4, G4, C5, E5
+    # 70% sine, 30% triangle
+    return arpeggio(freqs, "sine", 0.1, 0.1, 0.25 * 0.7) + arpeggio(freqs, "triangle", 0.1, 0.1, 0.25 * 0.3)
+
+
+def food_drop(variant: int) -> np.ndarray:
+    duration = 0.15
+    n = int(SAMPLE_RATE * duration)
+    noise = lowpass(brown_noise(n, np.random.default_rng(variant)), 400)
+    return noise * automation([("set", 0, 0), ("linear", 0.4, 0.01), ("exp", 0.001, duration)], n)
+
+
+def eating(variant: int) -> np.ndarray:
+    n = round(0.1 * SAMPLE_RATE)
+    # A looped 4096-sample white noise buffer
+    noise = np.resize(np.random.default_rng(variant).random(4096) * 2 - 1, n)
+    return noise * automation([("set", 0, 0), ("linear", 0.15, 0.01), ("set", 0.15, 0.07), ("linear", 0, 0.1)], n)
+
+
+def poacher_alert(variant: int) -> np.ndarray:
+    n = round(0.3 * SAMPLE_RATE)
+    pulse = oscillator("sine", 120, n) * automation([("set", 0, 0), ("linear", 0.4, 0.02), ("exp", 0.001, 0.3)], n)
+    return mix([(0, pulse), (0.45, pulse)])
+
+
+def poacher_hit(variant: int) -> np.ndarray:
+    n = round(0.15 * SAMPLE_RATE)
+    freq = automation([("set", 100, 0), ("linear", 60, 0.15)], n)
+    return oscillator("sine", freq, n) * automation([("set", 0.5, 0), ("exp", 0.001, 0.15)], n)
+
+
+def win(variant: int) -> np.ndarray:
+    return arpeggio([523.25, 659.25, 783.99, 1046.50], "triangle", 0.18, 0.2, 0.35)  # C5, E5, G5, C6
+
+
+def game_over(variant: int) -> np.ndarray:
+    return arpeggio([523.25, 440.00, 349.23, 293.66], "sine", 0.28, 0.3, 0.25)  # C5, A4, F4, D4
+
+
+def purchase(variant: int) -> np.ndarray:
+    n = round(0.2 * SAMPLE_RATE)
+    return oscillator("sine", 1047, n) * automation([("set", 0.4, 0), ("exp", 0.001, 0.2)], n)
+
+
+def ambient_note(variant: int) -> np.ndarray:
+    return note(PENTATONIC[variant], "sine", 1.5, 0.12)
+
+
+# name -> (recipe(variant), number of variants); names are what AudioManager asks for
+EFFECTS: dict[str, tuple[Callable[[int], np.ndarray], int]] = {
+    "coin_collect": (coin_collect, 1),
+    "animal_death": (animal_death, 1),
+    "animal_grow": (animal_grow, 1),
+    "food_drop": (food_drop, NOISE_VARIANTS),
+    "eating": (eating, NOISE_VARIANTS),
+    "poacher_alert": (poacher_alert, 1),
+    "poacher_hit": (poacher_hit, 1),
+    "win": (win, 1),
+    "game_over": (game_over, 1),
+    "purchase": (purchase, 1),
+    "ambient_note": (ambient_note, len(PENTATONIC)),
+}
+
+
+# --- Sprite -------------------------------------------------------------------
+
+def render_sprite() -> tuple[np.ndarray, dict[str, list[dict]]]:
+    """Lay every effect variant out in one buffer; returns (samples, slice map)."""
+    gap = np.zeros(round(GAP * SAMPLE_RATE))
+    parts = [gap]
+    cursor = len(gap)
+    slices: dict[str, list[dict]] = {}
+    for name, (recipe, variants) in EFFECTS.items():
+        for variant in range(variants):
+            samples = recipe(variant)
+            slices.setdefault(name, []).append({
+                "start": round((cursor + ENCODER_DELAY) / SAMPLE_RATE, 5),
+                "duration": round((len(samples) + DECODER_DELAY) / SAMPLE_RATE, 5),
+            })
+            parts += [samples, gap]
+            cursor += len(samples) + len(gap)
+    return np.clip(np.concatenate(parts), -1, 1), slices
+
+
+def encode_mp3(samples: np.ndarray, bitrate: int = BITRATE) -> bytes:
+    try:
+        import lameenc
+    except ImportError:
+        raise SystemExit("render_sfx.py needs the lameenc package to encode MP3: pip install lameenc")
+    encoder = lameenc.Encoder()
+    encoder.set_bit_rate(bitrate)
+    encoder.set_in_sample_rate(SAMPLE_RATE)
+    encoder.set_channels(1)
+    encoder.set_quality(2)  # highest quality that isn't painfully slow
+    pcm = np.round(samples * 32767).astype("<i2").tobytes()
+    return bytes(encoder.encode(pcm) + encoder.flush())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bitrate", type=int, default=BITRATE, help=f"MP3 bitrate in kbps (default: {BITRATE})")
+    args = parser.parse_args()
+
+    samples, slices = render_sprite()
+    data = encode_mp3(samples, args.bitrate)
+    os.makedirs(AUDIO_DIR, exist_ok=True)
+    with open(SPRITE_MP3, "wb") as f:
+        f.write(data)
+    with open(SPRITE_JSON, "w") as f:
+        json.dump(slices, f, indent=2)
+        f.write("\n")
+
+    for i, (name, entries) in enumerate(slices.items(), 1):
+        total = sum(entry["duration"] for entry in entries)
+        print(f"  [{i}/{len(slices)}] {name}: {len(entries)} slice(s), {total:.2f}s")
+    pcm_bytes = len(samples) * 2
+    print(f"\nRendered {len(samples) / SAMPLE_RATE:.2f}s of audio: {pcm_bytes / 1024:.0f} KB as 16-bit PCM, "
+          f"{len(data) / 1024:.0f} KB as {args.bitrate} kbps MP3.")
+    print(f"Done! Wrote {os.path.relpath(SPRITE_MP3, ROOT_DIR)} and {os.path.relpath(SPRITE_JSON, ROOT_DIR)}; "
+          f"run scripts/fingerprint_assets.py to publish them to the game.")
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""Offline stand-in for the image-generation skill's generate_image.
+
+Sleeps to mimic request latency and writes a placeholder sprite, so the asset
+scripts can be exercised without network access or API keys.
+"""
+import os
+import random
+import time
+
+from PIL import Image, ImageDraw
+
+# Seconds each fake request takes; override with STUB_GENERATE_DELAY
+DELAY = float(os.environ.get("STUB_GENERATE_DELAY", "0.2"))
+
+
+def generate_image(
+    prompt: dict,
+    save_path: str,
+    width: int = 512,
+    height: int = 512,
+    seed: int | None = None,
+    input_images: list[str] | None = None,
+) -> dict:
+    """Write a black canvas with a seeded coloured blob in the middle, like a real sprite."""
+    for ref in input_images or []:
+        if not os.path.isfile(ref):
+            raise FileNotFoundError(f"Reference image not found: {ref}")
+
+    time.sleep(DELAY)
+
+    rng = random.Random(seed)
+    img = Image.new("RGB", (width, height), (0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    color = tuple(rng.randint(64, 255) for _ in range(3))
+    draw.ellipse((width // 4, height // 4, width * 3 // 4, height * 3 // 4), fill=color)
+
+    os.makedirs(os.path.dirname(save_path) or ".", exist_ok=True)
+    img.save(save_path)
+    return {"save_path": save_path, "seed": seed}
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""Opt-in per-asset and per-stage tracing for the asset scripts.
+
+Code marks its work with `with span("flood_fill"):` (a stage) or
+`with span("animal_frog.png", cat="asset"):` (everything done for one asset).
+Spans cost nothing until a script enables TRACER, which the scripts do with
+--trace (write a Chrome/Perfetto trace-event JSON file, open it at
+https://ui.perfetto.dev or chrome://tracing) or --profile STAGE (run every
+span of that stage under cProfile). Either flag also prints a table of the
+slowest stages and assets when the run ends.
+
+Worker processes send their spans back through traced_map. Only one span is
+profiled at a time, so with concurrent work the profile covers a subset of
+that stage's spans.
+"""
+import argparse
+import cProfile
+import functools
+import json
+import os
+import pstats
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+
+TOP = 10  # rows in each summary table
+
+
+class _ProfileData:
+    """Raw cProfile stats in the shape pstats.Stats accepts."""
+
+    def __init__(self, stats: dict):
+        self.stats = stats
+
+    def create_stats(self) -> None:
+        pass
+
+
+class Tracer:
+    def __init__(self):
+        self.enabled = False
+        self.profile_stages: frozenset[str] = frozenset()
+        self.events: list[dict] = []
+        self.profiles: dict[str, list[dict]] = {}
+        self._lock = threading.Lock()
+        self._profiling = False
+        self._named_threads: set[tuple[int, int]] = set()
+
+    def enable(self, profile_stages: Iterable[str] = ()) -> None:
+        self.enabled = True
+        self.profile_stages = frozenset(profile_stages)
+
+    @contextmanager
+    def span(self, name: str, cat: str = "stage", **args) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+
+        profiler = None
+        if name in self.profile_stages:
+            with self._lock:
+                if not self._profiling:
+                    self._profiling = True
+                    profiler = cProfile.Profile()
+        if profiler:
+            profiler.enable()
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            if profiler:
+                profiler.disable()
+                profiler.create_stats()
+            self._record(name, cat, start, end, args, profiler)
+
+    def _record(self, name: str, cat: str, start: int, end: int, args: dict, profiler: cProfile.Profile | None) -> None:
+        pid, tid = os.getpid(), threading.get_native_id()
+        with self._lock:
+            if (pid, tid) not in self._named_threads:
+                self._named_threads.add((pid, tid))
+                self.events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                                    "args": {"name": threading.current_thread().name}})
+            self.events.append({
+                "name": name, "cat": cat, "ph": "X", "pid": pid, "tid": tid,
+                "ts": start / 1000, "dur": (end - start) / 1000,
+                "args": {k: str(v) for k, v in args.items()},
+            })
+            if profiler:
+                self.profiles.setdefault(name, []).append(profiler.stats)
+                self._profiling = False
+
+    def drain(self) -> dict:
+        """Hand over everything recorded so far (for sending back from a worker)."""
+        with self._lock:
+            recorded = {"events": self.events, "profiles": self.profiles}
+            self.events, self.profiles = [], {}
+            self._named_threads.clear()
+        return recorded
+
+    def merge(self, recorded: dict) -> None:
+        with self._lock:
+            self.events.extend(recorded["events"])
+            for name, stats in recorded["profiles"].items():
+                self.profiles.setdefault(name, []).extend(stats)
+
+    def write_trace(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f)
+            f.write("\n")
+
+    def write_profiles(self, prefix: str) -> list[str]:
+        """Write one <prefix><stage>.prof per profiled stage and print its hottest functions."""
+        paths = []
+        for name, runs in sorted(self.profiles.items()):
+            stats = pstats.Stats(_ProfileData(runs[0]))
+            for run in runs[1:]:
+                stats.add(_ProfileData(run))
+            path = f"{prefix}{name.replace('/', '_')}.prof"
+            stats.dump_stats(path)
+            paths.append(path)
+            print(f"\ncProfile of {name} ({len(runs)} span(s), written to {os.path.relpath(path)}):")
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(TOP)
+        return paths
+
+    def print_summary(self, top: int = TOP) -> None:
+        spans = [e for e in self.events if e["ph"] == "X"]
+        stages: dict[str, list[float]] = {}
+        for e in spans:
+            if e["cat"] == "stage":
+                stages.setdefault(e["name"], []).append(e["dur"] / 1000)
+        assets = sorted((e for e in spans if e["cat"] == "asset"), key=lambda e: -e["dur"])
+
+        print("\nSlowest stages:")
+        print(f"  {'stage':<20} {'count':>6} {'total ms':>10} {'mean ms':>9} {'max ms':>9}")
+        for name, durations in sorted(stages.items(), key=lambda item: -sum(item[1]))[:top]:
+            print(f"  {name:<20} {len(durations):>6} {sum(durations):>10.1f} "
+                  f"{sum(durations) / len(durations):>9.1f} {max(durations):>9.1f}")
+        if assets:
+            print("\nSlowest assets:")
+            for e in assets[:top]:
+                print(f"  {e['name']:<40} {e['dur'] / 1000:>9.1f} ms")
+
+
+TRACER = Tracer()
+
+
+def span(name: str, cat: str = "stage", **args):
+    """Context manager recording one span on the global tracer (a no-op unless enabled)."""
+    return TRACER.span(name, cat, **args)
+
+
+def traced(name: str, fn: Callable) -> Callable:
+    """Wrap fn so every call is recorded as a `name` stage span."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        with span(name):
+            return fn(*args, **kwargs)
+    return wrapper
+
+
+def call_traced(profile_stages: frozenset[str], fn: Callable, *args):
+    """Run fn(*args) in a worker process with tracing on; returns (result, recorded spans)."""
+    TRACER.drain()  # a forked worker starts with a copy of the parent's spans
+    TRACER.enable(profile_stages)
+    result = fn(*args)
+    return result, TRACER.drain()
+
+
+def traced_map(pool, fn: Callable, *iterables: Iterable) -> Iterator:
+    """pool.map(fn, ...) that carries the workers' spans back into TRACER when tracing is on."""
+    if not TRACER.enabled:
+        yield from pool.map(fn, *iterables)
+        return
+    calls = list(zip(*iterables))
+    columns = list(zip(*calls)) or [()] * len(iterables)
+    for result, recorded in pool.map(call_traced, [TRACER.profile_stages] * len(calls), [fn] * len(calls), *columns):
+        TRACER.merge(recorded)
+        yield result
+
+
+def add_tracing_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--trace", metavar="PATH",
+                        help="write per-asset and per-stage spans as Chrome/Perfetto trace JSON to PATH")
+    parser.add_argument("--profile", metavar="STAGE", action="append", default=[],
+                        help="run this stage under cProfile (repeatable), e.g. flood_fill")
+
+
+def tracing_from_args(args: argparse.Namespace) -> None:
+    if args.trace or args.profile:
+        TRACER.enable(args.profile)
+
+
+def finish_tracing(args: argparse.Namespace) -> None:
+    """Write the trace and profiles requested on the command line and print the summary."""
+    if not TRACER.enabled:
+        return
+    TRACER.print_summary()
+    if args.profile:
+        prefix = os.path.splitext(args.trace)[0] + "." if args.trace else ""
+        TRACER.write_profiles(prefix)
+    if args.trace:
+        TRACER.write_trace(args.trace)
+        print(f"\nWrote trace to {os.path.relpath(args.trace)}.")
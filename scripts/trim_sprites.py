@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Crop sprites to their alpha bounding box, keeping pivot metadata.
+
+Run after remove_backgrounds.py. Each sprite is cropped to the smallest box
+holding every non-transparent pixel (plus optional padding) and its original
+size and offset are recorded, so a trimmed frame can still be drawn with the
+same origin as the full canvas. Frames of one animation (a base sprite and
+its _walk or _flip frame) share a single box so the cycle doesn't jitter.
+
+pack_atlas.py trims in memory with these functions; run this script on its
+own to inspect the trim boxes or export trimmed PNGs.
+"""
+import argparse
+import json
+import os
+
+from PIL import Image
+
+ASSETS_DIR = os.path.join(os.path.dirname(__file__), "..", "public", "assets")
+SOURCE_DIRS = [os.path.join(ASSETS_DIR, "sprites"), os.path.join(ASSETS_DIR, "ui")]
+OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "..", "build", "assets", "trimmed")
+
+PADDING = 0
+
+# Suffixes of frames that animate against the base sprite of the same name (see createAnimations)
+ANIMATION_SUFFIXES = ("_walk", "_flip")
+
+
+def animation_group(name: str) -> str:
+    for suffix in ANIMATION_SUFFIXES:
+        if name.endswith(suffix):
+            return name[:-len(suffix)]
+    return name
+
+
+def alpha_bbox(img: Image.Image) -> tuple[int, int, int, int] | None:
+    """Box (left, top, right, bottom) around every non-transparent pixel, or None if there are none."""
+    if img.mode != "RGBA":
+        return (0, 0, img.width, img.height)
+    return img.getchannel("A").getbbox()
+
+
+def union(a: tuple[int, int, int, int] | None, b: tuple[int, int, int, int] | None) -> tuple[int, int, int, int] | None:
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+
+
+def trim_boxes(images: dict[str, Image.Image], padding: int = PADDING) -> dict[str, tuple[int, int, int, int]]:
+    """Trim box per sprite, shared across each animation group and clamped to the canvas."""
+    group_boxes: dict[str, tuple[int, int, int, int] | None] = {}
+    for name, img in images.items():
+        group = animation_group(name)
+        group_boxes[group] = union(group_boxes.get(group), alpha_bbox(img))
+
+    boxes = {}
+    for name, img in images.items():
+        box = group_boxes[animation_group(name)]
+        if box is None:
+            # Fully transparent: keep a single pixel so the frame still exists
+            box = (0, 0, 1, 1)
+        left, top, right, bottom = box
+        boxes[name] = (
+            max(0, left - padding),
+            max(0, top - padding),
+            min(img.width, right + padding),
+            min(img.height, bottom + padding),
+        )
+    return boxes
+
+
+def trim(images: dict[str, Image.Image], padding: int = PADDING) -> tuple[dict[str, Image.Image], dict[str, dict]]:
+    """Crop every sprite; returns the cropped images and their trim metadata.
+
+    Metadata uses the atlas vocabulary: sourceSize is the original canvas and
+    spriteSourceSize the cropped region's offset and size within it.
+    """
+    boxes = trim_boxes(images, padding)
+    trimmed = {}
+    meta = {}
+    for name, img in images.items():
+        left, top, right, bottom = boxes[name]
+        trimmed[name] = img.crop(boxes[name])
+        meta[name] = {
+            "trimmed": (right - left, bottom - top) != img.size,
+            "sourceSize": {"w": img.width, "h": img.height},
+            "spriteSourceSize": {"x": left, "y": top, "w": right - left, "h": bottom - top},
+        }
+    return trimmed, meta
+
+
+def collect_sprites() -> dict[str, str]:
+    """Map frame name (file stem) to path for every sprite that goes into the atlas."""
+    sprites = {}
+    for dirpath in SOURCE_DIRS:
+        if not os.path.isdir(dirpath):
+            continue
+        for fname in sorted(os.listdir(dirpath)):
+            if fname.endswith(".png"):
+                name = fname[:-4]
+                if name in sprites:
+                    raise ValueError(f"Duplicate frame name {name!r} in {dirpath}")
+                sprites[name] = os.path.join(dirpath, fname)
+    return sprites
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--padding", type=int, default=PADDING,
+                        help=f"transparent pixels kept around the trim box (default: {PADDING})")
+    parser.add_argument("--write", action="store_true",
+                        help=f"write trimmed PNGs and trim.json to {os.path.relpath(OUTPUT_DIR)}")
+    args = parser.parse_args()
+
+    sprites = collect_sprites()
+    images = {name: Image.open(path).convert("RGBA") for name, path in sprites.items()}
+    trimmed, meta = trim(images, args.padding)
+
+    before = sum(img.width * img.height for img in images.values())
+    after = sum(img.width * img.height for img in trimmed.values())
+    for i, name in enumerate(sprites, 1):
+        box = meta[name]["spriteSourceSize"]
+        src = meta[name]["sourceSize"]
+        print(f"  [{i}/{len(sprites)}] {name}: {src['w']}x{src['h']} -> {box['w']}x{box['h']} at ({box['x']}, {box['y']})")
+    print(f"\nPixels: {before:,} -> {after:,} ({1 - after / before:.0%} trimmed away)")
+
+    if args.write:
+        os.makedirs(OUTPUT_DIR, exist_ok=True)
+        for name, img in trimmed.items():
+            img.save(os.path.join(OUTPUT_DIR, f"{name}.png"))
+        with open(os.path.join(OUTPUT_DIR, "trim.json"), "w") as f:
+            json.dump(meta, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Done! Wrote trimmed sprites to {os.path.relpath(OUTPUT_DIR)}.")
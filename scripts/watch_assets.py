@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""Watch public/assets and reprocess changed art while `npm run dev` is running.
+
+Polls the PNGs in public/assets/sprites, ui and backgrounds every --interval
+seconds. A burst of writes (an editor saving several files, a generation
+run) is collected until the tree has been quiet for --debounce seconds, and
+then only the changed files are reprocessed:
+
+- sprites get their background removed in place, exactly like
+  remove_backgrounds.py, and are recorded in its manifest;
+- the sprite atlas is repacked from sprites kept decoded in memory, and
+  only the pages whose contents changed are re-encoded, with fast
+  compression so the round trip stays well under a second; the changed
+  frames' hit shapes are recomputed;
+- changed terrarium backgrounds get their variants rebuilt;
+- the results are republished with fingerprint_assets.py, whose regenerated
+  AssetManifest.ts makes the dev server reload the game. Rewritten images
+  are served as PNG until encode_webp.py is run again.
+
+Every file the watcher writes is remembered with its new size and mtime, so
+its own in-place rewrites don't trigger another round. On exit (Ctrl-C) the
+atlas pages written with fast compression are saved again normally and
+republished, leaving the same files pack_atlas.py would.
+"""
+import argparse
+import os
+import sys
+import time
+
+from PIL import Image
+
+import pack_atlas
+import remove_backgrounds
+from build_backgrounds import PREFIX, build_variants
+from downscale_sprites import load_display_sprites, to_display_size
+from fingerprint_assets import fingerprint
+from hit_shapes import build_hit_shapes, write_hit_shapes
+from trim_sprites import collect_sprites
+
+ASSETS_DIR = os.path.join(os.path.dirname(__file__), "..", "public", "assets")
+WATCH_DIRS = [os.path.join(ASSETS_DIR, d) for d in ("sprites", "ui", "backgrounds")]
+
+INTERVAL = 0.05  # seconds between polls
+DEBOUNCE = 0.1  # quiet time after the last change before reprocessing
+FAST_SAVE = {"compress_level": 0}  # dev-only atlas pages: bigger files, ~5x faster to write
+
+Stat = tuple[int, int]
+
+
+def scan() -> dict[str, Stat]:
+    """(mtime_ns, size) of every watched PNG."""
+    snapshot = {}
+    for dirpath in WATCH_DIRS:
+        try:
+            entries = list(os.scandir(dirpath))
+        except FileNotFoundError:
+            continue
+        for entry in entries:
+            if entry.is_file() and entry.name.endswith(".png"):
+                stat = entry.stat()
+                snapshot[os.path.normpath(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+def stat_of(path: str) -> Stat | None:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class AtlasState:
+    """The decoded atlas sprites and the last layout written, for incremental repacks."""
+
+    def __init__(self):
+        self.images: dict[str, Image.Image] = {}  # at display size, see downscale_sprites.py
+        self.scales: dict[str, float] = {}
+        self.textures: list[dict] = []
+        self.shapes: dict[str, dict] = {}
+        self.fast_pages: set[int] = set()
+
+    def load(self, sprites: dict[str, str]) -> None:
+        self.images, self.scales = load_display_sprites(sprites)
+        _, atlas = pack_atlas.build_atlas_from_images(self.images, scales=self.scales)
+        self.textures = atlas["textures"]
+        self.shapes = build_hit_shapes(self.images)
+
+    def update(self, changed: set[str]) -> list[str]:
+        """Re-read the changed sprite files and rewrite the affected pages; returns the paths written."""
+        sprites = collect_sprites()
+        paths = {os.path.normpath(p): name for name, p in sprites.items()}
+        changed_names = {paths[p] for p in changed if p in paths}
+        removed = set(self.images) - set(sprites)
+        if not changed_names and not removed:
+            return []
+        for name in removed:
+            del self.images[name]
+            del self.scales[name]
+            self.shapes.pop(name, None)
+        for name in changed_names:
+            self.images[name], self.scales[name] = to_display_size(name, Image.open(sprites[name]).convert("RGBA"))
+            self.shapes.pop(name, None)
+        self.shapes.update(build_hit_shapes({name: self.images[name] for name in changed_names}))
+
+        pages, atlas = pack_atlas.build_atlas_from_images(self.images, scales=self.scales)
+        dirty = set()
+        for i, texture in enumerate(atlas["textures"]):
+            previous = self.textures[i]["frames"] if i < len(self.textures) else None
+            names = {frame["filename"] for frame in texture["frames"]}
+            if texture["frames"] != previous or names & changed_names:
+                dirty.add(i)
+        self.textures = atlas["textures"]
+        self.fast_pages = {i for i in self.fast_pages if i < len(pages)} | dirty
+        return pack_atlas.write_atlas(pages, atlas, only=dirty, **FAST_SAVE) + [write_hit_shapes(self.shapes)]
+
+    def finalize(self) -> bool:
+        """Re-encode the pages written with fast compression the way pack_atlas.py does.
+
+        Returns whether anything was rewritten.
+        """
+        if not self.fast_pages:
+            return False
+        pages, atlas = pack_atlas.build_atlas_from_images(self.images, scales=self.scales)
+        pack_atlas.write_atlas(pages, atlas, only=self.fast_pages)
+        self.fast_pages = set()
+        return True
+
+
+def reprocess(changed: set[str], atlas: AtlasState, manifest: dict) -> tuple[list[str], list[str]]:
+    """Reprocess one debounced batch; returns (paths written, errors)."""
+    written = []
+    errors = []
+    existing = sorted(p for p in changed if os.path.exists(p))
+
+    for path in existing:
+        name = os.path.basename(path)
+        try:
+            if remove_backgrounds.wants_background_removed(path):
+                manifest["files"][remove_backgrounds.manifest_key(path)] = remove_backgrounds.process_file(path)
+                written.append(path)
+            elif name.startswith(PREFIX) and os.path.dirname(path) == os.path.normpath(WATCH_DIRS[2]):
+                written.extend(build_variants(path).values())
+        except Exception as e:
+            # Most likely an editor still writing the file; its next write triggers another round
+            errors.append(f"{name}: {type(e).__name__}: {e}")
+    for path in changed - set(existing):
+        manifest["files"].pop(remove_backgrounds.manifest_key(path), None)
+    remove_backgrounds.save_manifest(manifest)
+
+    try:
+        written.extend(atlas.update(changed))
+    except Exception as e:
+        errors.append(f"atlas: {type(e).__name__}: {e}")
+    if written:
+        try:
+            fingerprint()
+        except Exception as e:
+            errors.append(f"fingerprint: {type(e).__name__}: {e}")
+    return written, errors
+
+
+def watch(interval: float = INTERVAL, debounce: float = DEBOUNCE) -> None:
+    atlas = AtlasState()
+    atlas.load(collect_sprites())
+    manifest = remove_backgrounds.load_manifest()
+
+    snapshot = scan()
+    own_writes: dict[str, Stat] = {}
+    pending: set[str] = set()
+    first_change = last_change = 0.0
+    print(f"Watching {len(snapshot)} PNGs under {os.path.relpath(ASSETS_DIR)} (Ctrl-C to stop)...")
+    try:
+        while True:
+            time.sleep(interval)
+            current = scan()
+            changed = {p for p in current.keys() | snapshot.keys() if current.get(p) != snapshot.get(p)}
+            snapshot = current
+            for path in list(changed):
+                if path in own_writes and own_writes[path] == current.get(path):
+                    changed.discard(path)
+                own_writes.pop(path, None)
+            if changed:
+                now = time.perf_counter()
+                if not pending:
+                    first_change = now
+                pending |= changed
+                last_change = now
+                continue
+            if not pending or time.perf_counter() - last_change < debounce:
+                continue
+
+            batch, pending = pending, set()
+            names = ", ".join(sorted(os.path.basename(p) for p in batch))
+            written, errors = reprocess(batch, atlas, manifest)
+            for path in written:
+                stat = stat_of(path)
+                if stat:
+                    own_writes[os.path.normpath(path)] = stat
+            for error in errors:
+                print(f"  -> FAILED {error}", file=sys.stderr)
+            print(f"Reprocessed {names} in {time.perf_counter() - first_change:.2f}s "
+                  f"({len(written)} file(s) written)")
+    except KeyboardInterrupt:
+        print("\nRe-encoding atlas pages...")
+        try:
+            if atlas.finalize():
+                fingerprint()
+        except Exception as e:
+            print(f"  -> FAILED {type(e).__name__}: {e}; run scripts/pack_atlas.py, "
+                  f"scripts/encode_webp.py and scripts/fingerprint_assets.py to finish", file=sys.stderr)
+            sys.exit(1)
+        print("Done!")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--interval", type=float, default=INTERVAL,
+                        help=f"seconds between filesystem polls (default: {INTERVAL})")
+    parser.add_argument("--debounce", type=float, default=DEBOUNCE,
+                        help=f"quiet seconds to wait after a change before reprocessing (default: {DEBOUNCE})")
+    args = parser.parse_args()
+    watch(args.interval, args.debounce)
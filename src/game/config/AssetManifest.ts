@@ -0,0 +1,193 @@
+// Generated by scripts/fingerprint_assets.py - do not edit by hand.
+
+export interface ImageFile {
+    url: string;
+    bytes: number;
+}
+
+// An image in each format it's published in; pickImageUrl (GameConfig.ts) chooses one
+export interface ImageFormats {
+    png: ImageFile;
+    webp?: ImageFile;
+}
+
+export interface AtlasAsset {
+    key: string;           // texture key
+    path: string;          // directory holding its pages
+    formats: ImageFormats; // multiatlas JSON per page format, with the pages' total size
+}
+
+export interface BackgroundVariants {
+    full: ImageFormats;  // GAME_WIDTH x GAME_HEIGHT
+    hidpi: ImageFormats; // 2x game resolution, for high-DPI screens
+    thumb: ImageFormats; // Options panel picker thumbnail
+}
+
+export interface SfxAsset {
+    audio: string; // MP3 with every sound effect
+    map: string;   // JSON: effect name -> slices of audio to pick from
+}
+
+export interface AnimationAsset {
+    key: string;
+    atlas: string;
+    frames: string[];
+    frameRate: number;
+}
+
+export const ATLASES: AtlasAsset[] = [
+    {
+        key: 'sprites',
+        path: 'assets/hashed',
+        formats: {
+            png: { url: 'assets/hashed/sprites.d7d5748bc2.json', bytes: 534993 },
+            webp: { url: 'assets/hashed/sprites.webp.a90e470378.json', bytes: 397224 },
+        },
+    },
+];
+
+// Factor each atlas frame was shrunk by from its source canvas; frames left out are full size
+export const FRAME_SCALES: Record<string, number> = {
+    animal_chameleon: 0.240234,
+    animal_chameleon_walk: 0.240234,
+    animal_dragon: 0.300781,
+    animal_dragon_walk: 0.300781,
+    animal_frog: 0.201172,
+    animal_frog_walk: 0.201172,
+    animal_gecko: 0.201172,
+    animal_gecko_walk: 0.201172,
+    animal_salamander: 0.240234,
+    animal_salamander_walk: 0.240234,
+    baby_chameleon: 0.140625,
+    baby_chameleon_walk: 0.140625,
+    baby_dragon: 0.181641,
+    baby_dragon_walk: 0.181641,
+    baby_frog: 0.121094,
+    baby_frog_walk: 0.121094,
+    baby_gecko: 0.121094,
+    baby_gecko_walk: 0.121094,
+    baby_salamander: 0.140625,
+    baby_salamander_walk: 0.140625,
+    coin: 0.160156,
+    coin_bronze: 0.160156,
+    coin_bronze_flip: 0.160156,
+    coin_flip: 0.160156,
+    coin_silver: 0.160156,
+    coin_silver_flip: 0.160156,
+    egg_piece: 0.140625,
+    egg_piece_empty: 0.140625,
+    food_cricket: 0.140625,
+    food_mealworm: 0.140625,
+    food_roach: 0.140625,
+    helper_beetle: 0.400391,
+    helper_beetle_walk: 0.400391,
+    helper_hermit_crab: 0.400391,
+    helper_hermit_crab_walk: 0.400391,
+    helper_mantis: 0.400391,
+    helper_mantis_walk: 0.400391,
+    helper_millipede: 0.400391,
+    helper_millipede_walk: 0.400391,
+    helper_scorpion: 0.400391,
+    helper_scorpion_walk: 0.400391,
+    helper_snail: 0.400391,
+    helper_snail_walk: 0.400391,
+    helper_snake: 0.400391,
+    helper_snake_walk: 0.400391,
+    helper_tortoise: 0.400391,
+    helper_tortoise_walk: 0.400391,
+    poacher_hand: 0.300781,
+    shop_button: 0.261719,
+    thought_bubble: 0.144531,
+};
+
+// JSON: frame name -> collision box and hull, from scripts/hit_shapes.py
+export const HIT_SHAPES = 'assets/hashed/hit_shapes.b6e7a05678.json';
+
+export const BACKGROUND_MANIFEST: Record<string, BackgroundVariants> = {
+    desert: {
+        full: {
+            png: { url: 'assets/hashed/terrarium_desert.c46b56919d.png', bytes: 591975 },
+            webp: { url: 'assets/hashed/terrarium_desert.e68b881717.webp', bytes: 88824 },
+        },
+        hidpi: {
+            png: { url: 'assets/hashed/terrarium_desert.a7d7838355.png', bytes: 2223576 },
+            webp: { url: 'assets/hashed/terrarium_desert.14431a4491.webp', bytes: 223982 },
+        },
+        thumb: {
+            png: { url: 'assets/hashed/terrarium_desert_thumb.ee25ec191a.png', bytes: 33595 },
+            webp: { url: 'assets/hashed/terrarium_desert_thumb.08beaac66e.webp', bytes: 27968 },
+        },
+    },
+    rainforest: {
+        full: {
+            png: { url: 'assets/hashed/terrarium_rainforest.4abf5f1312.png', bytes: 949565 },
+            webp: { url: 'assets/hashed/terrarium_rainforest.887fc7f59a.webp', bytes: 137622 },
+        },
+        hidpi: {
+            png: { url: 'assets/hashed/terrarium_rainforest.426d4f3217.png', bytes: 3583379 },
+            webp: { url: 'assets/hashed/terrarium_rainforest.52461b0a03.webp', bytes: 427074 },
+        },
+        thumb: {
+            png: { url: 'assets/hashed/terrarium_rainforest_thumb.c932aa7cd9.png', bytes: 42610 },
+            webp: { url: 'assets/hashed/terrarium_rainforest_thumb.e460a4de34.webp', bytes: 35414 },
+        },
+    },
+    tropical: {
+        full: {
+            png: { url: 'assets/hashed/terrarium_tropical.74a1d1d9d4.png', bytes: 724882 },
+            webp: { url: 'assets/hashed/terrarium_tropical.a77bd67f0a.webp', bytes: 126536 },
+        },
+        hidpi: {
+            png: { url: 'assets/hashed/terrarium_tropical.35f40e8d3b.png', bytes: 2527220 },
+            webp: { url: 'assets/hashed/terrarium_tropical.9a868caa99.webp', bytes: 284738 },
+        },
+        thumb: {
+            png: { url: 'assets/hashed/terrarium_tropical_thumb.0a600b7d60.png', bytes: 43798 },
+            webp: { url: 'assets/hashed/terrarium_tropical_thumb.9141bbb33b.webp', bytes: 37022 },
+        },
+    },
+};
+
+export const SFX: SfxAsset = { audio: 'assets/hashed/sfx.a5593dd649.mp3', map: 'assets/hashed/sfx.9a58cabc16.json' };
+
+export const ANIMATIONS: AnimationAsset[] = [
+    { key: 'animal_chameleon_walk', atlas: 'sprites', frames: ['animal_chameleon', 'animal_chameleon_walk'], frameRate: 4 },
+    { key: 'animal_chameleon_idle', atlas: 'sprites', frames: ['animal_chameleon'], frameRate: 1 },
+    { key: 'animal_dragon_walk', atlas: 'sprites', frames: ['animal_dragon', 'animal_dragon_walk'], frameRate: 4 },
+    { key: 'animal_dragon_idle', atlas: 'sprites', frames: ['animal_dragon'], frameRate: 1 },
+    { key: 'animal_frog_walk', atlas: 'sprites', frames: ['animal_frog', 'animal_frog_walk'], frameRate: 4 },
+    { key: 'animal_frog_idle', atlas: 'sprites', frames: ['animal_frog'], frameRate: 1 },
+    { key: 'animal_gecko_walk', atlas: 'sprites', frames: ['animal_gecko', 'animal_gecko_walk'], frameRate: 4 },
+    { key: 'animal_gecko_idle', atlas: 'sprites', frames: ['animal_gecko'], frameRate: 1 },
+    { key: 'animal_salamander_walk', atlas: 'sprites', frames: ['animal_salamander', 'animal_salamander_walk'], frameRate: 4 },
+    { key: 'animal_salamander_idle', atlas: 'sprites', frames: ['animal_salamander'], frameRate: 1 },
+    { key: 'baby_chameleon_walk', atlas: 'sprites', frames: ['baby_chameleon', 'baby_chameleon_walk'], frameRate: 4 },
+    { key: 'baby_chameleon_idle', atlas: 'sprites', frames: ['baby_chameleon'], frameRate: 1 },
+    { key: 'baby_dragon_walk', atlas: 'sprites', frames: ['baby_dragon', 'baby_dragon_walk'], frameRate: 4 },
+    { key: 'baby_dragon_idle', atlas: 'sprites', frames: ['baby_dragon'], frameRate: 1 },
+    { key: 'baby_frog_walk', atlas: 'sprites', frames: ['baby_frog', 'baby_frog_walk'], frameRate: 4 },
+    { key: 'baby_frog_idle', atlas: 'sprites', frames: ['baby_frog'], frameRate: 1 },
+    { key: 'baby_gecko_walk', atlas: 'sprites', frames: ['baby_gecko', 'baby_gecko_walk'], frameRate: 4 },
+    { key: 'baby_gecko_idle', atlas: 'sprites', frames: ['baby_gecko'], frameRate: 1 },
+    { key: 'baby_salamander_walk', atlas: 'sprites', frames: ['baby_salamander', 'baby_salamander_walk'], frameRate: 4 },
+    { key: 'baby_salamander_idle', atlas: 'sprites', frames: ['baby_salamander'], frameRate: 1 },
+    { key: 'coin_spin', atlas: 'sprites', frames: ['coin', 'coin_flip'], frameRate: 4 },
+    { key: 'coin_bronze_spin', atlas: 'sprites', frames: ['coin_bronze', 'coin_bronze_flip'], frameRate: 4 },
+    { key: 'coin_silver_spin', atlas: 'sprites', frames: ['coin_silver', 'coin_silver_flip'], frameRate: 4 },
+    { key: 'helper_beetle_walk', atlas: 'sprites', frames: ['helper_beetle', 'helper_beetle_walk'], frameRate: 4 },
+    { key: 'helper_beetle_idle', atlas: 'sprites', frames: ['helper_beetle'], frameRate: 1 },
+    { key: 'helper_hermit_crab_walk', atlas: 'sprites', frames: ['helper_hermit_crab', 'helper_hermit_crab_walk'], frameRate: 4 },
+    { key: 'helper_hermit_crab_idle', atlas: 'sprites', frames: ['helper_hermit_crab'], frameRate: 1 },
+    { key: 'helper_mantis_walk', atlas: 'sprites', frames: ['helper_mantis', 'helper_mantis_walk'], frameRate: 4 },
+    { key: 'helper_mantis_idle', atlas: 'sprites', frames: ['helper_mantis'], frameRate: 1 },
+    { key: 'helper_millipede_walk', atlas: 'sprites', frames: ['helper_millipede', 'helper_millipede_walk'], frameRate: 4 },
+    { key: 'helper_millipede_idle', atlas: 'sprites', frames: ['helper_millipede'], frameRate: 1 },
+    { key: 'helper_scorpion_walk', atlas: 'sprites', frames: ['helper_scorpion', 'helper_scorpion_walk'], frameRate: 4 },
+    { key: 'helper_scorpion_idle', atlas: 'sprites', frames: ['helper_scorpion'], frameRate: 1 },
+    { key: 'helper_snail_walk', atlas: 'sprites', frames: ['helper_snail', 'helper_snail_walk'], frameRate: 4 },
+    { key: 'helper_snail_idle', atlas: 'sprites', frames: ['helper_snail'], frameRate: 1 },
+    { key: 'helper_snake_walk', atlas: 'sprites', frames: ['helper_snake', 'helper_snake_walk'], frameRate: 4 },
+    { key: 'helper_snake_idle', atlas: 'sprites', frames: ['helper_snake'], frameRate: 1 },
+    { key: 'helper_tortoise_walk', atlas: 'sprites', frames: ['helper_tortoise', 'helper_tortoise_walk'], frameRate: 4 },
+    { key: 'helper_tortoise_idle', atlas: 'sprites', frames: ['helper_tortoise'], frameRate: 1 },
+];
@@ -1,4 +1,5 @@
 import Phaser from 'phaser';
+import { ImageFormats } from './AssetManifest';
 
 export const GAME_WIDTH = 1024;
 export const GAME_HEIGHT = 768;
@@ -6,6 +7,15 @@ export const SHOP_BAR_HEIGHT = 100;
 export const SUBSTRATE_TOP = Math.round(GAME_HEIGHT * 0.4);
 export const SUBSTRATE_BOTTOM = GAME_HEIGHT - SHOP_BAR_HEIGHT;
 
+// Multi-atlas holding every sprite; frame names match the original texture keys
+export const SPRITE_ATLAS = 'sprites';
+
+// URL of the smaller of an image's published formats that this browser can decode
+export function pickImageUrl(game: Phaser.Game, formats: ImageFormats): string {
+    const { png, webp } = formats;
+    return webp && webp.bytes < png.bytes && game.device.features.webp ? webp.url : png.url;
+}
+
 export function createGameConfig(parent: string, scenes: Phaser.Types.Scenes.SceneType[]): Phaser.Types.Core.GameConfig {
     return {
         type: Phaser.AUTO,
@@ -1,7 +1,9 @@
 import Phaser from 'phaser';
 import { AnimalConfig } from '../config/AnimalData';
-import { SUBSTRATE_TOP, SUBSTRATE_BOTTOM, GAME_WIDTH } from '../config/GameConfig';
+import { SUBSTRATE_TOP, SUBSTRATE_BOTTOM, GAME_WIDTH, SPRITE_ATLAS } from '../config/GameConfig';
 import { ThoughtBubble } from './ThoughtBubble';
+import { fitBodyToFrame } from '../systems/HitShapes';
+import { canvasScale, setCanvasScale, setFrameKeepingSize } from '../systems/FrameScale';
 
 const HUNGER_THRESHOLD = 0.3; // show thought bubble below 30%
 const COIN_JITTER = 0.3; // +-30% random offset on coin drop interval
@@ -29,18 +31,19 @@ export class Animal extends Phaser.GameObjects.Sprite {
     private hungerJitter: number;
 
     constructor(scene: Phaser.Scene, x: number, y: number, animalConfig: AnimalConfig) {
-        super(scene, x, y, animalConfig.babySpriteKey);
+        super(scene, x, y, SPRITE_ATLAS, animalConfig.babySpriteKey);
 
         this.config = animalConfig;
         this.hunger = animalConfig.maxHunger;
-        this.setScale(animalConfig.babySpriteScale);
+        setCanvasScale(this, animalConfig.babySpriteScale);
 
         scene.add.existing(this);
         scene.physics.add.existing(this);
 
-        // Set up physics body
+        // Set up physics body, sized to the opaque part of the frame rather than the whole canvas
         const body = this.body as Phaser.Physics.Arcade.Body;
         body.setCollideWorldBounds(false);
+        fitBodyToFrame(this);
 
         // Coin drop timer with random jitter
         this.scheduleCoinDrop();
@@ -72,9 +75,17 @@ export class Animal extends Phaser.GameObjects.Sprite {
         return this.hunger / this.config.maxHunger;
     }
 
+    // Middle of the animal itself (its physics body), which needn't be the middle of the canvas
+    get hitCenter(): Phaser.Math.Vector2 {
+        return (this.body as Phaser.Physics.Arcade.Body).center;
+    }
+
     update(_time: number, delta: number): void {
         if (!this.isAlive) return;
 
+        // Walk cycles, growing up and turning around change the frame the body has to match
+        fitBodyToFrame(this);
+
         // Deplete hunger (jittered per-animal)
         this.hunger -= this.config.hungerRate * this.hungerJitter * (delta / 1000);
         if (this.hunger <= 0) {
@@ -119,14 +130,14 @@ export class Animal extends Phaser.GameObjects.Sprite {
         this.emit('grewUp');
         this.isBaby = false;
 
-        // Swap texture to adult sprite
-        this.setTexture(this.config.spriteKey);
+        // Swap texture to adult sprite, at the baby's size until the tween grows it
+        setFrameKeepingSize(this, this.config.spriteKey);
 
         // Tween scale to adult size
         this.scene.tweens.add({
             targets: this,
-            scaleX: this.config.spriteScale,
-            scaleY: this.config.spriteScale,
+            scaleX: canvasScale(this.config.spriteKey, this.config.spriteScale),
+            scaleY: canvasScale(this.config.spriteKey, this.config.spriteScale),
             duration: 600,
             ease: 'Back.easeOut',
         });
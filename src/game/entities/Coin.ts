@@ -1,4 +1,6 @@
 import Phaser from 'phaser';
+import { SPRITE_ATLAS } from '../config/GameConfig';
+import { canvasScale, setCanvasScale } from '../systems/FrameScale';
 
 const FLOAT_DURATION = 500;
 const FLOAT_HEIGHT = 30;
@@ -31,14 +33,14 @@ export class Coin extends Phaser.GameObjects.Sprite {
 
     constructor(scene: Phaser.Scene, x: number, y: number, value: number) {
         const tier = getCoinTier(value);
-        super(scene, x, y, getCoinSpriteKey(tier));
+        super(scene, x, y, SPRITE_ATLAS, getCoinSpriteKey(tier));
 
         this.value = value;
         this.spawnTime = scene.time.now;
 
         scene.add.existing(this);
         this.setDepth(15);
-        this.setScale(0.04); // 512px -> ~20px in-game
+        setCanvasScale(this, 0.04); // 512px -> ~20px in-game
         this.setInteractive({ useHandCursor: true });
 
         // Float up animation
@@ -88,8 +90,8 @@ export class Coin extends Phaser.GameObjects.Sprite {
 
         this.scene.tweens.add({
             targets: this,
-            scaleX: 0.08,
-            scaleY: 0.08,
+            scaleX: canvasScale(this.frame.name, 0.08),
+            scaleY: canvasScale(this.frame.name, 0.08),
             alpha: 0,
             duration: 200,
             ease: 'Quad.easeOut',
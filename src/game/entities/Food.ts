@@ -1,6 +1,8 @@
 import Phaser from 'phaser';
 import { FoodConfig } from '../config/FoodData';
-import { SUBSTRATE_TOP, SUBSTRATE_BOTTOM, GAME_WIDTH } from '../config/GameConfig';
+import { SUBSTRATE_TOP, SUBSTRATE_BOTTOM, GAME_WIDTH, SPRITE_ATLAS } from '../config/GameConfig';
+import { fitBodyToFrame } from '../systems/HitShapes';
+import { setCanvasScale } from '../systems/FrameScale';
 
 const FOOD_LIFETIME = 30000; // 30 seconds
 const FALL_DURATION = 400;
@@ -17,7 +19,7 @@ export class Food extends Phaser.GameObjects.Sprite {
     private glow: Phaser.GameObjects.Ellipse;
 
     constructor(scene: Phaser.Scene, x: number, y: number, foodConfig: FoodConfig) {
-        super(scene, x, y, foodConfig.spriteKey);
+        super(scene, x, y, SPRITE_ATLAS, foodConfig.spriteKey);
 
         this.foodConfig = foodConfig;
         this.nutrition = foodConfig.nutrition;
@@ -28,7 +30,8 @@ export class Food extends Phaser.GameObjects.Sprite {
         scene.physics.add.existing(this);
 
         this.setDepth(5);
-        this.setScale(0.04); // 512px -> ~20px in-game
+        setCanvasScale(this, 0.04); // 512px -> ~20px in-game
+        fitBodyToFrame(this);
 
         // Glowing indicator beneath food for visibility
         this.glow = scene.add.ellipse(x, y + 6, 24, 10, 0x22c55e, 0.35);
@@ -109,6 +112,7 @@ export class Food extends Phaser.GameObjects.Sprite {
 
         // Flip sprite based on horizontal direction
         this.setFlipX(Math.cos(this.moveAngle) < 0);
+        fitBodyToFrame(this);
 
         // Update glow position
         this.glow.setPosition(this.x, this.y + 6);
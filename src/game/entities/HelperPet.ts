@@ -1,10 +1,11 @@
 import Phaser from 'phaser';
 import { HelperPetConfig } from '../config/HelperPetData';
-import { SUBSTRATE_TOP, SUBSTRATE_BOTTOM, GAME_WIDTH } from '../config/GameConfig';
+import { SUBSTRATE_TOP, SUBSTRATE_BOTTOM, GAME_WIDTH, SPRITE_ATLAS } from '../config/GameConfig';
 import { FOOD_DATA } from '../config/FoodData';
 import { Animal } from './Animal';
 import { Food } from './Food';
 import { Coin } from './Coin';
+import { setCanvasScale } from '../systems/FrameScale';
 
 const MARGIN = 20;
 const WANDER_SPEED = 40;
@@ -19,11 +20,11 @@ export class HelperPet extends Phaser.GameObjects.Sprite {
     constructor(scene: Phaser.Scene, config: HelperPetConfig) {
         const x = Phaser.Math.Between(60, GAME_WIDTH - 60);
         const y = Phaser.Math.Between(SUBSTRATE_TOP + 30, SUBSTRATE_BOTTOM - 30);
-        super(scene, x, y, config.spriteKey);
+        super(scene, x, y, SPRITE_ATLAS, config.spriteKey);
 
         this.petConfig = config;
         this.setDepth(12);
-        this.setScale(0.08); // 512px -> ~40px in-game
+        setCanvasScale(this, 0.08); // 512px -> ~40px in-game
 
         scene.add.existing(this);
         scene.physics.add.existing(this);
@@ -1,8 +1,9 @@
 import Phaser from 'phaser';
 import { PoacherConfig } from '../config/LevelData';
-import { GAME_WIDTH, SUBSTRATE_TOP } from '../config/GameConfig';
+import { GAME_WIDTH, SUBSTRATE_TOP, SPRITE_ATLAS } from '../config/GameConfig';
 import { Animal } from './Animal';
 import { HealthBar } from '../ui/HealthBar';
+import { setCanvasScale } from '../systems/FrameScale';
 
 export class Poacher extends Phaser.GameObjects.Sprite {
     private clicksRemaining: number;
@@ -18,7 +19,7 @@ export class Poacher extends Phaser.GameObjects.Sprite {
         const x = Phaser.Math.Between(100, GAME_WIDTH - 100);
         const y = -40;
 
-        super(scene, x, y, 'poacher_hand');
+        super(scene, x, y, SPRITE_ATLAS, 'poacher_hand');
 
         this.maxClicks = poacherConfig.clicksToRepel;
         this.clicksRemaining = poacherConfig.clicksToRepel;
@@ -26,7 +27,7 @@ export class Poacher extends Phaser.GameObjects.Sprite {
 
         scene.add.existing(this);
         this.setDepth(40);
-        this.setScale(0.15); // 512x768 -> ~77x115px in-game
+        setCanvasScale(this, 0.15); // 512x768 -> ~77x115px in-game
         this.setInteractive({ useHandCursor: true });
 
         // Health bar above
@@ -59,14 +60,15 @@ export class Poacher extends Phaser.GameObjects.Sprite {
             return;
         }
 
-        // Move toward target
-        const dist = Phaser.Math.Distance.Between(this.x, this.y, this.target.x, this.target.y);
+        // Move toward the animal's body rather than the middle of its canvas
+        const { x: tx, y: ty } = this.target.hitCenter;
+        const dist = Phaser.Math.Distance.Between(this.x, this.y, tx, ty);
         if (dist < 20) {
             this.grabAnimal();
             return;
         }
 
-        const angle = Phaser.Math.Angle.Between(this.x, this.y, this.target.x, this.target.y);
+        const angle = Phaser.Math.Angle.Between(this.x, this.y, tx, ty);
         this.x += Math.cos(angle) * this.speed * (delta / 1000);
         this.y += Math.sin(angle) * this.speed * (delta / 1000);
     }
@@ -1,4 +1,6 @@
 import Phaser from 'phaser';
+import { SPRITE_ATLAS } from '../config/GameConfig';
+import { canvasScale } from '../systems/FrameScale';
 
 export class ThoughtBubble extends Phaser.GameObjects.Container {
     private bobOffset: number = 0;
@@ -10,8 +12,8 @@ export class ThoughtBubble extends Phaser.GameObjects.Container {
 
         this.baseOffsetY = -(parentHeight / 2 + 24);
 
-        const bubble = scene.add.image(0, 0, 'thought_bubble').setScale(0.06);
-        const icon = scene.add.image(0, 0, 'food_cricket').setScale(0.03);
+        const bubble = scene.add.image(0, 0, SPRITE_ATLAS, 'thought_bubble').setScale(canvasScale('thought_bubble', 0.06));
+        const icon = scene.add.image(0, 0, SPRITE_ATLAS, 'food_cricket').setScale(canvasScale('food_cricket', 0.03));
 
         this.add([bubble, icon]);
         this.setVisible(false);
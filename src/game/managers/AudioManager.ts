@@ -1,12 +1,28 @@
 // src/game/managers/AudioManager.ts
 // Singleton audio manager for Insane Terrarium.
-// All sounds synthesized with Web Audio API - no audio files needed.
+// Sound effects play as slices of one buffer pre-rendered by scripts/render_sfx.py;
+// the recipes below synthesize them live with the Web Audio API if it didn't load.
+
+// Cache keys of the pre-rendered SFX sprite, loaded by PreloadScene
+export const SFX_AUDIO_KEY = 'sfx';
+export const SFX_MAP_KEY = 'sfx-map';
+
+export interface SfxSlice {
+    start: number;    // seconds into the sprite
+    duration: number; // seconds
+}
+
+// Effect name -> interchangeable slices, one picked at random per play
+export type SfxMap = Record<string, SfxSlice[]>;
 
 export class AudioManager {
     private ctx: AudioContext;
     private masterGain: GainNode;
     private muted: boolean;
 
+    private sprite: AudioBuffer | null = null;
+    private spriteMap: SfxMap = {};
+
     private ambientNodes: AudioNode[] = [];
     private ambientTimer: ReturnType<typeof setTimeout> | null = null;
     private ambientRunning: boolean = false;
@@ -32,10 +48,31 @@ export class AudioManager {
         }
     }
 
+    useSprite(buffer: AudioBuffer | undefined, map: SfxMap | undefined): void {
+        if (buffer && map) {
+            this.sprite = buffer;
+            this.spriteMap = map;
+        }
+    }
+
+    // Play one slice of the SFX sprite; false if it isn't available, so the caller synthesizes instead
+    private playSlice(name: string): boolean {
+        const slices = this.spriteMap[name];
+        if (!this.sprite || !slices || slices.length === 0) return false;
+        const slice = slices[Math.floor(Math.random() * slices.length)];
+        const source = this.ctx.createBufferSource();
+        source.buffer = this.sprite;
+        source.connect(this.masterGain);
+        source.start(this.ctx.currentTime, slice.start, slice.duration);
+        source.onended = () => { source.disconnect(); };
+        return true;
+    }
+
     // ---------- SFX Methods ----------
 
     async playCoinCollect(): Promise<void> {
         await this.resume();
+        if (this.playSlice('coin_collect')) return;
         const t = this.ctx.currentTime;
         const freqs = [523.25, 659.25, 783.99]; // C5, E5, G5
         freqs.forEach((freq, i) => {
@@ -45,6 +82,7 @@ export class AudioManager {
 
     async playAnimalDeath(): Promise<void> {
         await this.resume();
+        if (this.playSlice('animal_death')) return;
         const t = this.ctx.currentTime;
         const freqs = [523.25, 440.00, 349.23]; // C5, A4, F4
         freqs.forEach((freq, i) => {
@@ -54,6 +92,7 @@ export class AudioManager {
 
     async playAnimalGrow(): Promise<void> {
         await this.resume();
+        if (this.playSlice('animal_grow')) return;
         const t = this.ctx.currentTime;
         const freqs = [261.63, 329.63, 392.00, 523.25, 659.25]; // C4, E4, G4, C5, E5
         freqs.forEach((freq, i) => {
@@ -71,6 +110,7 @@ export class AudioManager {
 
     async playFoodDrop(): Promise<void> {
         await this.resume();
+        if (this.playSlice('food_drop')) return;
         const t = this.ctx.currentTime;
         const duration = 0.15;
         const sampleRate = this.ctx.sampleRate;
@@ -115,6 +155,7 @@ export class AudioManager {
 
     async playEating(): Promise<void> {
         await this.resume();
+        if (this.playSlice('eating')) return;
         const t = this.ctx.currentTime;
         const duration = 0.1;
         const bufferSize = 4096;
@@ -146,6 +187,7 @@ export class AudioManager {
 
     async playPoacherAlert(): Promise<void> {
         await this.resume();
+        if (this.playSlice('poacher_alert')) return;
         const t = this.ctx.currentTime;
 
         // Pulse 1
@@ -184,6 +226,7 @@ export class AudioManager {
 
     async playPoacherHit(): Promise<void> {
         await this.resume();
+        if (this.playSlice('poacher_hit')) return;
         const t = this.ctx.currentTime;
 
         const osc = this.ctx.createOscillator();
@@ -202,6 +245,7 @@ export class AudioManager {
 
     async playWin(): Promise<void> {
         await this.resume();
+        if (this.playSlice('win')) return;
         const t = this.ctx.currentTime;
         const freqs = [523.25, 659.25, 783.99, 1046.50]; // C5, E5, G5, C6
         freqs.forEach((freq, i) => {
@@ -211,6 +255,7 @@ export class AudioManager {
 
     async playGameOver(): Promise<void> {
         await this.resume();
+        if (this.playSlice('game_over')) return;
         const t = this.ctx.currentTime;
         const freqs = [523.25, 440.00, 349.23, 293.66]; // C5, A4, F4, D4
         freqs.forEach((freq, i) => {
@@ -220,6 +265,7 @@ export class AudioManager {
 
     async playPurchase(): Promise<void> {
         await this.resume();
+        if (this.playSlice('purchase')) return;
         const t = this.ctx.currentTime;
 
         const osc = this.ctx.createOscillator();
@@ -303,8 +349,10 @@ export class AudioManager {
             const scale = [261.63, 329.63, 392.00, 440.00, 523.25]; // C4, E4, G4, A4, C5
 
             const scheduleNextNote = (): void => {
-                const freq = scale[Math.floor(Math.random() * scale.length)];
-                this.playNote(freq, 'sine', this.ctx.currentTime, 1.5, 0.12);
+                if (!this.playSlice('ambient_note')) {
+                    const freq = scale[Math.floor(Math.random() * scale.length)];
+                    this.playNote(freq, 'sine', this.ctx.currentTime, 1.5, 0.12);
+                }
                 const delay = 5000 + Math.random() * 5000;
                 this.ambientTimer = setTimeout(() => scheduleNextNote(), delay);
             };
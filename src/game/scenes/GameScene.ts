@@ -22,8 +22,9 @@ import { HUD } from '../ui/HUD';
 import { ShopBar } from '../ui/ShopBar';
 import { PoacherAI } from '../systems/PoacherAI';
 import { Tutorial } from '../ui/Tutorial';
-import { getBackgroundKey } from '../ui/OptionsPanel';
+import { getSelectedStyle, getThumbnailKey, showBackground } from '../ui/OptionsPanel';
 import { AudioManager } from '../managers/AudioManager';
+import { hitShapesOverlap } from '../systems/HitShapes';
 
 export class GameScene extends Phaser.Scene {
     level: number = 1;
@@ -87,6 +88,11 @@ export class GameScene extends Phaser.Scene {
         }
     };
 
+    // Bodies are tight boxes; only eat when the animal's outline actually touches the food
+    private animalTouchesFood = (_animalObj: Phaser.GameObjects.GameObject, _foodObj: Phaser.GameObjects.GameObject): boolean => {
+        return hitShapesOverlap(_animalObj as Animal, _foodObj as Food);
+    };
+
     private handleBuyAnimal = (key: string): void => {
         const config = ANIMAL_DATA[key];
         if (config) {
@@ -146,8 +152,7 @@ export class GameScene extends Phaser.Scene {
         this.levelManager = new LevelManager(this, this.economy, this.level);
 
         // Background
-        this.add.image(GAME_WIDTH / 2, GAME_HEIGHT / 2, getBackgroundKey())
-            .setDisplaySize(GAME_WIDTH, GAME_HEIGHT);
+        showBackground(this.add.image(GAME_WIDTH / 2, GAME_HEIGHT / 2, getThumbnailKey(getSelectedStyle())));
 
         // Groups
         this.animals = this.add.group({ runChildUpdate: true });
@@ -177,7 +182,7 @@ export class GameScene extends Phaser.Scene {
             this.animals,
             this.foods,
             this.handleAnimalFoodOverlap,
-            undefined,
+            this.animalTouchesFood,
             this,
         );
 
@@ -1,8 +1,10 @@
 import Phaser from 'phaser';
 import { GAME_WIDTH, GAME_HEIGHT } from '../config/GameConfig';
 import { HelperManager } from '../managers/HelperManager';
-import { OptionsPanel, getBackgroundKey, TerrariumStyle } from '../ui/OptionsPanel';
-import { AudioManager } from '../managers/AudioManager';
+import {
+    OptionsPanel, getSelectedStyle, getThumbnailKey, showBackground, TerrariumStyle,
+} from '../ui/OptionsPanel';
+import { AudioManager, SFX_AUDIO_KEY, SFX_MAP_KEY } from '../managers/AudioManager';
 
 export class MenuScene extends Phaser.Scene {
     private bg!: Phaser.GameObjects.Image;
@@ -17,12 +19,13 @@ export class MenuScene extends Phaser.Scene {
         let audioManager = this.game.registry.get('audio') as AudioManager | undefined;
         if (!audioManager && this.sound instanceof Phaser.Sound.WebAudioSoundManager) {
             audioManager = new AudioManager(this.sound.context);
+            audioManager.useSprite(this.cache.audio.get(SFX_AUDIO_KEY), this.cache.json.get(SFX_MAP_KEY));
             this.game.registry.set('audio', audioManager);
         }
         audioManager?.startAmbient();
 
-        this.bg = this.add.image(GAME_WIDTH / 2, GAME_HEIGHT / 2, getBackgroundKey())
-            .setDisplaySize(GAME_WIDTH, GAME_HEIGHT);
+        this.bg = this.add.image(GAME_WIDTH / 2, GAME_HEIGHT / 2, getThumbnailKey(getSelectedStyle()));
+        showBackground(this.bg);
 
         this.add.text(GAME_WIDTH / 2, GAME_HEIGHT / 3, 'Insane Terrarium', {
             fontSize: '48px',
@@ -60,10 +63,7 @@ export class MenuScene extends Phaser.Scene {
             this.optionsPanel = new OptionsPanel(
                 this,
                 () => { this.optionsPanel = null; },
-                (style: TerrariumStyle) => {
-                    this.bg.setTexture(`terrarium_${style}`);
-                    this.bg.setDisplaySize(GAME_WIDTH, GAME_HEIGHT);
-                },
+                (style: TerrariumStyle) => showBackground(this.bg, style),
             );
         });
     }
@@ -1,7 +1,8 @@
 import Phaser from 'phaser';
-import { GAME_WIDTH, GAME_HEIGHT } from '../config/GameConfig';
+import { GAME_WIDTH, GAME_HEIGHT, SPRITE_ATLAS } from '../config/GameConfig';
 import { HelperManager } from '../managers/HelperManager';
 import { HelperPetConfig } from '../config/HelperPetData';
+import { canvasScale } from '../systems/FrameScale';
 
 export class ShopScene extends Phaser.Scene {
     private nextLevel: number = 2;
@@ -55,7 +56,7 @@ export class ShopScene extends Phaser.Scene {
             const y = GAME_HEIGHT / 2 - 20;
 
             // Pet sprite
-            this.add.image(x, y - 60, petConfig.spriteKey).setScale(0.2);
+            this.add.image(x, y - 60, SPRITE_ATLAS, petConfig.spriteKey).setScale(canvasScale(petConfig.spriteKey, 0.2));
 
             // Name
             this.add.text(x, y + 10, petConfig.name, {
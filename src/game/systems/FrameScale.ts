@@ -0,0 +1,25 @@
+import Phaser from 'phaser';
+import { FRAME_SCALES } from '../config/AssetManifest';
+
+// Atlas frames are packed at the largest size the game draws them (scripts/downscale_sprites.py),
+// not at their source canvas size. Scales in game code stay relative to the source canvas
+// (0.04 draws a 512px sprite ~20px wide); these turn them into scales of the packed frame.
+
+type FramedObject = Phaser.GameObjects.Image | Phaser.GameObjects.Sprite;
+
+// Scale that draws `frame` as large as `scale` drew its source canvas
+export function canvasScale(frame: string, scale: number): number {
+    return scale / (FRAME_SCALES[frame] ?? 1);
+}
+
+// setScale with a scale relative to the object's source canvas
+export function setCanvasScale<T extends FramedObject>(obj: T, scale: number): T {
+    return obj.setScale(canvasScale(obj.frame.name, scale)) as T;
+}
+
+// Switch frames without changing how large the object is drawn, even if the two were packed at different sizes
+export function setFrameKeepingSize<T extends FramedObject>(obj: T, frame: string): T {
+    const factor = (FRAME_SCALES[frame] ?? 1) / (FRAME_SCALES[obj.frame.name] ?? 1);
+    obj.setTexture(obj.texture.key, frame);
+    return obj.setScale(obj.scaleX / factor, obj.scaleY / factor) as T;
+}
@@ -0,0 +1,81 @@
+import Phaser from 'phaser';
+
+// Cache key of the hit shapes written by scripts/hit_shapes.py, loaded by PreloadScene
+export const HIT_SHAPES_KEY = 'hit-shapes';
+
+// Collision shape of one atlas frame, in pixels of its untrimmed canvas
+export interface HitShape {
+    box: [number, number, number, number]; // x, y, w, h around the opaque pixels
+    hull?: number[];                        // convex polygon around them as x, y pairs; absent if the box is as tight
+}
+
+export function getHitShape(scene: Phaser.Scene, frame: string): HitShape | undefined {
+    const shapes = scene.cache.json.get(HIT_SHAPES_KEY) as Record<string, HitShape> | undefined;
+    return shapes?.[frame];
+}
+
+// Size the sprite's Arcade body to the opaque part of its current frame, mirrored when flipped.
+// Cheap when nothing changed, so entities call it every update to follow animation frames.
+export function fitBodyToFrame(sprite: Phaser.GameObjects.Sprite): void {
+    const body = sprite.body as Phaser.Physics.Arcade.Body | null;
+    const shape = getHitShape(sprite.scene, sprite.frame.name);
+    if (!body || !shape) return;
+
+    const [x, y, w, h] = shape.box;
+    const offsetX = sprite.flipX ? sprite.width - x - w : x;
+    if (body.sourceWidth !== w || body.sourceHeight !== h) {
+        body.setSize(w, h, false);
+    }
+    if (body.offset.x !== offsetX || body.offset.y !== y) {
+        body.setOffset(offsetX, y);
+    }
+}
+
+// Corners of the sprite's hull (or box) in world space
+function worldPolygon(sprite: Phaser.GameObjects.Sprite, shape: HitShape): number[] {
+    const [bx, by, bw, bh] = shape.box;
+    const local = shape.hull ?? [bx, by, bx + bw, by, bx + bw, by + bh, bx, by + bh];
+    const cos = Math.cos(sprite.rotation);
+    const sin = Math.sin(sprite.rotation);
+    const points: number[] = [];
+    for (let i = 0; i < local.length; i += 2) {
+        const px = sprite.flipX ? sprite.width - local[i] : local[i];
+        const lx = (px - sprite.displayOriginX) * sprite.scaleX;
+        const ly = (local[i + 1] - sprite.displayOriginY) * sprite.scaleY;
+        points.push(sprite.x + lx * cos - ly * sin, sprite.y + lx * sin + ly * cos);
+    }
+    return points;
+}
+
+// Whether some edge normal of a separates the two polygons (separating axis theorem)
+function separated(a: number[], b: number[]): boolean {
+    for (let i = 0; i < a.length; i += 2) {
+        const j = (i + 2) % a.length;
+        const nx = a[j + 1] - a[i + 1];
+        const ny = a[i] - a[j];
+        let minA = Infinity, maxA = -Infinity, minB = Infinity, maxB = -Infinity;
+        for (let k = 0; k < a.length; k += 2) {
+            const d = a[k] * nx + a[k + 1] * ny;
+            minA = Math.min(minA, d);
+            maxA = Math.max(maxA, d);
+        }
+        for (let k = 0; k < b.length; k += 2) {
+            const d = b[k] * nx + b[k + 1] * ny;
+            minB = Math.min(minB, d);
+            maxB = Math.max(maxB, d);
+        }
+        if (maxA < minB || maxB < minA) return true;
+    }
+    return false;
+}
+
+// Exact test for two sprites whose bodies already overlap: their hulls must too.
+// Use as an Arcade overlap processCallback; frames without a hull count as their box.
+export function hitShapesOverlap(a: Phaser.GameObjects.Sprite, b: Phaser.GameObjects.Sprite): boolean {
+    const shapeA = getHitShape(a.scene, a.frame.name);
+    const shapeB = getHitShape(b.scene, b.frame.name);
+    if (!shapeA || !shapeB || (!shapeA.hull && !shapeB.hull)) return true;
+    const polyA = worldPolygon(a, shapeA);
+    const polyB = worldPolygon(b, shapeB);
+    return !separated(polyA, polyB) && !separated(polyB, polyA);
+}
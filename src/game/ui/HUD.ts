@@ -1,7 +1,8 @@
 import Phaser from 'phaser';
-import { GAME_WIDTH } from '../config/GameConfig';
+import { GAME_WIDTH, SPRITE_ATLAS } from '../config/GameConfig';
 import { EconomyManager } from '../managers/EconomyManager';
 import { OptionsPanel, TerrariumStyle } from './OptionsPanel';
+import { canvasScale, setFrameKeepingSize } from '../systems/FrameScale';
 
 export class HUD {
     private scene: Phaser.Scene;
@@ -26,7 +27,7 @@ export class HUD {
     }
 
     private createCoinCounter(): void {
-        this.scene.add.image(30, 20, 'coin').setDepth(100).setScale(0.05);
+        this.scene.add.image(30, 20, SPRITE_ATLAS, 'coin').setDepth(100).setScale(canvasScale('coin', 0.05));
         this.coinText = this.scene.add.text(48, 12, `${this.economy.coins}`, {
             fontSize: '22px',
             color: '#fbbf24',
@@ -39,11 +40,9 @@ export class HUD {
     private createEggProgress(): void {
         const startX = GAME_WIDTH - 100;
         for (let i = 0; i < 3; i++) {
-            const slot = this.scene.add.image(
-                startX + i * 30,
-                20,
-                this.economy.eggPiecesBought[i] ? 'egg_piece' : 'egg_piece_empty'
-            ).setDepth(100).setScale(0.05);
+            const frame = this.economy.eggPiecesBought[i] ? 'egg_piece' : 'egg_piece_empty';
+            const slot = this.scene.add.image(startX + i * 30, 20, SPRITE_ATLAS, frame)
+                .setDepth(100).setScale(canvasScale(frame, 0.05));
             this.eggSlots.push(slot);
         }
     }
@@ -63,12 +62,12 @@ export class HUD {
 
     private updateEggSlot(index: number): void {
         if (this.eggSlots[index]) {
-            this.eggSlots[index].setTexture('egg_piece');
+            setFrameKeepingSize(this.eggSlots[index], 'egg_piece');
             // Pulse animation
             this.scene.tweens.add({
                 targets: this.eggSlots[index],
-                scaleX: 0.07,
-                scaleY: 0.07,
+                scaleX: canvasScale('egg_piece', 0.07),
+                scaleY: canvasScale('egg_piece', 0.07),
                 yoyo: true,
                 duration: 200,
             });
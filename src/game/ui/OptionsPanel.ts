@@ -1,6 +1,7 @@
 import Phaser from 'phaser';
-import { GAME_WIDTH, GAME_HEIGHT } from '../config/GameConfig';
+import { GAME_WIDTH, GAME_HEIGHT, pickImageUrl } from '../config/GameConfig';
 import { AudioManager } from '../managers/AudioManager';
+import { BACKGROUND_MANIFEST } from '../config/AssetManifest';
 
 export const TERRARIUM_STYLES = ['tropical', 'desert', 'rainforest'] as const;
 export type TerrariumStyle = typeof TERRARIUM_STYLES[number];
@@ -23,6 +24,36 @@ export function getBackgroundKey(style?: TerrariumStyle): string {
     return `terrarium_${style ?? getSelectedStyle()}`;
 }
 
+export function getThumbnailKey(style: TerrariumStyle): string {
+    return `terrarium_${style}_thumb`;
+}
+
+export function getBackgroundUrl(game: Phaser.Game, style: TerrariumStyle): string {
+    const variants = BACKGROUND_MANIFEST[style];
+    return pickImageUrl(game, window.devicePixelRatio > 1 ? variants.hidpi : variants.full);
+}
+
+/** Show a style's background on image, loading it on demand behind a stretched thumbnail. */
+export function showBackground(image: Phaser.GameObjects.Image, style: TerrariumStyle = getSelectedStyle()): void {
+    const scene = image.scene;
+    const key = getBackgroundKey(style);
+    if (scene.textures.exists(key)) {
+        image.setTexture(key).setDisplaySize(GAME_WIDTH, GAME_HEIGHT);
+        return;
+    }
+
+    const thumbKey = getThumbnailKey(style);
+    image.setTexture(thumbKey).setDisplaySize(GAME_WIDTH, GAME_HEIGHT);
+    scene.load.once(`filecomplete-image-${key}`, () => {
+        // Skip if the image was destroyed or switched to another style meanwhile
+        if (image.active && image.texture.key === thumbKey) {
+            image.setTexture(key).setDisplaySize(GAME_WIDTH, GAME_HEIGHT);
+        }
+    });
+    scene.load.image(key, getBackgroundUrl(scene.game, style));
+    scene.load.start();
+}
+
 export class OptionsPanel extends Phaser.GameObjects.Container {
     private onClose: () => void;
     private onStyleChanged: (style: TerrariumStyle) => void;
@@ -92,7 +123,7 @@ export class OptionsPanel extends Phaser.GameObjects.Container {
             const x = startX + i * (thumbW + spacing);
 
             // Thumbnail image
-            const thumb = this.scene.add.image(x, thumbY, `terrarium_${style}`)
+            const thumb = this.scene.add.image(x, thumbY, getThumbnailKey(style))
                 .setDisplaySize(thumbW, thumbH)
                 .setInteractive({ useHandCursor: true });
             this.add(thumb);
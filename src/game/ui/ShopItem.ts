@@ -1,4 +1,6 @@
 import Phaser from 'phaser';
+import { SPRITE_ATLAS } from '../config/GameConfig';
+import { canvasScale } from '../systems/FrameScale';
 
 export interface ShopItemConfig {
     spriteKey: string;
@@ -22,10 +24,10 @@ export class ShopItem extends Phaser.GameObjects.Container {
         this.price = config.price;
 
         // Button background
-        this.bg = scene.add.image(0, 0, 'shop_button').setScale(0.13);
+        this.bg = scene.add.image(0, 0, SPRITE_ATLAS, 'shop_button').setScale(canvasScale('shop_button', 0.13));
 
         // Item sprite
-        const sprite = scene.add.image(0, -8, config.spriteKey).setScale(0.07);
+        const sprite = scene.add.image(0, -8, SPRITE_ATLAS, config.spriteKey).setScale(canvasScale(config.spriteKey, 0.07));
 
         // Price text
         this.priceText = scene.add.text(0, 24, `${config.price}`, {
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The asset scripts import each other as top-level modules, the way they run from scripts/
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
@@ -0,0 +1,44 @@
+import os
+
+from PIL import Image
+
+from build_assets import AssetGraph, STATE_VERSION
+
+
+def spec(path, *inputs):
+    return {"path": str(path), "prompt": os.path.basename(path), "w": 8, "h": 8,
+            "input_images": [str(p) for p in inputs]}
+
+
+def built(graph, paths):
+    """State in which every asset in paths is up to date on disk."""
+    for path in paths:
+        Image.new("RGBA", (8, 8)).save(path)
+    return {"version": STATE_VERSION, "assets": {p: graph.record(p, []) for p in graph.specs}}
+
+
+def test_forced_parent_replans_children(tmp_path):
+    parent, child, grandchild, other = (os.path.normpath(tmp_path / f"{n}.png")
+                                        for n in ("parent", "child", "grandchild", "other"))
+    graph = AssetGraph([spec(parent), spec(child, parent), spec(grandchild, child), spec(other)])
+    state = built(graph, [parent, child, grandchild, other])
+
+    assert graph.plan(state, [], {parent}) == {}
+    assert graph.plan(state, [], {parent}, force=True) == {
+        parent: "forced",
+        child: "parent.png is being rebuilt",
+        grandchild: "child.png is being rebuilt",
+    }
+
+
+def test_stale_dependency_of_target_replans_its_other_children(tmp_path):
+    base, frame, sibling = (os.path.normpath(tmp_path / f"{n}.png") for n in ("base", "frame", "sibling"))
+    graph = AssetGraph([spec(base), spec(frame, base), spec(sibling, base)])
+    state = built(graph, [base, frame, sibling])
+    os.remove(base)
+
+    assert graph.plan(state, [], {frame}) == {
+        base: "output missing",
+        frame: "base.png is being rebuilt",
+        sibling: "base.png is being rebuilt",
+    }
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from png_bands import PNGBandReader
+from remove_backgrounds import fill_png_banded, flood_fill_numpy
+
+
+def sprite() -> Image.Image:
+    """A shaded ring on a near-black background, with a black hole the fill must not reach."""
+    y, x = np.mgrid[:48, :40]
+    r = np.hypot(x - 20, y - 24)
+    arr = np.zeros((48, 40, 4), dtype=np.uint8)
+    arr[..., 3] = 255
+    arr[..., :3] = np.where((x + y) % 5 == 0, 12, 0)[..., None]
+    ring = (r > 8) & (r < 14)
+    arr[ring, 0] = 200
+    arr[ring, 1] = 60 + 4 * x[ring]
+    arr[ring, 2] = 40
+    arr[ring & (y < 24) & (r > 11), 3] = 128
+    return Image.fromarray(arr, "RGBA")
+
+
+def encode(mode: str) -> tuple[Image.Image, dict]:
+    img = sprite()
+    if mode == "P":
+        return img.convert("RGB").quantize(64), {}
+    if mode == "P;4":
+        return img.convert("RGB").quantize(16), {"bits": 4}
+    if mode == "PA":
+        return img.quantize(64), {}  # palette plus a tRNS chunk
+    return img.convert(mode), {}
+
+
+@pytest.mark.parametrize("mode, color_type, bit_depth", [
+    ("RGBA", 6, 8),
+    ("RGB", 2, 8),
+    ("LA", 4, 8),
+    ("L", 0, 8),
+    ("P", 3, 8),
+    ("P;4", 3, 4),
+    ("PA", 3, 8),
+])
+def test_streamed_fill_matches_in_memory_fill(tmp_path, mode, color_type, bit_depth):
+    path = str(tmp_path / "sprite.png")
+    img, save_options = encode(mode)
+    img.save(path, **save_options)
+    reader = PNGBandReader(path)
+    assert (reader.color_type, reader.bit_depth) == (color_type, bit_depth)
+    with Image.open(path) as saved:
+        expected = np.array(flood_fill_numpy(saved))
+
+    # A tiny memory cap splits the image into many bands
+    assert fill_png_banded(path, max_memory_mb=0.05)
+    with Image.open(path) as result:
+        assert result.mode == "RGBA"
+        np.testing.assert_array_equal(np.array(result), expected)
@@ -1,5 +1,29 @@
+import { readdirSync, rmSync } from 'node:fs';
+import { join, resolve } from 'node:path';
 import { defineConfig } from 'vite';
 
+// public/assets also holds the source art and build state the asset scripts read; the game only
+// loads what scripts/fingerprint_assets.py publishes to assets/hashed/, so leave the rest out of dist
+const publishedAssetsOnly = () => {
+    let publicAssets;
+    let distAssets;
+    return {
+        name: 'published-assets-only',
+        apply: 'build',
+        configResolved(config) {
+            publicAssets = join(config.publicDir, 'assets');
+            distAssets = join(resolve(config.root, config.build.outDir), 'assets');
+        },
+        closeBundle() {
+            for (const entry of readdirSync(publicAssets)) {
+                if (entry !== 'hashed') {
+                    rmSync(join(distAssets, entry), { recursive: true, force: true });
+                }
+            }
+        },
+    };
+};
+
 export default defineConfig({
     build: {
         outDir: '../dist',
@@ -11,6 +35,7 @@ export default defineConfig({
             },
         },
     },
+    plugins: [publishedAssetsOnly()],
     resolve: {
         alias: {
             '@': '/src',